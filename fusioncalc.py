@@ -1,28 +1,118 @@
-# BUILD_HASH: b80503f79561
+# BUILD_HASH: c0ddceb391f4
 
 
+import time
+_T_START = time.perf_counter(); _CPU_START = time.process_time()  # process start, for startup timing
+import sys
+# --profile-startup [--profile-dump FILE]: time each startup phase, print a ranked summary and exit
+STARTUP_PROFILE = '--profile-startup' in sys.argv
+_PROFILER = None
+if STARTUP_PROFILE and '--profile-dump' in sys.argv:
+    import cProfile
+    _PROFILER = cProfile.Profile(); _PROFILER.enable()
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import csv
 import logging
-import sys
 import webbrowser
-import time
 import re
 from typing import Dict, Any, Optional
+from array import array
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections import deque, OrderedDict
+import threading
+from bisect import bisect_left, bisect_right
+import operator
+import itertools
+import heapq
+import difflib
+from functools import lru_cache
+from types import MappingProxyType
 from tkinter import font as tkfont
-def log_calc(message: str):
- try:
-  if 'logs_master_var' in globals() and 'calc_logs_var' in globals() and logs_master_var.get() and calc_logs_var.get():
-   lvl = logging.DEBUG if ('verbose_logs_var' in globals() and verbose_logs_var.get()) else logging.INFO
-   logging.log(lvl, message)
- except Exception:
-  pass
-
-def dump_ui_layout_metrics(root_widget=None):
+
+_STARTUP_PHASES: list = []  # (phase, wall ms, CPU ms) in startup order
+_PHASE_MARK = [_T_START, _CPU_START]
+
+def startup_phase(name: str):
+    """Close the current startup phase (everything since the previous mark) under `name`."""
+    now, cpu = time.perf_counter(), time.process_time()
+    _STARTUP_PHASES.append((name, (now - _PHASE_MARK[0]) * 1000.0, (cpu - _PHASE_MARK[1]) * 1000.0))
+    _PHASE_MARK[:] = [now, cpu]
+
+startup_phase('imports')
+# Tracing: typed events (kind + raw fields) recorded into a ring buffer and, when calculation logs are on, written
+# to logging. Text is only built when an event is actually logged. Call sites guard with `if TRACE.enabled:` so a
+# disabled tracer costs one attribute check: no widget reads, timing or scope strings are built for it.
+# The View menu logging toggles drive it through sync_tracer().
+def _on_off(v) -> str:
+    return 'ON' if v else 'OFF'
+
+TRACE_FORMATS = {  # kind -> (normal, verbose) formatter; None (or a None result) means not logged at that level
+    'fusion.computed': (lambda f: f"[Calc] {f['p1']}+{f['p2']} -> {f['type']} bst={format_tenths(f['bst'])} dt={f['ms']:.1f}ms",) * 2,
+    'cache.store': (lambda f: f"[Cache] stored (p1={f['p1']}, p2={f['p2']}, type={f['type']})",
+                    lambda f: f"[Cache] stored (p1={f['p1']}, p2={f['p2']}, type={f['type']}, active={f['active'] or '-'}, passive={_on_off(f['passive'])}, flip={_on_off(f['flip'])}, inv={_on_off(f['inv'])})"),
+    'cache.hit': (lambda f: f"[Cache] render_from_cache (p1={f['p1']}, p2={f['p2']}, type={f['type']})",
+                  lambda f: f"[Cache] render_from_cache (p1={f['p1']}, p2={f['p2']}, type={f['type']}, active={f['active'] or '-'}, passive={_on_off(f['passive'])}, flip={_on_off(f['flip'])}, inv={_on_off(f['inv'])})"),
+    'cache.refresh': (lambda f: f"[Cache] refresh_via_{f['via']}",
+                      lambda f: f"[Cache] refresh_via_{f['via']} (flip={_on_off(f['flip'])}, inv={_on_off(f['inv'])})"),
+    'render.done': (lambda f: f"[Render] {f['pane']} pane: {f['written']}/{f['sections']} sections written" if f['debug'] else None,
+                    lambda f: f"[Render] {f['pane']} pane: {f['written']}/{f['sections']} sections written"),
+    'filter.executed': (None, lambda f: f"[Filter] {f['query']!r} -> {f['matches']} species in {f['ms']:.1f}ms"),
+    'analysis.done': (lambda f: f"[{f['tool']}] {f['scope']}: {f['rows']} rows in {f['ms']:.1f}ms",) * 2,
+    'roster.loaded': (lambda f: f"[Roster] loaded {f['species']} species from {f['path']} ({f['corrected']} corrected, {f['unknown']} unknown)",) * 2,
+    'compare.pinned': (lambda f: f"[Compare] pinned {f['p1']}+{f['p2']} ({f['pinned']} pinned)",) * 2,
+}
+TRACE_CAPACITY = 5000
+
+class Tracer:
+    """Ring buffer of (seq, ms since start, kind, fields) plus optional logging. sample_rate keeps that share of
+    each kind's events, deterministically (1.0 = all)."""
+    def __init__(self, capacity: int = TRACE_CAPACITY):
+        self.enabled = False; self.log_enabled = False; self.verbose = False; self.sample_rate = 1.0
+        self.buffer: deque = deque(maxlen=capacity); self.seq = 0; self._seen: Dict[str, int] = {}
+
+    def emit(self, kind: str, **fields):
+        if not self.enabled:
+            return
+        n = self._seen.get(kind, 0) + 1; self._seen[kind] = n
+        if self.sample_rate < 1.0 and int(n * self.sample_rate) == int((n - 1) * self.sample_rate):
+            return
+        self.seq += 1
+        self.buffer.append((self.seq, (time.perf_counter() - _T_START) * 1000.0, kind, fields))
+        if self.log_enabled:
+            fmt = TRACE_FORMATS.get(kind, (None, None))[1 if self.verbose else 0]
+            msg = fmt(fields) if fmt else None
+            if msg: logging.log(logging.DEBUG if self.verbose else logging.INFO, msg)
+
+    def events(self, kind: Optional[str] = None) -> list:
+        return [e for e in self.buffer if kind is None or e[2] == kind]
+
+    def export_jsonl(self, path: str) -> int:
+        with open(path, 'w', encoding='utf-8') as f:
+            for seq, t_ms, kind, fields in self.buffer:
+                f.write(json.dumps(dict(fields, seq=seq, t_ms=round(t_ms, 3), kind=kind), ensure_ascii=False, default=str) + '\n')
+        return len(self.buffer)
+
+    def clear(self):
+        self.buffer.clear(); self._seen.clear()
+
+TRACE = Tracer()
+
+def sync_tracer():
+    """Read the View menu logging toggles into TRACE (Master records, Calculation Logs logs, Verbose picks the level)."""
+    try:
+        TRACE.enabled = bool(logs_master_var.get())
+        TRACE.log_enabled = TRACE.enabled and bool(calc_logs_var.get())
+        TRACE.verbose = bool(verbose_logs_var.get())
+    except (NameError, tk.TclError):
+        TRACE.enabled = TRACE.log_enabled = False
+
+def dump_ui_layout_metrics(root_widget):
     try:
-        if root_widget is None and 'root' in globals():
-            root_widget = root
         if not root_widget:
             return
         widgets = []
@@ -69,6 +159,23 @@ def dump_widget_font_tag_logs():
         except Exception:
             pass
 
+def dump_cache_stats():
+    try:
+        lvl = logging.DEBUG if ('verbose_logs_var' in globals() and verbose_logs_var.get()) else logging.INFO
+        st = effectiveness_cache_stats()
+        logging.log(lvl, f"[CacheStats] effectiveness hits={st['hits']} misses={st['misses']} hit_rate={st['hit_rate']:.1%} size={st['size']}/{st['maxsize']}")
+        st = _FUSION_RESULTS.stats()
+        logging.log(lvl, f"[CacheStats] fusion_results hits={st['hits']} misses={st['misses']} hit_rate={st['hit_rate']:.1%} size={st['size']}/{st['maxsize']} pinned={len(_DATA_CACHE.get('pinned_fusions', {}))}")
+        logging.log(lvl, f"[CacheStats] ability_contexts={len(_ABILITY_CONTEXTS)} fused_defense={len(_FUSED_DEFENSE_CACHE)} defense_masks={len(_DEFENSE_MASKS)} typing_table={len(_FUSED_TYPING_TABLE)}x{N_ORDERED_TYPINGS} threat={len(_THREAT_CACHE)} data_cache={sorted(_DATA_CACHE)}")
+    except Exception as e:
+        logging.error(f"[CacheStats] error: {e}")
+    finally:
+        try:
+            if 'cache_stats_logs_var' in globals():
+                cache_stats_logs_var.set(False)
+        except Exception:
+            pass
+
 def _apply_verbose_level():
     lvl = logging.DEBUG if ('verbose_logs_var' in globals() and verbose_logs_var.get()) else logging.INFO
     try:
@@ -85,21 +192,21 @@ def on_toggle_master_logs():
             except Exception:
                 pass
         if not master_on:
-            for v in ('verbose_logs_var','calc_logs_var','ui_layout_logs_var','widget_font_tag_logs_var'):
+            for v in ('verbose_logs_var','calc_logs_var','ui_layout_logs_var','widget_font_tag_logs_var','cache_stats_logs_var'):
                 try:
                     globals()[v].set(False)
                 except Exception:
                     pass
-            for lbl in ('Verbose Logs','Show Calculation Logs','Show UI Layout Logs','Show Widget Font/Tag Logs'):
+            for lbl in ('Verbose Logs','Show Calculation Logs','Show UI Layout Logs','Show Widget Font/Tag Logs','Show Cache Stats'):
                 set_state(lbl, tk.DISABLED)
             if 'status_text' in globals():
                 status_text.set('Logging (Master) OFF — all logging toggles disabled')
         else:
-            for lbl in ('Verbose Logs','Show Calculation Logs','Show UI Layout Logs','Show Widget Font/Tag Logs'):
+            for lbl in ('Verbose Logs','Show Calculation Logs','Show UI Layout Logs','Show Widget Font/Tag Logs','Show Cache Stats'):
                 set_state(lbl, tk.NORMAL)
             if 'status_text' in globals():
                 status_text.set('Logging (Master) ON')
-        _apply_verbose_level()
+        _apply_verbose_level(); sync_tracer()
     except Exception:
         pass
 
@@ -108,7 +215,7 @@ def on_toggle_master_logs():
 def on_toggle_verbose_logs():
     try:
         global VERBOSE_BOLD_LOGS
-        VERBOSE_BOLD_LOGS = bool('verbose_logs_var' in globals() and verbose_logs_var.get())
+        VERBOSE_BOLD_LOGS = bool('verbose_logs_var' in globals() and verbose_logs_var.get()); sync_tracer()
         try:
             logging.getLogger().setLevel(logging.DEBUG if VERBOSE_BOLD_LOGS else logging.INFO)
         except Exception:
@@ -123,7 +230,7 @@ def on_toggle_verbose_logs():
 
 VERBOSE_BOLD_LOGS = False  # runtime-controlled via View → Verbose Logs
 AUTO_RECALC_ON_SELECT = False
-BUILD_TAG = "b80503f79561"
+BUILD_TAG = "c0ddceb391f4"
 HAS_FUSION = False
 
 _FUSION_CACHE = {}
@@ -171,7 +278,7 @@ DEFAULTS = {
     'display': {
         'p1': { 'type': True, 'abilities': True, 'hidden_ability': True, 'passive': True, 'bst': True, 'evolution': True, 'damage': True },
         'p2': { 'type': True, 'abilities': True, 'hidden_ability': True, 'passive': True, 'bst': True, 'evolution': True, 'damage': True },
-        'fusion': { 'fused_type': True, 'bst': True, 'diffs': True, 'abilities': True, 'ability_effects': True, 'damage': True, 'quick_compare': True },
+        'fusion': { 'fused_type': True, 'bst': True, 'diffs': True, 'abilities': True, 'ability_effects': True, 'damage': True, 'quick_compare': True, 'offense': True, 'percentiles': True },
     },
 }
 
@@ -195,6 +302,7 @@ def apply_defaults():
                     display_vars[panel][key].set(bool(val))
                 except Exception:
                     pass
+        sync_tracer()
     except Exception as e:
         try: logging.debug(f"[Defaults] apply failed: {e}")
         except Exception: pass
@@ -214,6 +322,9 @@ STR = {
     'damage_taken': 'Damage Taken',
     'ability_effect_summary': 'Ability Effect Summary',
     'quick_compare': 'Quick Compare',
+    'percentiles': 'Stat Percentiles',
+    'percentiles_label': 'Percentile among fusions with {} / with {}:',
+    'percentiles_note': 'Fused {} of every fusion that keeps {} (the partner varies). The marked bar holds the current fusion.',
     'compare_vs': 'Compare vs:',
     'close': 'Close',
     'select_all': 'Select All',
@@ -240,19 +351,82 @@ STR = {
     'new_res': ' Gained resistances (≤½×): ',
     'lost_res':' Lost resistances (≤½×): ',
     'no_changes': ' No changes in immunities/weaknesses/resistances vs baseline.',
+    'offense_coverage': 'Offensive Coverage (STAB)',
+    'off_se_types': ' Super-effective vs: ',
+    'off_typings': ' Typings hit ≥2×: {}/{} · resisted: {} · immune: {}',
+    'off_walls': ' Walled by: ',
+    'stab_ranking': 'STAB Coverage Ranking',
+    'matchups': 'Fusion Matchups',
+    'matchups_note': 'Damage the current fusion takes from each opponent\'s stronger STAB (abilities, Passive and Inverse applied). Click a column to sort.',
+    'fuse_first': 'Fuse two Pokémon first.',
+    'pareto': 'Pareto Frontier',
+    'pareto_note': '{} fusions not beaten on all six stats by another fusion ({:.0f} ms). Double-click to fuse.',
+    'only_current_p1': 'Only fusions with the current Pokémon 1',
+    'select_p1_first': 'Select a Pokémon 1 first.',
+    'compute': 'Compute',
+    'fused_search': 'Fused Stat Search',
+    'fused_search_note': 'Constraints on the fused result, e.g. fused.speed>=100 fused.hp>=90 fused.bst>550. P1/P2 filters use the normal search syntax.',
+    'fused_filter_needs_partner': 'fused.* filters apply once the other Pokémon slot is selected.',
+    'fused_filter_bad': 'Unrecognized fused filter: {}',
+    'p1_filter': 'Pokémon 1 filter:',
+    'p2_filter': 'Pokémon 2 filter:',
+    'fused_constraints': 'Fused constraints:',
+    'search': 'Search',
+    'fusion_table': 'Fusion Table',
+    'fusion_table_warming': 'The fusion table is still being opened in the background (it is rebuilt when the data changed). Try again in a moment.',
+    'similar_spreads': 'Similar Stat Spreads',
+    'similar_note': 'The {} fusions whose fused spread is closest to {} (Euclidean{}; {:.0f} ms). Double-click to fuse.',
+    'target_spread': 'Target spread (HP Atk Def SpA SpD Spe):',
+    'bad_spread': 'Enter six numbers, e.g. 80 100 70 110 70 120.',
+    'normalize_stats': 'Normalize stats (σ units)',
+    'results_count': 'Results:',
+    'family_grid': 'Family Grid',
+    'family_grid_note': '{} × {} fusions of every evolution stage ({:.0f} ms). Cells are shaded by fused BST; click one to fuse.',
+    'select_both_first': 'Select Pokémon 1 and Pokémon 2 first.',
+    'partner_impact': 'Partner Impact',
+    'partner_impact_note': 'Every Pokémon 2 for P1 = {} (active = its first ability; Passive/Inverse as toggled). Buckets follow Quick Compare. Double-click to fuse.',
+    'gains_immunity': 'Gains immunity to:',
+    'drops_weakness': 'Drops weakness to:',
+    'no_new_weak4': 'No new 4× weaknesses (vs the compared Pokémon)',
+    'roster_planner': 'Roster Planner',
+    'roster_note': 'Every fusion within your roster (active = P2\'s first ability; Passive/Inverse as toggled). Double-click to fuse.',
+    'roster_status': '{} species · {} fusions · {:.0f} ms',
+    'load_roster': 'Load Roster…',
+    'roster_loaded': 'Loaded {} species from {}.',
+    'roster_corrected': 'Corrected: {}',
+    'roster_unknown': 'Not found: {}',
+    'add': 'Add',
+    'remove': 'Remove',
+    'compare_pinned': 'Compare Pinned Fusions',
+    'compare_note': 'Pinned fusions side by side; deltas are vs the first column. Click a heading to load that fusion.',
+    'pin_current': 'Pin Current Fusion',
+    'unpin_last': 'Unpin Last',
+    'clear_pins': 'Clear',
+    'export_csv': 'Export CSV…',
+    'export_trace': 'Export Trace (JSONL)…',
+    'trace_empty': 'No trace events recorded yet (Logging (Master) must be ON).',
+    'nothing_to_export_rows': 'No rows to export.',
     'ready': 'Ready.',
+    'loading_data': 'Loading Pokémon data…',
     'pokemon_not_found': 'Pokémon not found.',
 }
 # Data loading
+DATA_CSV_PATH = 'pokemon_data.csv'
+DATA_VERSION_PATH = 'data_version.txt'
+FUSION_TABLE_PATH = 'fusion_table.bin'
+SESSION_PATH = 'fusioncalc_session.json'
+SESSION_FORMAT = 1
+SESSION_ENABLED = '--no-session' not in sys.argv  # --no-session: start clean and don't save on exit
 pokemon_stats: Dict[str, Dict[str, Any]] = {}
+_DATA_CACHE: Dict[str, Any] = {}  # lookups derived from pokemon_stats; cleared on every (re)load
 
 def load_pokemon_data_into(pstore: Dict[str, Dict[str, Any]]) -> int:
     logging.info("Loading Pokemon data from CSV file")
-    pstore.clear()
+    pstore.clear(); _DATA_CACHE.clear(); _FUSION_RESULTS.clear()
     count = 0
     issues = []
     try:
-        with open('pokemon_data.csv', 'r', encoding='utf-8') as file:
+        with open(DATA_CSV_PATH, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
             for row in reader:
                 raw_name = (row.get('name') or '').strip()
@@ -312,6 +486,18 @@ def load_pokemon_data_into(pstore: Dict[str, Dict[str, Any]]) -> int:
             pass
         sys.exit(1)
 
+def log_dataset_summary():
+    """Lint evolution lines against the loaded species and log the family / equivalence-class summary. Builds
+    evolution_families() and species_classes(), so the app runs it as a warm-up step after first paint."""
+    fam = evolution_families()
+    issues = [f"{listed_by[0]}: evolution line names unknown species '{missing_name}'" + (f" (+{len(listed_by) - 1} more)" if len(listed_by) > 1 else '')
+              for missing_name, listed_by in fam['missing'].items()]
+    for msg in issues[:5]:
+        logging.info(f"[CSV Lint] {msg}")
+    logging.info(f"[Families] {len(fam['stages'])} evolution families, {len(fam['missing'])} unknown names")
+    cls = species_classes()
+    logging.info(f"[Classes] {len(cls['p1']['members'])} P1 / {len(cls['p2']['members'])} P2 equivalence classes, pair space ÷{cls['reduction']:.2f}")
+
 # Quick launchers
 open_pokemondb = lambda: webbrowser.open("https://pokemondb.net/")
 open_type_calculator = lambda: webbrowser.open("https://www.pkmn.help/defense/")
@@ -323,7 +509,7 @@ def get_fusion_summary_text() -> str:
     except Exception:
         return ''
 
-def copy_fusion_summary():
+def copy_fusion_summary(root):
     try:
         txt = get_fusion_summary_text()
         if not txt.strip():
@@ -353,7 +539,16 @@ def export_fusion_summary():
     except Exception as e:
         logging.error('[Export] save failed: %s' % e, exc_info=True)
 # Utility helpers
-def avg_round_tenth(a: float, b: float) -> float: return round((float(a) + float(b)) / 2.0, 1)
+# Fused stats are fixed-point tenths: the mean of two integer stats is (a + b) / 2 = (a + b) * 5 tenths, exactly.
+def avg_tenths(a: int, b: int) -> int: return (int(a) + int(b)) * 5
+
+def format_tenths(t: int) -> str:
+    q, r = divmod(abs(int(t)), 10)
+    return ('-' if t < 0 else '') + (f"{q}.{r}" if r else str(q))
+
+def ordinal(n: int) -> str:
+    n = int(n)
+    return f"{n}{'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')}"
 
 def format_number_trim(x) -> str:
     try: fx = float(x)
@@ -464,6 +659,7 @@ ABILITY_EFFECTS = {
     'THICK FAT': {'halve': ['Fire', 'Ice']},
     'HEATPROOF': {'halve': ['Fire']},
     'WATER BUBBLE': {'halve': ['Fire']},
+    'WONDER GUARD': {'threshold': 2.0},  # everything below the threshold becomes 0×
 }
 
 # \ Display options (stateless)/
@@ -472,7 +668,7 @@ def init_display_vars():
     vars = {
         'p1': {k: tk.BooleanVar(value=True) for k in ['type','abilities','hidden_ability','passive','bst','evolution','damage']},
         'p2': {k: tk.BooleanVar(value=True) for k in ['type','abilities','hidden_ability','passive','bst','evolution','damage']},
-        'fusion': {k: tk.BooleanVar(value=True) for k in ['fused_type','bst','diffs','abilities','ability_effects','damage','quick_compare']},
+        'fusion': {k: tk.BooleanVar(value=True) for k in ['fused_type','bst','diffs','percentiles','abilities','ability_effects','damage','quick_compare','offense']},
     }
     return vars
 
@@ -491,11 +687,11 @@ def is_section_enabled(panel: str, key: str) -> bool:
     except Exception:
         return True
 # Panels & writers
-def write_stat_block(text: tk.Text, items):
+def write_stat_block(text: tk.Text, items, fmt=format_number_trim):
     _assert_and_raise_core_tags(text)
     _apply_stat_tabs(text, items)
     for label, value in items:
-        val = format_number_trim(value)
+        val = fmt(value)
         text.insert(tk.END, f"{label}:", 'stat_label'); text.insert(tk.END, "\t"); text.insert(tk.END, f"{val}\n", ('stat_value', 'stat_tabs'))
     _assert_and_raise_core_tags(text)
 
@@ -504,6 +700,18 @@ def insert_hr(text: tk.Text, width_chars: int = 24):
     text.insert(tk.END, '-' * width_chars + "\n", 'hr')
     _assert_and_raise_core_tags(text)
 
+def write_offense_section(text: tk.Text, fused_type1: str, fused_type2: str):
+    try: inv_on = bool(inverse_battle_var.get())
+    except Exception: inv_on = False
+    cov = summarize_stab_coverage(fused_type1, fused_type2, inv_on)
+    text.insert(tk.END, STR['offense_coverage'] + ': ', 'strong_label'); text.insert(tk.END, "\n")
+    text.insert(tk.END, STR['off_se_types'] + (', '.join(cov['se_types']) or '—') + f" ({len(cov['se_types'])}/{N_TYPES})\n")
+    text.insert(tk.END, STR['off_typings'].format(cov['se_typings'], N_TYPINGS, cov['resisted_typings'], cov['immune_typings']) + "\n")
+    if cov['walls']:
+        walls = cov['walls']
+        text.insert(tk.END, STR['off_walls'] + ', '.join(walls[:8]) + (f" … (+{len(walls) - 8})" if len(walls) > 8 else '') + "\n")
+    text.insert(tk.END, "\n")
+
 FLIP_MAP = {'HP':'Speed','Attack':'Sp. Def','Defense':'Sp. Atk','Sp. Atk':'Defense','Sp. Def':'Attack','Speed':'HP'}
 
 def flip_stats_dict(stats_like: dict) -> dict:
@@ -514,7 +722,63 @@ def flip_stats_dict(stats_like: dict) -> dict:
         flipped.setdefault(k,0)
     return flipped
 
+# Section rendering: each pane section is written through a _SectionText so its text carries a 'sec_<key>' tag.
+# A re-render with the same base inputs replaces only the sections whose dependency values changed.
+_SECTION_STATE: Dict[str, dict] = {}  # widget path -> {'base', 'keys', 'deps'} of the last render
+
+class _SectionText:
+    """Text stand-in for section writers: inserts land at the 'sec_ins' mark and carry the section tag."""
+    def __init__(self, widget: tk.Text, key: str):
+        self.widget = widget; self._tag = f"sec_{key}"
+    def insert(self, _index, chars, tags=None):
+        tags = (tags,) if isinstance(tags, str) else tuple(tags or ())
+        self.widget.insert('sec_ins', chars, tags + (self._tag,))
+    def __getattr__(self, name):
+        return getattr(self.widget, name)
+    def __str__(self):
+        return str(self.widget)
+
+def invalidate_sections(text: tk.Text):
+    _SECTION_STATE.pop(str(text), None)
+
+def render_sections(text: tk.Text, base, sections) -> int:
+    """sections: [(key, deps, writer(text))] in display order. Redraws everything when `base` or the section list
+    changed; otherwise replaces only sections whose deps changed. Returns the number of sections written."""
+    wid = str(text); st = _SECTION_STATE.get(wid); keys = [k for k, _d, _w in sections]
+    if st is not None and st['base'] == base and st['keys'] == keys:
+        dirty = [(k, w) for k, d, w in sections if st['deps'].get(k) != d]
+        if all(text.tag_ranges(f"sec_{k}") for k, _w in dirty):  # an empty section has no range to replace
+            for k, writer in dirty:
+                rng = text.tag_ranges(f"sec_{k}")
+                text.mark_set('sec_ins', rng[0]); text.delete(rng[0], rng[-1])
+                writer(_SectionText(text, k))
+            st['deps'] = {k: d for k, d, _w in sections}
+            if dirty: _assert_and_raise_core_tags(text)
+            return len(dirty)
+    text.delete('1.0', tk.END)
+    try: text.configure(font=BODY_FONT_DEF)
+    except Exception: pass
+    _assert_and_raise_core_tags(text)
+    for k, _d, writer in sections:
+        text.mark_set('sec_ins', tk.END)
+        writer(_SectionText(text, k))
+    _SECTION_STATE[wid] = {'base': base, 'keys': keys, 'deps': {k: d for k, d, _w in sections}}
+    _assert_and_raise_core_tags(text)
+    return len(sections)
+
 # Side panel renderer
+_EVO_TAGS: Dict[str, set] = {}  # widget path -> evo_<row> link tags already configured/bound there
+
+def _evo_tag(text: tk.Text, row: int) -> str:
+    text = getattr(text, 'widget', text)
+    tag = f"evo_{row}"; made = _EVO_TAGS.setdefault(str(text), set())
+    if tag not in made:
+        text.tag_config(tag, foreground='#1a73e8', underline=True)
+        text.tag_bind(tag, '<Button-1>', lambda e, r=row, w=text: on_click_evo(r, w))
+        text.tag_bind(tag, '<Enter>', lambda e, w=text: w.config(cursor='hand2'))
+        text.tag_bind(tag, '<Leave>', lambda e, w=text: w.config(cursor=''))
+        made.add(tag)
+    return tag
 
 def fill_side_panel(name: str, info_text: tk.Text, id_label: tk.Label, name_label: tk.Label):
     if not name or name not in pokemon_stats: return
@@ -523,66 +787,69 @@ def fill_side_panel(name: str, info_text: tk.Text, id_label: tk.Label, name_labe
     t1, t2 = stats['Type_1'], stats['Type_2']
     ptype = t1 if (not t2 or t2 == t1) else f"{t1}/{t2}"
 
-    info_text.delete('1.0', tk.END)
-    try: info_text.configure(font=BODY_FONT_DEF)
-    except Exception: pass
-    _assert_and_raise_core_tags(info_text)
-
     panel_key = 'p1' if info_text is pokemon1_info else 'p2'
+    flip_on = bool(flip_stat_var.get())
+    try: inv_on = bool(inverse_battle_var.get())
+    except Exception: inv_on = False
 
-    if is_section_enabled(panel_key, 'type'):
-        info_text.insert(tk.END, STR['type'] + ': ', 'strong_label'); info_text.insert(tk.END, f"{ptype}\n\n")
+    def w_type(text):
+        text.insert(tk.END, STR['type'] + ': ', 'strong_label'); text.insert(tk.END, f"{ptype}\n\n")
 
     abilities = list(dict.fromkeys(stats.get('Abilities', [])))
     hidden_ability = abilities[1] if len(abilities) > 1 else ''
     visible_abilities = [a for i, a in enumerate(abilities) if i != 1] if abilities else []
-
-    if is_section_enabled(panel_key, 'abilities') and visible_abilities:
-        info_text.insert(tk.END, STR['abilities'] + ': ', 'strong_label'); info_text.insert(tk.END, f"{', '.join(visible_abilities)}\n")
-    if is_section_enabled(panel_key, 'hidden_ability') and hidden_ability:
-        info_text.insert(tk.END, STR['hidden_ability_label'], 'strong_label'); info_text.insert(tk.END, f"{hidden_ability}\n")
-    if is_section_enabled(panel_key, 'passive') and stats.get('Passive'):
-        info_text.insert(tk.END, STR['passive'] + ': ', 'strong_label'); info_text.insert(tk.END, f"{stats['Passive']}\n")
-
-    if ((is_section_enabled(panel_key, 'abilities') and visible_abilities) or
-        (is_section_enabled(panel_key, 'hidden_ability') and hidden_ability) or
-        (is_section_enabled(panel_key, 'passive') and stats.get('Passive'))):
-        info_text.insert(tk.END, "\n")
-
-    if is_section_enabled(panel_key, 'bst'):
-        info_text.insert(tk.END, STR['bst_label'], 'strong_label'); info_text.insert(tk.END, "\n")
-        insert_hr(info_text)
+    show_ab = is_section_enabled(panel_key, 'abilities') and visible_abilities
+    show_hid = is_section_enabled(panel_key, 'hidden_ability') and hidden_ability
+    show_pas = is_section_enabled(panel_key, 'passive') and stats.get('Passive')
+
+    def w_abilities(text):
+        if show_ab:
+            text.insert(tk.END, STR['abilities'] + ': ', 'strong_label'); text.insert(tk.END, f"{', '.join(visible_abilities)}\n")
+        if show_hid:
+            text.insert(tk.END, STR['hidden_ability_label'], 'strong_label'); text.insert(tk.END, f"{hidden_ability}\n")
+        if show_pas:
+            text.insert(tk.END, STR['passive'] + ': ', 'strong_label'); text.insert(tk.END, f"{stats['Passive']}\n")
+        if show_ab or show_hid or show_pas:
+            text.insert(tk.END, "\n")
+
+    def w_bst(text):
+        text.insert(tk.END, STR['bst_label'], 'strong_label'); text.insert(tk.END, "\n")
+        insert_hr(text)
         orig = {'HP': stats['HP'], 'Attack': stats['Attack'], 'Defense': stats['Defense'], 'Sp. Atk': stats['Sp. Atk'], 'Sp. Def': stats['Sp. Def'], 'Speed': stats['Speed']}
-        items_dict = flip_stats_dict(orig) if flip_stat_var.get() else orig
+        items_dict = flip_stats_dict(orig) if flip_on else orig
         items = [('HP', items_dict['HP']), ('Attack', items_dict['Attack']), ('Defense', items_dict['Defense']), ('Sp. Atk', items_dict['Sp. Atk']), ('Sp. Def', items_dict['Sp. Def']), ('Speed', items_dict['Speed'])]
-        write_stat_block(info_text, items)
-        info_text.insert(tk.END, "\n")
-        info_text.insert(tk.END, f"{STR['total_bst']}:\t", 'stat_label'); info_text.insert(tk.END, f"{format_number_trim(stats['BST'])}\n", 'stat_value')
-
-        info_text.insert(tk.END, '\n')
-    if is_section_enabled(panel_key, 'evolution') and (stats.get('evolution line') or '').strip():
-        evo_line = (stats.get('evolution line') or '').strip()
-        info_text.insert(tk.END, STR['evolution'] + ': ', 'strong_label')
-        parts = [p.strip() for p in evo_line.split(',') if p.strip()]
-        for _idx, _pname in enumerate(parts):
-            tag = f"evo_{id(info_text)}_{_idx}"
-            info_text.tag_config(tag, foreground='#1a73e8', underline=True)
-            info_text.tag_bind(tag, '<Button-1>', lambda e, n=_pname, w=info_text: on_click_evo(n, w))
-            info_text.tag_bind(tag, '<Enter>', lambda e, w=info_text: w.config(cursor='hand2'))
-            info_text.tag_bind(tag, '<Leave>', lambda e, w=info_text: w.config(cursor=''))
-            info_text.insert(tk.END, _pname, tag)
-            if _idx != len(parts) - 1: info_text.insert(tk.END, ', ')
-        info_text.insert(tk.END, '\n\n')
-
-    if is_section_enabled(panel_key, 'damage'):
-        eff = calculate_type_effectiveness(t1, t2, active_ability=None, passive_ability=stats['Passive'])
-        info_text.insert(tk.END, STR['damage_taken'] + ': ', 'strong_label'); info_text.insert(tk.END, "\n\n")
+        write_stat_block(text, items)
+        text.insert(tk.END, "\n")
+        text.insert(tk.END, f"{STR['total_bst']}:\t", 'stat_label'); text.insert(tk.END, f"{format_number_trim(stats['BST'])}\n", 'stat_value')
+
+        text.insert(tk.END, '\n')
+
+    def w_evolution(text):
+        sa = species_arrays(); fam = evolution_families(); r = sa['row'].get(name)
+        evo = fam['own'][r] if r is not None else ()  # the species' own line; links navigate by species row
+        if not evo: return
+        text.insert(tk.END, STR['evolution'] + ': ', 'strong_label')
+        for _idx, entry in enumerate(evo):
+            if isinstance(entry, int): text.insert(tk.END, sa['names'][entry], _evo_tag(text, entry))
+            else: text.insert(tk.END, entry)
+            if _idx != len(evo) - 1: text.insert(tk.END, ', ')
+        text.insert(tk.END, '\n\n')
+
+    def w_damage(text):
+        eff = calculate_type_effectiveness(t1, t2, active_ability=None, passive_ability=stats['Passive'], inverse=inv_on)
+        text.insert(tk.END, STR['damage_taken'] + ': ', 'strong_label'); text.insert(tk.END, "\n\n")
         _eff_str = format_type_effectiveness(eff); _eff_body = _eff_str.split('\n',1)[1] if '\n' in _eff_str else ''
-        info_text.insert(tk.END, _eff_body)
+        text.insert(tk.END, _eff_body)
 
-    id_label.config(text=STR['pokedex_id'].format(stats['ID']))
+    sections = [(k, deps, w) for k, on, deps, w in (
+        ('type', is_section_enabled(panel_key, 'type'), (), w_type),
+        ('abilities', show_ab or show_hid or show_pas, (bool(show_ab), bool(show_hid), bool(show_pas)), w_abilities),
+        ('bst', is_section_enabled(panel_key, 'bst'), (flip_on,), w_bst),
+        ('evolution', is_section_enabled(panel_key, 'evolution'), (), w_evolution),
+        ('damage', is_section_enabled(panel_key, 'damage'), (inv_on,), w_damage)) if on]
+    render_sections(info_text, (name, panel_key), sections)
 
-    _assert_and_raise_core_tags(info_text)
+    id_label.config(text=STR['pokedex_id'].format(stats['ID']))
 
 # ===== Fusion helpers that were missing in 1.2a =====
 
@@ -618,9 +885,10 @@ def compute_fused_typing(p1_t1: str, p1_t2: str, p2_t1: str, p2_t2: str):
 
 # Fusion helpers and nav
 
-def on_click_evo(pokemon_name: str, source_text_widget: tk.Text):
+def on_click_evo(pokemon_name, source_text_widget: tk.Text):
+    """pokemon_name is a species row (evolution link tags) or a name."""
     try:
-        name = (pokemon_name or '').strip()
+        name = species_arrays()['names'][pokemon_name] if isinstance(pokemon_name, int) else (pokemon_name or '').strip()
         if name not in pokemon_stats:
             try: messagebox.showwarning('Not found', f"'{name}' was not found in the data.")
             except Exception: pass
@@ -642,161 +910,60 @@ def swap_pokemon():
         pokemon1_var.set(p2); pokemon2_var.set(p1)
         if p2 in pokemon_stats: fill_side_panel(p2, pokemon1_info, pokemon1_id, pokemon1_name)
         else:
-            pokemon1_info.delete('1.0', tk.END); pokemon1_name.config(text=''); pokemon1_id.config(text='')
+            pokemon1_info.delete('1.0', tk.END); invalidate_sections(pokemon1_info); pokemon1_name.config(text=''); pokemon1_id.config(text='')
         if p1 in pokemon_stats: fill_side_panel(p1, pokemon2_info, pokemon2_id, pokemon2_name)
         else:
-            pokemon2_info.delete('1.0', tk.END); pokemon2_name.config(text=''); pokemon2_id.config(text='')
+            pokemon2_info.delete('1.0', tk.END); invalidate_sections(pokemon2_info); pokemon2_name.config(text=''); pokemon2_id.config(text='')
         populate_active_abilities_for(p1); maybe_recalc_if_ready()
     except Exception as e:
         logging.error(f'Error in swap_pokemon: {e}', exc_info=True)
 
+def select_pokemon(name: str, slot: int = 1):
+    """Load a species into slot 1 or 2 (used by Analysis result tables)."""
+    if name not in pokemon_stats: return
+    if slot == 2:
+        pokemon2_var.set(name); fill_side_panel(name, pokemon2_info, pokemon2_id, pokemon2_name); populate_active_abilities_for(name)
+    else:
+        pokemon1_var.set(name); fill_side_panel(name, pokemon1_info, pokemon1_id, pokemon1_name)
+
+def select_pair(p1: str, p2: str):
+    """Load both slots and fuse."""
+    if p1 in pokemon_stats and p2 in pokemon_stats:
+        select_pokemon(p1, 1); select_pokemon(p2, 2); calculate_fusion_stats(p1, p2)
+
 # Fusion calculation/render
 
 def calculate_fusion_stats(p1, p2):
     t0 = time.perf_counter()
     try:
         if p1 in pokemon_stats and p2 in pokemon_stats:
-            fusion_stats = {
-                'HP': avg_round_tenth(pokemon_stats[p1]['HP'], pokemon_stats[p2]['HP']),
-                'Attack': avg_round_tenth(pokemon_stats[p1]['Attack'], pokemon_stats[p2]['Attack']),
-                'Defense': avg_round_tenth(pokemon_stats[p1]['Defense'], pokemon_stats[p2]['Defense']),
-                'Sp. Atk': avg_round_tenth(pokemon_stats[p1]['Sp. Atk'], pokemon_stats[p2]['Sp. Atk']),
-                'Sp. Def': avg_round_tenth(pokemon_stats[p1]['Sp. Def'], pokemon_stats[p2]['Sp. Def']),
-                'Speed': avg_round_tenth(pokemon_stats[p1]['Speed'], pokemon_stats[p2]['Speed']),
-            }
-            fused_bst = round(sum(fusion_stats.values()), 1)
-            p1_t1 = pokemon_stats[p1]['Type_1']; p1_t2 = pokemon_stats[p1]['Type_2']
-            p2_t1 = pokemon_stats[p2]['Type_1']; p2_t2 = pokemon_stats[p2]['Type_2']
-            fused_type1, fused_type2 = compute_fused_typing(p1_t1, p1_t2, p2_t1, p2_t2)
+            f = fuse_pair(p1, p2, active_ability_var.get())
+            fused_type1, fused_type2 = f['fused_type1'], f['fused_type2']; active_ability = f['active_ability']
             fused_type = fused_type1 if fused_type2 == '' or fused_type2 == fused_type1 else f"{fused_type1}/{fused_type2}"
-
-            fusion_info.delete('1.0', tk.END)
-            try: fusion_info.configure(font=BODY_FONT_DEF)
-            except Exception: pass
-            _assert_and_raise_core_tags(fusion_info)
-
-            if is_section_enabled('fusion', 'fused_type'):
-                fusion_info.insert(tk.END, STR['fused_type_label'], 'strong_label'); fusion_info.insert(tk.END, f"{fused_type}\n\n")
-
-            abilities = list(dict.fromkeys(pokemon_stats[p2]['Abilities']))
-            visible_abilities = [a for i,a in enumerate(abilities) if i!=1] if abilities else []
-
-            active_ability = (active_ability_var.get() or (abilities[0] if abilities else '')).strip()
-            hidden_ability = abilities[1] if len(abilities) > 1 else ''
-            passive_ability = pokemon_stats[p1]['Passive']
             passive_on = passive_active_var.get()
 
-            if is_section_enabled('fusion', 'abilities'):
-                fusion_info.insert(tk.END, STR['abilities'] + ': ', 'strong_label'); fusion_info.insert(tk.END, f"{', '.join(visible_abilities)}\n")
-                if is_section_enabled('fusion','abilities') and active_ability:
-                    fusion_info.insert(tk.END, STR['active_ability'], 'strong_label'); fusion_info.insert(tk.END, f"{active_ability}\n")
-                if is_section_enabled('fusion','abilities') and hidden_ability and active_ability == hidden_ability:
-                    fusion_info.insert(tk.END, STR['hidden_ability_label'], 'strong_label'); fusion_info.insert(tk.END, f"{hidden_ability}\n")
-                if is_section_enabled('fusion','abilities') and passive_ability and passive_on:
-                    fusion_info.insert(tk.END, STR['passive_from_p1'], 'strong_label'); fusion_info.insert(tk.END, f"{passive_ability} (active)\n")
-
-            if is_section_enabled('fusion', 'bst'):
-                fusion_info.insert(tk.END, "\n"); fusion_info.insert(tk.END, STR['bst_label'], 'strong_label'); fusion_info.insert(tk.END, "\n")
-                insert_hr(fusion_info)
-                items_dict = flip_stats_dict(fusion_stats) if flip_stat_var.get() else fusion_stats
-                items = [('HP', items_dict['HP']), ('Attack', items_dict['Attack']), ('Defense', items_dict['Defense']), ('Sp. Atk', items_dict['Sp. Atk']), ('Sp. Def', items_dict['Sp. Def']), ('Speed', items_dict['Speed'])]
-                write_stat_block(fusion_info, items)
-                fusion_info.insert(tk.END, "\n")
-                fusion_info.insert(tk.END, f"{STR['total_bst']}:\t", 'stat_label'); fusion_info.insert(tk.END, f"{format_number_trim(fused_bst)}\n", 'stat_value')
-
-            if is_section_enabled('fusion', 'diffs'):
-                diff1 = fused_bst - float(pokemon_stats[p1]['BST']); diff2 = fused_bst - float(pokemon_stats[p2]['BST'])
-                fusion_info.insert(tk.END, STR['difference_from'].format(p1)); fusion_info.insert(tk.END, f"{format_number_trim(diff1)}\n", 'stat_value')
-                fusion_info.insert(tk.END, STR['difference_from'].format(p2)); fusion_info.insert(tk.END, f"{format_number_trim(diff2)}\n\n", 'stat_value')
-
-            def _ability_effect_summary_line(label: str, ability_name: str):
-                abil = (ability_name or '').strip().upper(); eff = ABILITY_EFFECTS.get(abil, {}); parts = []
-                if eff.get('immunities'): parts.append(f"immunities: {', '.join(eff['immunities'])}")
-                if eff.get('halve'): parts.append(f"halves: {', '.join(eff['halve'])}")
-                if abil == 'WONDER GUARD': parts.append('wonder guard: immune to all non-super-effective')
-                if not parts: parts.append('no type-chart effects')
-                return f"{label}: " + '; '.join(parts)
-
-            if is_section_enabled('fusion', 'ability_effects'):
-                ae = _ability_effect_summary_line(STR['active_effect'], active_ability)
-                if active_ability and 'no type-chart effects' not in ae: fusion_info.insert(tk.END, ae + '\n')
-                pe = _ability_effect_summary_line(STR['passive_effect'], (passive_ability if passive_on else ''))
-                if passive_ability and passive_on and 'no type-chart effects' not in pe: fusion_info.insert(tk.END, pe + '\n')
-                fusion_info.insert(tk.END, '\n')
-
-            if is_section_enabled('fusion', 'quick_compare'):
-                try:
-                    target_key = quick_compare_target_var.get() if 'quick_compare_target_var' in globals() else 'p2'
-                    if target_key == 'p1': bt1, bt2, target_name = pokemon_stats[p1]['Type_1'], pokemon_stats[p1]['Type_2'], p1
-                    else: bt1, bt2, target_name = pokemon_stats[p2]['Type_1'], pokemon_stats[p2]['Type_2'], p2
-                    eff_fused_raw = calculate_type_effectiveness(fused_type1, fused_type2, active_ability=active_ability, passive_ability=(passive_ability if passive_on else None))
-                    eff_base_raw  = calculate_type_effectiveness(bt1, bt2, active_ability=None, passive_ability=None)
-                    def group_effects(eff):
-                        groups = {0.0:set(), 0.25:set(), 0.5:set(), 1.0:set(), 2.0:set(), 4.0:set()}
-                        for t,v in eff.items():
-                            if v <= 0.0: groups[0.0].add(t)
-                            elif v <= 0.25: groups[0.25].add(t)
-                            elif v <= 0.5: groups[0.5].add(t)
-                            elif v >= 4.0: groups[4.0].add(t)
-                            elif v >= 2.0: groups[2.0].add(t)
-                            else: groups[1.0].add(t)
-                        return groups
-                    gf = group_effects(eff_fused_raw); gb = group_effects(eff_base_raw)
-                    new_imm = sorted(gf[0.0] - gb[0.0]); lost_imm = sorted(gb[0.0] - gf[0.0])
-                    new_wk  = sorted((gf[2.0] | gf[4.0]) - (gb[2.0] | gb[4.0]))
-                    lost_wk = sorted((gb[2.0] | gb[4.0]) - (gf[2.0] | gf[4.0]))
-                    new_res = sorted((gf[0.25] | gf[0.5]) - (gb[0.25] | gb[0.5]))
-                    lost_res= sorted((gb[0.25] | gb[0.5]) - (gf[0.25] | gf[0.5]))
-                    fusion_info.insert(tk.END, f"Quick Compare vs {target_name}: ", 'strong_label'); fusion_info.insert(tk.END, "\n")
-                    if new_imm: fusion_info.insert(tk.END, STR['new_imm'] + f"{', '.join(new_imm)}\n")
-                    if lost_imm: fusion_info.insert(tk.END, STR['lost_imm'] + f"{', '.join(lost_imm)}\n")
-                    if new_wk:  fusion_info.insert(tk.END, STR['new_wk']  + f"{', '.join(new_wk)}\n")
-                    if lost_wk: fusion_info.insert(tk.END, STR['lost_wk'] + f"{', '.join(lost_wk)}\n")
-                    if new_res: fusion_info.insert(tk.END, STR['new_res'] + f"{', '.join(new_res)}\n")
-                    if lost_res:fusion_info.insert(tk.END, STR['lost_res']+ f"{', '.join(lost_res)}\n")
-                    if not (new_imm or lost_imm or new_wk or lost_wk or new_res or lost_res): fusion_info.insert(tk.END, STR['no_changes'] + "\n")
-                    fusion_info.insert(tk.END, "\n")
-                except Exception as _e:
-                    logging.debug(f"[QuickCompare] error: {_e}")
-
-            if is_section_enabled('fusion', 'damage'):
-                eff = calculate_type_effectiveness(fused_type1, fused_type2, active_ability=active_ability, passive_ability=(passive_ability if passive_on else None))
-                fusion_info.insert(tk.END, STR['damage_taken'] + ': ', 'strong_label'); fusion_info.insert(tk.END, "\n\n")
-                _eff_str = format_type_effectiveness(eff); _eff_body = _eff_str.split('\n',1)[1] if '\n' in _eff_str else ''
-                fusion_info.insert(tk.END, _eff_body)
-
-            _assert_and_raise_core_tags(fusion_info)
+            render_fusion_from(p1, p2, fused_type1, fused_type2, f['fusion_stats'], f['fused_bst'], active_ability, f['passive_ability'], passive_on, from_cache=False)
 
             dt_ms = (time.perf_counter() - t0) * 1000.0
             global _FUSION_CACHE
-            _FUSION_CACHE = {'p1': p1, 'p2': p2, 'fused_type1': fused_type1, 'fused_type2': fused_type2, 'fusion_stats': fusion_stats, 'fused_bst': fused_bst, 'active_ability': active_ability, 'passive_ability': passive_ability, 'passive_on': passive_on, 'flip_on': bool(flip_stat_var.get()), 'inverse_on': bool(inverse_battle_var.get())}
+            _FUSION_CACHE = dict(f, passive_on=passive_on, flip_on=bool(flip_stat_var.get()), inverse_on=bool(inverse_battle_var.get()))
 
             global HAS_FUSION
 
             HAS_FUSION = True
-            try:
-                _v = bool('verbose_logs_var' in globals() and verbose_logs_var.get())
-                if _v:
-                    log_calc(f"[Cache] stored (p1={p1}, p2={p2}, type={fused_type}, active={active_ability or '-'}, passive={'ON' if passive_on else 'OFF'}, flip={'ON' if flip_stat_var.get() else 'OFF'}, inv={'ON' if inverse_battle_var.get() else 'OFF'})")
-                else:
-                    log_calc(f"[Cache] stored (p1={p1}, p2={p2}, type={fused_type})")
-            except Exception:
-                pass
+            if TRACE.enabled:
+                TRACE.emit('cache.store', p1=p1, p2=p2, type=fused_type, active=active_ability, passive=passive_on,
+                           flip=_FUSION_CACHE['flip_on'], inv=_FUSION_CACHE['inverse_on'])
             try:
                 update_fusion_option_states()
             except Exception:
                 pass
             status_text.set(f"Fused Type: {fused_type} Active: {active_ability or '—'} Passive: {'ON' if passive_on else 'OFF'} Flip: {'ON' if flip_stat_var.get() else 'OFF'} Inv: {'ON' if inverse_battle_var.get() else 'OFF'} Calc: {dt_ms:.1f} ms")
 
-            try:
-                try:
-                    log_calc(f"[Calc] {p1}+{p2} -> {fused_type} bst={fused_bst} dt={dt_ms:.1f}ms")
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            if TRACE.enabled:
+                TRACE.emit('fusion.computed', p1=p1, p2=p2, type=fused_type, bst=f['fused_bst'], ms=dt_ms)
         else:
-            fusion_info.delete('1.0', tk.END); _assert_and_raise_core_tags(fusion_info); fusion_info.insert(tk.END, STR['pokemon_not_found']); status_text.set(STR['ready'])
+            fusion_info.delete('1.0', tk.END); invalidate_sections(fusion_info); _assert_and_raise_core_tags(fusion_info); fusion_info.insert(tk.END, STR['pokemon_not_found']); status_text.set(STR['ready'])
     except Exception as e:
         logging.error(f"Error in calculate_fusion_stats: {str(e)}", exc_info=True)
         messagebox.showerror('Error', f"An error occurred during fusion: {str(e)}")
@@ -840,125 +1007,242 @@ class Tooltip:
             except Exception: pass
         self.tip = None
 
+class ResultsWindow:
+    """Sortable, exportable result table in its own Toplevel (Analysis tools).
+    Rows are plain tuples; clicking a heading sorts, double-clicking a row calls on_activate(row).
+    Only the first max_rows rows are materialized in the Treeview; export always writes every row.
+    Columns listed in tenths_cols hold integer tenths (sorted as ints, shown/exported as decimals).
+    master is the Tk parent of the new Toplevel; pass container instead to embed the table in an existing frame."""
+    def __init__(self, master, title: str, columns, rows=(), on_activate=None, note: str = '', max_rows: int = 5000,
+                 row_tag=None, tag_colors: Optional[dict] = None, tenths_cols=(), container=None):
+        self.columns = list(columns); self.rows = []; self.on_activate = on_activate; self.max_rows = max_rows
+        self.row_tag = row_tag; self.tenths_cols = frozenset(tenths_cols)
+        self.sort_col: Optional[int] = None; self.sort_desc = False
+        if container is None:
+            self.win = tk.Toplevel(master); self.win.title(title); self.win.geometry('900x480'); frame = self.win
+        else:  # embedded in another window (e.g. the Roster Planner)
+            self.win = container.winfo_toplevel(); frame = container
+        if note: ttk.Label(frame, text=note, anchor='w', justify='left').pack(side=tk.TOP, fill=tk.X, padx=8, pady=(6, 2))
+        bar = ttk.Frame(frame); bar.pack(side=tk.BOTTOM, fill=tk.X, padx=8, pady=6)
+        self.count_var = tk.StringVar(value='')
+        ttk.Label(bar, textvariable=self.count_var).pack(side=tk.LEFT)
+        ttk.Button(bar, text=STR['export_csv'], command=self.export_csv).pack(side=tk.RIGHT, padx=4)
+        body = ttk.Frame(frame); body.pack(fill=tk.BOTH, expand=True, padx=8)
+        ids = [f"c{i}" for i in range(len(self.columns))]
+        self.tree = ttk.Treeview(body, columns=ids, show='headings', selectmode='browse')
+        ysb = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self.tree.yview); self.tree.configure(yscrollcommand=ysb.set)
+        ysb.pack(side=tk.RIGHT, fill=tk.Y); self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        for i, (cid, label) in enumerate(zip(ids, self.columns)):
+            self.tree.heading(cid, text=label, command=lambda i=i: self.sort_by(i))
+            self.tree.column(cid, width=170 if i == 0 else 110, anchor='w' if i == 0 else 'center')
+        for tag, color in (tag_colors or {}).items():
+            self.tree.tag_configure(tag, background=color)
+        self.tree.bind('<Double-1>', self._activate)
+        if rows: self.append_rows(rows)
+        else: self._update_count()
+
+    @staticmethod
+    def _sort_key(v):
+        return (0, v, '') if isinstance(v, (int, float)) else (1, 0, str(v).lower())
+
+    def _display(self, row) -> list:
+        return [format_tenths(v) if i in self.tenths_cols else f"{v:g}" if isinstance(v, float) else v for i, v in enumerate(row)]
+
+    def _insert(self, idx: int, row):
+        values = self._display(row)
+        tags = (self.row_tag(row),) if self.row_tag else ()
+        self.tree.insert('', tk.END, iid=str(idx), values=values, tags=tags)
+
+    def _update_count(self):
+        shown = min(len(self.rows), self.max_rows)
+        self.count_var.set(f"{len(self.rows)} rows" + (f" (showing first {shown}; export for all)" if shown < len(self.rows) else ''))
+
+    def _render(self):
+        self.tree.delete(*self.tree.get_children())
+        for idx, row in enumerate(self.rows[:self.max_rows]):
+            self._insert(idx, row)
+        self._update_count()
+
+    def append_rows(self, rows):
+        rows = list(rows); start = len(self.rows); self.rows.extend(rows)
+        if self.sort_col is not None:
+            return self.sort_by(self.sort_col, keep_direction=True)
+        for idx in range(start, min(len(self.rows), self.max_rows)):
+            self._insert(idx, self.rows[idx])
+        self._update_count()
+
+    def set_rows(self, rows):
+        self.rows = list(rows)
+        if self.sort_col is not None: self.sort_by(self.sort_col, keep_direction=True)
+        else: self._render()
+
+    def sort_by(self, col: int, keep_direction: bool = False):
+        if not keep_direction:
+            self.sort_desc = (not self.sort_desc) if self.sort_col == col else False
+        self.sort_col = col
+        self.rows.sort(key=lambda r: self._sort_key(r[col]), reverse=self.sort_desc)
+        self._render()
+
+    def _activate(self, _e):
+        sel = self.tree.selection()
+        if sel and self.on_activate:
+            try: self.on_activate(self.rows[int(sel[0])])
+            except Exception as e: logging.error(f"[Results] activate failed: {e}", exc_info=True)
+
+    def export_csv(self):
+        if not self.rows:
+            try: messagebox.showinfo(STR['export_csv'], STR['nothing_to_export_rows'], parent=self.win)
+            except Exception: pass
+            return
+        path = filedialog.asksaveasfilename(parent=self.win, title=STR['export_csv'], defaultextension='.csv', filetypes=[('CSV','*.csv'), ('All files','*.*')])
+        if not path:
+            return
+        try:
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                w = csv.writer(f); w.writerow(self.columns); w.writerows(map(self._display, self.rows) if self.tenths_cols else self.rows)
+            try: status_text.set(f"Exported {len(self.rows)} rows: {path}")
+            except Exception: pass
+        except Exception as e:
+            logging.error('[Export] CSV save failed: %s' % e, exc_info=True)
+
 # Search & selection filter (missing in 1.2a)
 
-def filter_pokemon(event, filter_var, pokemon_entry, filtered_listbox):
-    q = (pokemon_entry.get() or '').strip(); ql = q.lower()
-    tokens = [t for t in re.split(r'\s+', ql) if t] if q else []
-    def match_row(name, stats):
-        if not tokens: return True
-        for t in tokens:
-            if ':' in t:
-                key, val = t.split(':', 1); val = val.strip()
-                if key == 'type':
-                    if val not in (stats.get('Type_1','').lower(), stats.get('Type_2','').lower()): return False
-                elif key == 'ability':
-                    if not any(val in (a or '').lower() for a in stats.get('Abilities', [])): return False
-                elif key == 'passive':
-                    if val not in (stats.get('Passive','').lower()): return False
-                elif key == 'name':
-                    if val not in name.lower(): return False
-                elif key in ('id', '#'):
-                    if not str(stats.get('ID','')).startswith(val): return False
-                else:
-                    return False
+def filter_tokens(query: str) -> list:
+    q = (query or '').strip().lower()
+    return [t for t in re.split(r'\s+', q) if t] if q else []
+
+def match_filter_tokens(name: str, stats: dict, tokens: list) -> bool:
+    """True if a species matches every search token (see Help → Search Filters)."""
+    if not tokens: return True
+    for t in tokens:
+        if ':' in t:
+            key, val = t.split(':', 1); val = val.strip()
+            if key == 'type':
+                if val not in (stats.get('Type_1','').lower(), stats.get('Type_2','').lower()): return False
+            elif key == 'ability':
+                if not any(val in (a or '').lower() for a in stats.get('Abilities', [])): return False
+            elif key == 'passive':
+                if val not in (stats.get('Passive','').lower()): return False
+            elif key == 'name':
+                if val not in name.lower(): return False
+            elif key in ('id', '#'):
+                if not str(stats.get('ID','')).startswith(val): return False
             else:
-                m = re.match(r'(hp|attack|defense|sp\. atk|sp\. def|speed|bst)\s*(<=|>=|==|=|<|>)\s*(\d+(?:\.\d+)?)', t)
-                if m:
-                    k, op, sval = m.groups(); keymap = {'hp':'HP','attack':'Attack','defense':'Defense','sp. atk':'Sp. Atk','sp. def':'Sp. Def','speed':'Speed','bst':'BST'}
-                    skey = keymap.get(k); left = float(stats.get(skey, 0)); right = float(sval)
-                    ok = ((op == '>' and left > right) or (op == '<' and left < right) or (op in ('=','==') and left == right) or (op == '>=') and left >= right or (op == '<=') and left <= right)
-                    if not ok: return False
-                else:
-                    id_term = t.lstrip('#')
-                    if id_term.isdigit():
-                        if int(id_term) != stats.get('ID', -999999): return False
-                    elif (t not in name.lower() and t not in stats.get('Type_1','').lower() and (t not in stats.get('Type_2','').lower() if stats.get('Type_2') else True) and not any(t in (a or '').lower() for a in stats.get('Abilities', [])) and t not in (stats.get('Passive','').lower())):
-                        return False
-        return True
-    filtered_names = [name for name, stats in pokemon_stats.items() if match_row(name, stats)]
+                return False
+        else:
+            m = re.match(r'(hp|attack|defense|sp\. atk|sp\. def|speed|bst)\s*(<=|>=|==|=|<|>)\s*(\d+(?:\.\d+)?)', t)
+            if m:
+                k, op, sval = m.groups(); keymap = {'hp':'HP','attack':'Attack','defense':'Defense','sp. atk':'Sp. Atk','sp. def':'Sp. Def','speed':'Speed','bst':'BST'}
+                skey = keymap.get(k); left = float(stats.get(skey, 0)); right = float(sval)
+                ok = ((op == '>' and left > right) or (op == '<' and left < right) or (op in ('=','==') and left == right) or (op == '>=') and left >= right or (op == '<=') and left <= right)
+                if not ok: return False
+            else:
+                id_term = t.lstrip('#')
+                if id_term.isdigit():
+                    if int(id_term) != stats.get('ID', -999999): return False
+                elif (t not in name.lower() and t not in stats.get('Type_1','').lower() and (t not in stats.get('Type_2','').lower() if stats.get('Type_2') else True) and not any(t in (a or '').lower() for a in stats.get('Abilities', [])) and t not in (stats.get('Passive','').lower())):
+                    return False
+    return True
+
+def filter_pokemon(event, filter_var, pokemon_entry, filtered_listbox):
+    t0 = time.perf_counter(); tokens = filter_tokens(pokemon_entry.get())
+    fused_tokens = [t for t in tokens if t.startswith('fused.')]
+    tokens = [t for t in tokens if not t.startswith('fused.')]
+    allowed = None
+    if fused_tokens:
+        # fused.* constraints are evaluated against the species selected in the other slot
+        partner = (pokemon2_var if filtered_listbox is pokemon1_filtered_listbox else pokemon1_var).get().strip()
+        constraints, bad = parse_fused_constraints(fused_tokens)
+        if partner in pokemon_stats and not bad:
+            sa = species_arrays(); names = sa['names']
+            allowed = {names[b] for _a, b in search_fused_constraints(constraints, p1_rows=[sa['row'][partner]])}
+        else:
+            try: status_text.set(STR['fused_filter_needs_partner'] if not bad else STR['fused_filter_bad'].format(' '.join(bad)))
+            except Exception: pass
+    filtered_names = [name for name, stats in pokemon_stats.items() if (allowed is None or name in allowed) and match_filter_tokens(name, stats, tokens)]
     filtered_listbox.delete(0, tk.END)
     for name in filtered_names: filtered_listbox.insert(tk.END, name)
+    if TRACE.enabled:
+        TRACE.emit('filter.executed', query=pokemon_entry.get(), matches=len(filtered_names), ms=(time.perf_counter() - t0) * 1000.0)
 
 # Display Options dialog
 
 
 def render_fusion_from(p1, p2, fused_type1, fused_type2, fusion_stats, fused_bst,
-                        active_ability, passive_ability, passive_on, debug=False):
-    """Re-render Fusion pane from cached values (no stat/type recompute).
+                        active_ability, passive_ability, passive_on, debug=False, from_cache=True):
+    """Render the Fusion pane from fuse_pair() values (no stat/type recompute); stats are integer tenths.
     Safe to call headless; computes only display-time effects (ability/type chart).
+    from_cache=False is the fresh-calculation path: the caller logs/sets status and handles errors.
     """
     try:
         fused_type = fused_type1 if (not fused_type2 or fused_type2 == fused_type1) else f"{fused_type1}/{fused_type2}"
-        try:
-            _v = bool('verbose_logs_var' in globals() and verbose_logs_var.get())
-            if _v:
-                log_calc(f"[Cache] render_from_cache (p1={p1}, p2={p2}, type={fused_type}, active={active_ability or '-'}, passive={'ON' if passive_on else 'OFF'}, flip={'ON' if flip_stat_var.get() else 'OFF'}, inv={'ON' if inverse_battle_var.get() else 'OFF'})")
-            else:
-                log_calc(f"[Cache] render_from_cache (p1={p1}, p2={p2}, type={fused_type})")
-        except Exception:
-            pass
-        fusion_info.delete('1.0', tk.END)
-        try:
-            fusion_info.configure(font=BODY_FONT_DEF)
-        except Exception:
-            pass
-        _assert_and_raise_core_tags(fusion_info)
-        if is_section_enabled('fusion', 'fused_type'):
-            fusion_info.insert(tk.END, STR['fused_type_label'], 'strong_label'); fusion_info.insert(tk.END, f"{fused_type}\n\n")
+        flip_on = bool(flip_stat_var.get())
+        try: inv_on = bool(inverse_battle_var.get())
+        except Exception: inv_on = False
+        if from_cache and TRACE.enabled:
+            TRACE.emit('cache.hit', p1=p1, p2=p2, type=fused_type, active=active_ability, passive=passive_on, flip=flip_on, inv=inv_on)
+        target_key = quick_compare_target_var.get() if 'quick_compare_target_var' in globals() else 'p2'
+
+        def w_fused_type(text):
+            text.insert(tk.END, STR['fused_type_label'], 'strong_label'); text.insert(tk.END, f"{fused_type}\n\n")
         # Abilities / selections
         abilities = list(dict.fromkeys(pokemon_stats.get(p2, {}).get('Abilities', [])))
         visible_abilities = [a for i,a in enumerate(abilities) if i!=1] if abilities else []
         active_ability_eff = (active_ability or (abilities[0] if abilities else '')).strip()
         hidden_ability = abilities[1] if len(abilities) > 1 else ''
-        if is_section_enabled('fusion', 'abilities'):
-            fusion_info.insert(tk.END, STR['abilities'] + ': ', 'strong_label'); fusion_info.insert(tk.END, f"{', '.join(visible_abilities)}\n")
-        if is_section_enabled('fusion','abilities') and active_ability_eff:
-            fusion_info.insert(tk.END, STR['active_ability'], 'strong_label'); fusion_info.insert(tk.END, f"{active_ability_eff}\n")
-        if is_section_enabled('fusion','abilities') and hidden_ability and active_ability_eff == hidden_ability:
-            fusion_info.insert(tk.END, STR['hidden_ability_label'], 'strong_label'); fusion_info.insert(tk.END, f"{hidden_ability}\n")
-        if is_section_enabled('fusion','abilities') and passive_ability and passive_on:
-            fusion_info.insert(tk.END, STR['passive_from_p1'], 'strong_label'); fusion_info.insert(tk.END, f"{passive_ability} (active)\n")
-        if is_section_enabled('fusion', 'bst'):
-            fusion_info.insert(tk.END, "\n"); fusion_info.insert(tk.END, STR['bst_label'], 'strong_label'); fusion_info.insert(tk.END, "\n")
-            insert_hr(fusion_info)
-            items_dict = flip_stats_dict(fusion_stats) if flip_stat_var.get() else fusion_stats
+        def w_abilities(text):
+            text.insert(tk.END, STR['abilities'] + ': ', 'strong_label'); text.insert(tk.END, f"{', '.join(visible_abilities)}\n")
+            if active_ability_eff:
+                text.insert(tk.END, STR['active_ability'], 'strong_label'); text.insert(tk.END, f"{active_ability_eff}\n")
+            if hidden_ability and active_ability_eff == hidden_ability:
+                text.insert(tk.END, STR['hidden_ability_label'], 'strong_label'); text.insert(tk.END, f"{hidden_ability}\n")
+            if passive_ability and passive_on:
+                text.insert(tk.END, STR['passive_from_p1'], 'strong_label'); text.insert(tk.END, f"{passive_ability} (active)\n")
+        def w_bst(text):
+            text.insert(tk.END, "\n"); text.insert(tk.END, STR['bst_label'], 'strong_label'); text.insert(tk.END, "\n")
+            insert_hr(text)
+            items_dict = flip_stats_dict(fusion_stats) if flip_on else fusion_stats
             items = [('HP', items_dict['HP']), ('Attack', items_dict['Attack']), ('Defense', items_dict['Defense']), ('Sp. Atk', items_dict['Sp. Atk']), ('Sp. Def', items_dict['Sp. Def']), ('Speed', items_dict['Speed'])]
-            write_stat_block(fusion_info, items)
-            fusion_info.insert(tk.END, "\n")
-            fusion_info.insert(tk.END, f"{STR['total_bst']}:\t", 'stat_label'); fusion_info.insert(tk.END, f"{format_number_trim(fused_bst)}\n", 'stat_value')
-        if is_section_enabled('fusion', 'diffs'):
-            try:
-                diff1 = float(fused_bst) - float(pokemon_stats.get(p1, {}).get('BST', 0))
-                diff2 = float(fused_bst) - float(pokemon_stats.get(p2, {}).get('BST', 0))
-            except Exception:
-                diff1 = fused_bst; diff2 = fused_bst
-            fusion_info.insert(tk.END, STR['difference_from'].format(p1)); fusion_info.insert(tk.END, f"{format_number_trim(diff1)}\n", 'stat_value')
-            fusion_info.insert(tk.END, STR['difference_from'].format(p2)); fusion_info.insert(tk.END, f"{format_number_trim(diff2)}\n\n", 'stat_value')
+            write_stat_block(text, items, fmt=format_tenths)
+            text.insert(tk.END, "\n")
+            text.insert(tk.END, f"{STR['total_bst']}:\t", 'stat_label'); text.insert(tk.END, f"{format_tenths(fused_bst)}\n", 'stat_value')
+        def w_diffs(text):
+            diff1 = fused_bst - 10 * int(pokemon_stats.get(p1, {}).get('BST', 0))
+            diff2 = fused_bst - 10 * int(pokemon_stats.get(p2, {}).get('BST', 0))
+            text.insert(tk.END, STR['difference_from'].format(p1)); text.insert(tk.END, f"{format_tenths(diff1)}\n", 'stat_value')
+            text.insert(tk.END, STR['difference_from'].format(p2)); text.insert(tk.END, f"{format_tenths(diff2)}\n\n", 'stat_value')
+        def w_percentiles(text):
+            pct = fused_percentiles(p1, p2)
+            text.insert(tk.END, STR['percentiles_label'].format(p1, p2), 'strong_label'); text.insert(tk.END, "\n")
+            insert_hr(text)
+            pairs = {k: (pct['p1'][k], pct['p2'][k]) for k in STAT_KEYS}
+            if flip_on: pairs = flip_stats_dict(pairs)
+            items = [(k, pairs[k]) for k in STAT_KEYS] + [('BST', (pct['p1']['BST'], pct['p2']['BST']))]
+            write_stat_block(text, items, fmt=lambda v: f"{ordinal(round(v[0]))} / {ordinal(round(v[1]))}")
+            text.insert(tk.END, "\n")
         # Ability effect summary
         def _ability_effect_summary_line(label: str, ability_name: str):
             abil = (ability_name or '').strip().upper(); eff = ABILITY_EFFECTS.get(abil, {}); parts = []
             if eff.get('immunities'): parts.append(f"immunities: {', '.join(eff['immunities'])}")
             if eff.get('halve'): parts.append(f"halves: {', '.join(eff['halve'])}")
-            if abil == 'WONDER GUARD': parts.append('wonder guard: immune to all non-super-effective')
+            if eff.get('threshold'): parts.append('wonder guard: immune to all non-super-effective')
             if not parts: parts.append('no type-chart effects')
             return f"{label}: " + '; '.join(parts)
-        if is_section_enabled('fusion', 'ability_effects'):
+        def w_ability_effects(text):
             ae = _ability_effect_summary_line(STR['active_effect'], active_ability_eff)
-            if active_ability_eff and 'no type-chart effects' not in ae: fusion_info.insert(tk.END, ae + '\n')
+            if active_ability_eff and 'no type-chart effects' not in ae: text.insert(tk.END, ae + '\n')
             pe = _ability_effect_summary_line(STR['passive_effect'], (passive_ability if passive_on else ''))
-            if passive_ability and passive_on and 'no type-chart effects' not in pe: fusion_info.insert(tk.END, pe + '\n')
-            fusion_info.insert(tk.END, '\n')
+            if passive_ability and passive_on and 'no type-chart effects' not in pe: text.insert(tk.END, pe + '\n')
+            text.insert(tk.END, '\n')
         # Quick Compare
-        if is_section_enabled('fusion', 'quick_compare'):
+        def w_quick_compare(text):
             try:
-                target_key = quick_compare_target_var.get() if 'quick_compare_target_var' in globals() else 'p2'
                 if target_key == 'p1':
                     bt1, bt2, target_name = pokemon_stats.get(p1, {}).get('Type_1',''), pokemon_stats.get(p1, {}).get('Type_2',''), p1
                 else:
                     bt1, bt2, target_name = pokemon_stats.get(p2, {}).get('Type_1',''), pokemon_stats.get(p2, {}).get('Type_2',''), p2
-                eff_fused_raw = calculate_type_effectiveness(fused_type1, fused_type2, active_ability=active_ability_eff, passive_ability=(passive_ability if passive_on else None))
-                eff_base_raw = calculate_type_effectiveness(bt1, bt2, active_ability=None, passive_ability=None)
+                eff_fused_raw = calculate_type_effectiveness(fused_type1, fused_type2, active_ability=active_ability_eff, passive_ability=(passive_ability if passive_on else None), inverse=inv_on)
+                eff_base_raw = calculate_type_effectiveness(bt1, bt2, active_ability=None, passive_ability=None, inverse=inv_on)
                 def group_effects(eff):
                     groups = {0.0:set(), 0.25:set(), 0.5:set(), 1.0:set(), 2.0:set(), 4.0:set()}
                     for t,v in eff.items():
@@ -975,64 +1259,66 @@ def render_fusion_from(p1, p2, fused_type1, fused_type2, fusion_stats, fused_bst
                 lost_wk = sorted((gb[2.0] | gb[4.0]) - (gf[2.0] | gf[4.0]))
                 new_res = sorted((gf[0.25] | gf[0.5]) - (gb[0.25] | gb[0.5]))
                 lost_res= sorted((gb[0.25] | gb[0.5]) - (gf[0.25] | gf[0.5]))
-                fusion_info.insert(tk.END, f"Quick Compare vs {target_name}: ", 'strong_label'); fusion_info.insert(tk.END, "\n")
-                if new_imm: fusion_info.insert(tk.END, STR['new_imm'] + f"{', '.join(new_imm)}\n")
-                if lost_imm: fusion_info.insert(tk.END, STR['lost_imm'] + f"{', '.join(lost_imm)}\n")
-                if new_wk: fusion_info.insert(tk.END, STR['new_wk'] + f"{', '.join(new_wk)}\n")
-                if lost_wk: fusion_info.insert(tk.END, STR['lost_wk']+ f"{', '.join(lost_wk)}\n")
-                if new_res: fusion_info.insert(tk.END, STR['new_res'] + f"{', '.join(new_res)}\n")
-                if lost_res:fusion_info.insert(tk.END, STR['lost_res']+ f"{', '.join(lost_res)}\n")
-                if not (new_imm or lost_imm or new_wk or lost_wk or new_res or lost_res): fusion_info.insert(tk.END, STR['no_changes'] + "\n")
-                fusion_info.insert(tk.END, "\n")
+                text.insert(tk.END, f"Quick Compare vs {target_name}: ", 'strong_label'); text.insert(tk.END, "\n")
+                if new_imm: text.insert(tk.END, STR['new_imm'] + f"{', '.join(new_imm)}\n")
+                if lost_imm: text.insert(tk.END, STR['lost_imm'] + f"{', '.join(lost_imm)}\n")
+                if new_wk: text.insert(tk.END, STR['new_wk'] + f"{', '.join(new_wk)}\n")
+                if lost_wk: text.insert(tk.END, STR['lost_wk']+ f"{', '.join(lost_wk)}\n")
+                if new_res: text.insert(tk.END, STR['new_res'] + f"{', '.join(new_res)}\n")
+                if lost_res:text.insert(tk.END, STR['lost_res']+ f"{', '.join(lost_res)}\n")
+                if not (new_imm or lost_imm or new_wk or lost_wk or new_res or lost_res): text.insert(tk.END, STR['no_changes'] + "\n")
+                text.insert(tk.END, "\n")
             except Exception as _e:
                 logging.debug(f"[QuickCompare] cache-render error: {_e}")
+        # Offensive coverage
+        def w_offense(text):
+            write_offense_section(text, fused_type1, fused_type2)
         # Damage taken
-        if is_section_enabled('fusion', 'damage'):
-            eff = calculate_type_effectiveness(fused_type1, fused_type2, active_ability=active_ability_eff, passive_ability=(passive_ability if passive_on else None))
-            fusion_info.insert(tk.END, STR['damage_taken'] + ': ', 'strong_label'); fusion_info.insert(tk.END, "\n\n")
+        def w_damage(text):
+            eff = calculate_type_effectiveness(fused_type1, fused_type2, active_ability=active_ability_eff, passive_ability=(passive_ability if passive_on else None), inverse=inv_on)
+            text.insert(tk.END, STR['damage_taken'] + ': ', 'strong_label'); text.insert(tk.END, "\n\n")
             _eff_str = format_type_effectiveness(eff); _eff_body = _eff_str.split('\n',1)[1] if '\n' in _eff_str else ''
-            fusion_info.insert(tk.END, _eff_body)
-        _assert_and_raise_core_tags(fusion_info)
+            text.insert(tk.END, _eff_body)
+        # (section, inputs beyond the fusion itself) — a toggle only rewrites the sections that list it
+        sections = [(k, deps, w) for k, deps, w in (
+            ('fused_type', (), w_fused_type), ('abilities', (passive_on,), w_abilities), ('bst', (flip_on,), w_bst),
+            ('diffs', (), w_diffs), ('percentiles', (flip_on,), w_percentiles), ('ability_effects', (passive_on,), w_ability_effects),
+            ('quick_compare', (inv_on, passive_on, target_key), w_quick_compare), ('offense', (inv_on,), w_offense),
+            ('damage', (inv_on, passive_on), w_damage)) if is_section_enabled('fusion', k)]
+        base = (p1, p2, fused_type1, fused_type2, tuple(fusion_stats.items()), fused_bst, active_ability_eff, passive_ability)
+        written = render_sections(fusion_info, base, sections)
+        if TRACE.enabled:
+            TRACE.emit('render.done', pane='fusion', written=written, sections=len(sections), debug=debug)
         try:
-            status_text.set(f"Fused Type: {fused_type} Active: {active_ability_eff or '—'} Passive: {'ON' if passive_on else 'OFF'} Flip: {'ON' if flip_stat_var.get() else 'OFF'} Inv: {'ON' if inverse_battle_var.get() else 'OFF'} CacheRefresh: OK")
+            if from_cache: status_text.set(f"Fused Type: {fused_type} Active: {active_ability_eff or '—'} Passive: {'ON' if passive_on else 'OFF'} Flip: {'ON' if flip_stat_var.get() else 'OFF'} Inv: {'ON' if inverse_battle_var.get() else 'OFF'} CacheRefresh: OK")
         except Exception:
             pass
     except Exception as e:
+        if not from_cache: raise
         logging.debug(f"[CacheRender] failed: {e}")
 
 
-def refresh_after_challenge_toggle():
+def refresh_after_challenge_toggle(on_refresh=(), via: str = 'challenge_toggle'):
+    """Re-render the Fusion pane from cache under the current Flip/Inverse toggles, then call each on_refresh
+    callback (the open tool windows). via names the trigger in the cache.refresh trace event."""
     try:
         refresh_side_panels()
         if globals().get('HAS_FUSION', False) and isinstance(globals().get('_FUSION_CACHE', {}), dict):
             c = globals().get('_FUSION_CACHE', {})
             req = ['p1','p2','fused_type1','fused_type2','fusion_stats','fused_bst','active_ability','passive_ability','passive_on']
             if all(k in c for k in req):
-                try:
-                    _v = bool('verbose_logs_var' in globals() and verbose_logs_var.get())
-                    if _v:
-                        log_calc(f"[Cache] refresh_via_challenge_toggle (flip={'ON' if flip_stat_var.get() else 'OFF'}, inv={'ON' if inverse_battle_var.get() else 'OFF'})")
-                    else:
-                        log_calc('[Cache] refresh_via_challenge_toggle')
-                except Exception:
-                    pass
-                try:
-                    _v = bool('verbose_logs_var' in globals() and verbose_logs_var.get())
-                    if _v:
-                        log_calc(f"[Cache] refresh_via_display_options (flip={'ON' if flip_stat_var.get() else 'OFF'}, inv={'ON' if inverse_battle_var.get() else 'OFF'})")
-                    else:
-                        log_calc('[Cache] refresh_via_display_options')
-                except Exception:
-                    pass
+                if TRACE.enabled:
+                    TRACE.emit('cache.refresh', via=via, flip=bool(flip_stat_var.get()), inv=bool(inverse_battle_var.get()))
                 render_fusion_from(c['p1'], c['p2'], c['fused_type1'], c['fused_type2'], c['fusion_stats'], c['fused_bst'], c['active_ability'], c['passive_ability'], c['passive_on'])
     except Exception:
         pass
+    for fn in on_refresh: fn()
 
 
 
-def refresh_after_passive_toggle():
+def refresh_after_passive_toggle(on_refresh=()):
     """Re-render fusion pane from cache using current Passive Active state; no recalculation.
-    Safe headless; idempotent.
+    Safe headless; idempotent. Each on_refresh callback runs afterwards (the open tool windows).
     """
     try:
         refresh_side_panels()
@@ -1047,7 +1333,8 @@ def refresh_after_passive_toggle():
                 render_fusion_from(c['p1'], c['p2'], c['fused_type1'], c['fused_type2'], c['fusion_stats'], c['fused_bst'], c['active_ability'], c['passive_ability'], passive_on_now)
     except Exception:
         pass
-def show_display_options():
+    for fn in on_refresh: fn()
+def show_display_options(root):
     ensure_display_vars()
     global quick_compare_target_var, __fusion_option_buttons__
     if quick_compare_target_var is None: quick_compare_target_var = tk.StringVar(value='p2')
@@ -1076,6 +1363,8 @@ def show_display_options():
                 c = globals().get('_FUSION_CACHE', {})
                 req = ['p1','p2','fused_type1','fused_type2','fusion_stats','fused_bst','active_ability','passive_ability','passive_on']
                 if all(k in c for k in req):
+                    if TRACE.enabled:
+                        TRACE.emit('cache.refresh', via='display_options', flip=bool(flip_stat_var.get()), inv=bool(inverse_battle_var.get()))
                     render_fusion_from(c['p1'], c['p2'], c['fused_type1'], c['fused_type2'], c['fusion_stats'], c['fused_bst'], c['active_ability'], c['passive_ability'], c['passive_on'])
             _assert_and_raise_core_tags(pokemon1_info); _assert_and_raise_core_tags(pokemon2_info); _assert_and_raise_core_tags(fusion_info)
         except Exception as e:
@@ -1092,10 +1381,12 @@ def show_display_options():
         (STR['passive'], 'passive', 'passive', None),
         (STR['bst_stats'], 'bst', 'bst', 'bst'),
         ('Difference from…', None, None, 'diffs'),
+        (STR['percentiles'], None, None, 'percentiles'),
         (STR['evolution'], 'evolution', 'evolution', None),
         (STR['damage_taken'], 'damage', 'damage', 'damage'),
         (STR['ability_effect_summary'], None, None, 'ability_effects'),
         (STR['quick_compare'], None, None, 'quick_compare'),
+        (STR['offense_coverage'], None, None, 'offense'),
     ]
 
     def add_row(r, label, k1, k2, kf):
@@ -1176,97 +1467,128 @@ type_effectiveness = {
 def _normalize_ability(name: str) -> str:
     return (name or '').strip().upper()
 
-def calculate_type_effectiveness(type1, type2=None, active_ability=None, passive_ability=None):
+# \ Compiled type chart (built once at import) /
+# Every defensive profile is an 18-slot vector in TYPE_ORDER (attacking type) order.
+TYPE_ORDER = tuple(type_effectiveness.keys())
+TYPE_INDEX = {t: i for i, t in enumerate(TYPE_ORDER)}
+N_TYPES = len(TYPE_ORDER)
+NEUTRAL_VECTOR = (1.0,) * N_TYPES
+
+def _invert(v: float) -> float:
+    # Smogon Inverse mapping: 0→2, 1/4→4, 1/2→2, 1→1, 2→1/2, 4→1/4
+    eps = 1e-9
+    if v <= 0.0:
+        return 2.0
+    if v <= 0.25 + eps:
+        return 4.0
+    if v <= 0.5 + eps:
+        return 2.0
+    if v >= 4.0 - eps:
+        return 0.25
+    if v >= 2.0 - eps:
+        return 0.5
+    return 1.0
+
+def _single_type_vector(def_type: str) -> tuple:
+    te = type_effectiveness[def_type]; vec = [1.0] * N_TYPES
+    for w in te['weaknesses']: vec[TYPE_INDEX[w]] *= 2.0
+    for r in te['resistances']: vec[TYPE_INDEX[r]] *= 0.5
+    for im in te['immunities']: vec[TYPE_INDEX[im]] = 0.0
+    return tuple(vec)
+
+# SINGLE_TYPE_VECTORS[inverse][type] -> per-attacker factor for one defending type
+SINGLE_TYPE_VECTORS = {False: {t: _single_type_vector(t) for t in TYPE_ORDER}}
+SINGLE_TYPE_VECTORS[True] = {t: tuple(_invert(v) for v in vec) for t, vec in SINGLE_TYPE_VECTORS[False].items()}
+
+def defense_vector(type1, type2=None, inverse: bool = False) -> tuple:
+    """Type-chart-only damage taken by a (type1, type2) defender; inversion is applied per type."""
+    singles = SINGLE_TYPE_VECTORS[bool(inverse)]
+    t1 = (type1 or '').title(); t2 = (type2 or '').title()
+    vecs = []
+    for t in ((t1, t2) if (t2 and t2 != t1) else (t1,)):
+        if t and t not in singles:
+            logging.error(f"Unknown type: {t}")  # treated as neutral (1× stays 1× when inverted)
+        elif t:
+            vecs.append(singles[t])
+    if not vecs:
+        return NEUTRAL_VECTOR
+    if len(vecs) == 1:
+        return vecs[0]
+    return tuple(a * b for a, b in zip(vecs[0], vecs[1]))
+
+class CompiledAbility:
+    """Ability effect as fixed vectors: per-type multipliers, an immunity bitmask over TYPE_ORDER and a
+    Wonder Guard-style threshold (factors below it become 0). Combining two abilities is elementwise."""
+    __slots__ = ('name', 'mult', 'immune_mask', 'threshold', 'is_neutral')
+    def __init__(self, name: str, mult: tuple = NEUTRAL_VECTOR, immune_mask: int = 0, threshold: float = 0.0):
+        self.name = name; self.mult = tuple(mult); self.immune_mask = int(immune_mask); self.threshold = float(threshold)
+        self.is_neutral = (self.mult == NEUTRAL_VECTOR and not self.immune_mask and not self.threshold)
+    def combine(self, other: 'CompiledAbility') -> 'CompiledAbility':
+        if other.is_neutral: return self
+        if self.is_neutral: return other
+        return CompiledAbility(f"{self.name}+{other.name}", tuple(a * b for a, b in zip(self.mult, other.mult)),
+                               self.immune_mask | other.immune_mask, max(self.threshold, other.threshold))
+    def apply(self, vec: tuple) -> tuple:
+        if self.is_neutral: return vec
+        imm = self.immune_mask; thr = self.threshold
+        out = [0.0 if (imm >> i) & 1 else v * m for i, (v, m) in enumerate(zip(vec, self.mult))]
+        if thr:
+            out = [0.0 if v < thr else v for v in out]
+        return tuple(out)
+    def apply_batch(self, vecs) -> list:
+        """Apply to many defensive vectors (e.g., every typing) in one pass."""
+        return list(vecs) if self.is_neutral else [self.apply(v) for v in vecs]
+
+NEUTRAL_ABILITY = CompiledAbility('')
+
+def compile_ability_effects(table: dict) -> Dict[str, CompiledAbility]:
+    compiled = {}
+    for name, eff in table.items():
+        mult = [1.0] * N_TYPES; imm = 0
+        try:
+            for t in eff.get('immunities', []): imm |= 1 << TYPE_INDEX[t]
+            for t in eff.get('halve', []): mult[TYPE_INDEX[t]] *= 0.5
+            for t, v in eff.get('multiply', {}).items(): mult[TYPE_INDEX[t]] *= float(v)
+            compiled[name] = CompiledAbility(name, tuple(mult), imm, float(eff.get('threshold', 0.0) or 0.0))
+        except (KeyError, TypeError, ValueError) as e:
+            logging.error(f"[Abilities] skipping malformed effect entry {name!r}: {e}")
+    return compiled
+
+COMPILED_ABILITIES = compile_ability_effects(ABILITY_EFFECTS)
+_ABILITY_CONTEXTS: Dict[tuple, CompiledAbility] = {}
+
+def ability_context(active_ability=None, passive_ability=None) -> CompiledAbility:
+    """Combined compiled effect of an active + passive ability (cached per normalized pair)."""
+    key = (_normalize_ability(active_ability), _normalize_ability(passive_ability))
+    ctx = _ABILITY_CONTEXTS.get(key)
+    if ctx is None:
+        ctx = COMPILED_ABILITIES.get(key[0], NEUTRAL_ABILITY).combine(COMPILED_ABILITIES.get(key[1], NEUTRAL_ABILITY))
+        _ABILITY_CONTEXTS[key] = ctx
+    return ctx
+
+EFFECTIVENESS_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=EFFECTIVENESS_CACHE_SIZE)
+def _type_effectiveness_cached(type1: str, type2: str, active: str, passive: str, inverse: bool):
+    return MappingProxyType(dict(zip(TYPE_ORDER, ability_context(active, passive).apply(defense_vector(type1, type2, inverse)))))
+
+def calculate_type_effectiveness(type1, type2=None, active_ability=None, passive_ability=None, inverse=None):
     # Canonical per-type factoring with per-type inversion (Inverse Battle)
-    # Abilities are applied AFTER inversion; Wonder Guard handled last.
-    def _factor_vs_single(def_type: str) -> dict:
-        result = {t: 1.0 for t in type_effectiveness.keys()}
-        if not def_type:
-            return result
-        dt = def_type.title()
-        if dt not in type_effectiveness:
-            try:
-                import logging
-                logging.error(f"Unknown type: {dt}")
-            except Exception:
-                pass
-            return result
-        te = type_effectiveness[dt]
-        for w in te['weaknesses']:
-            result[w] *= 2.0
-        for r in te['resistances']:
-            result[r] *= 0.5
-        for im in te['immunities']:
-            result[im] = 0.0
-        return result
-
-    def _invert(v: float) -> float:
-        # Smogon Inverse mapping: 0→2, 1/4→4, 1/2→2, 1→1, 2→1/2, 4→1/4
-        eps = 1e-9
-        if v <= 0.0:
-            return 2.0
-        if v <= 0.25 + eps:
-            return 4.0
-        if v <= 0.5 + eps:
-            return 2.0
-        if v >= 4.0 - eps:
-            return 0.25
-        if v >= 2.0 - eps:
-            return 0.5
-        return 1.0
-
-    # Inverse toggle (safe if var not yet defined)
-    try:
-        inv_on = bool(inverse_battle_var.get())
-    except Exception:
-        inv_on = False
-
-    t1 = (type1 or '').title()
-    t2 = (type2 or '').title()
-    f1 = _factor_vs_single(t1)
-    f2 = _factor_vs_single(t2) if (t2 and t2 != t1) else None
-
-    eff = {}
-    for atk in type_effectiveness.keys():
-        v1 = f1.get(atk, 1.0)
-        v2 = f2.get(atk, 1.0) if f2 else 1.0
-        if inv_on:
-            v1 = _invert(v1)
-            v2 = _invert(v2)
-        eff[atk] = v1 * v2
-
-    # Abilities apply after inversion (ability immunities/resistances unaffected by Inverse)
-    act = _normalize_ability(active_ability); pas = _normalize_ability(passive_ability)
-
-    def apply_effects(which: str):
-        e = ABILITY_EFFECTS.get(which)
-        if not e:
-            return
-        for immu in e.get('immunities', []):
-            if immu in eff:
-                eff[immu] = 0.0
-        for half in e.get('halve', []):
-            if half in eff:
-                eff[half] *= 0.5
-        for mult_t, mult_v in e.get('multiply', {}).items():
-            if mult_t in eff:
-                try:
-                    eff[mult_t] *= float(mult_v)
-                except Exception:
-                    pass
-
-    if act:
-        apply_effects(act)
-    if pas:
-        apply_effects(pas)
-
-    # Wonder Guard: immune to all non-super-effective (post all adjustments)
-    if act == 'WONDER GUARD' or pas == 'WONDER GUARD':
-        for k, v in list(eff.items()):
-            if v < 2:
-                eff[k] = 0.0
+    # Abilities are applied AFTER inversion (unaffected by Inverse); Wonder Guard threshold last.
+    # Memoized per (type1, type2, active, passive, inverse); the returned mapping is read-only.
+    # inverse=None reads the Inverse Battle toggle (safe if var not yet defined)
+    if inverse is None:
+        try:
+            inverse = bool(inverse_battle_var.get())
+        except Exception:
+            inverse = False
+    return _type_effectiveness_cached((type1 or '').title(), (type2 or '').title(),
+                                      _effect_key(active_ability), _effect_key(passive_ability), bool(inverse))
 
-    return eff
+def effectiveness_cache_stats() -> dict:
+    ci = _type_effectiveness_cached.cache_info(); calls = ci.hits + ci.misses
+    return {'hits': ci.hits, 'misses': ci.misses, 'size': ci.currsize, 'maxsize': ci.maxsize,
+            'hit_rate': round(ci.hits / calls, 3) if calls else 0.0}
 
 def format_type_effectiveness(effectiveness):
     result = STR['damage_taken'] + "\n"
@@ -1288,106 +1610,1880 @@ def format_type_effectiveness(effectiveness):
         s = (f"{k:.2f}" if abs(k - round(k)) > 1e-9 else f"{int(round(k))}").rstrip('0').rstrip('.')
         result += f"{s}x damage: {', '.join(types)}\n"
     return result.strip()
-# App setup & menus
-load_pokemon_data_into(pokemon_stats)
-root = tk.Tk(); root.title(f"PokéRogue Fusion Calculator — build {BUILD_TAG}")
-root.geometry('1550x540')
-
-menubar = tk.Menu(root); root.config(menu=menubar)
-file_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='File', menu=file_menu)
-file_menu.add_command(label=STR['copy_fusion_summary'], command=copy_fusion_summary)
-file_menu.add_command(label=STR['export_fusion_summary'], command=export_fusion_summary)
-file_menu.add_separator(); file_menu.add_command(label='Exit', command=root.quit)
-
-challenges_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='Challenges', menu=challenges_menu)
-resources_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='Resources', menu=resources_menu)
-resources_menu.add_command(label='Pokémon Database', command=open_pokemondb)
-resources_menu.add_command(label='Type Calculator', command=open_type_calculator)
-resources_menu.add_command(label='PokeRogue Pokedex', command=open_pokedex)
-help_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='Help', menu=help_menu)
-
-# Toolbar Integrity Guard — ensure required challenge labels exist (idempotent)
-def _verify_challenges_menu_integrity():
-    try:
-        required = ['Flip Stat Challenge', 'Inverse Battle Challenge']
-        present = []
+
+# Typing tables & offensive coverage
+# TYPINGS enumerates the 171 unordered defending typings: 18 mono types, then every dual pair once.
+TYPINGS = tuple([(t, '') for t in TYPE_ORDER] + [(a, b) for i, a in enumerate(TYPE_ORDER) for b in TYPE_ORDER[i + 1:]])
+N_TYPINGS = len(TYPINGS)
+TYPING_INDEX = {}
+for _i, (_a, _b) in enumerate(TYPINGS):
+    TYPING_INDEX[(_a, _b)] = _i
+    if _b: TYPING_INDEX[(_b, _a)] = _i
+    else: TYPING_INDEX[(_a, _a)] = _i
+
+def typing_index(type1, type2='') -> Optional[int]:
+    """Index into TYPINGS for a defender typing (order-insensitive); None for unknown types."""
+    return TYPING_INDEX.get(((type1 or '').title(), (type2 or '').title()))
+
+def typing_label(idx: int) -> str:
+    t1, t2 = TYPINGS[idx]
+    return f"{t1}/{t2}" if t2 else t1
+
+# DEFENSE_BY_TYPING[inverse][typing] -> 18-slot damage-taken vector (type chart only)
+DEFENSE_BY_TYPING = {inv: tuple(defense_vector(a, b, inv) for (a, b) in TYPINGS) for inv in (False, True)}
+# OFFENSE_MATRIX[inverse][attacking type] -> multiplier against each of the 171 typings
+OFFENSE_MATRIX = {inv: tuple(tuple(vec[k] for vec in DEFENSE_BY_TYPING[inv]) for k in range(N_TYPES)) for inv in (False, True)}
+
+def stab_coverage_vector(type1, type2='', inverse: bool = False) -> tuple:
+    """Best STAB multiplier against every typing in TYPINGS."""
+    rows = [OFFENSE_MATRIX[bool(inverse)][TYPE_INDEX[t]] for t in dict.fromkeys(((type1 or '').title(), (type2 or '').title())) if t in TYPE_INDEX]
+    if not rows:
+        return (1.0,) * N_TYPINGS
+    return rows[0] if len(rows) == 1 else tuple(map(max, *rows))
+
+def summarize_stab_coverage(type1, type2='', inverse: bool = False) -> dict:
+    cov = stab_coverage_vector(type1, type2, inverse)
+    return {
+        'se_types': [TYPINGS[i][0] for i in range(N_TYPES) if cov[i] >= 2.0],
+        'se_typings': sum(1 for v in cov if v >= 2.0),
+        'neutral_typings': sum(1 for v in cov if v == 1.0),
+        'resisted_typings': sum(1 for v in cov if 0.0 < v < 1.0),
+        'immune_typings': sum(1 for v in cov if v <= 0.0),
+        'walls': [typing_label(i) for i, v in enumerate(cov) if v < 1.0],
+    }
+
+_COVERAGE_SCORES: Dict[bool, list] = {}
+
+def stab_coverage_scores(inverse: bool = False) -> list:
+    """(super-effective, resisted, immune) typing counts for every attacker typing in TYPINGS; cached per chart."""
+    inv = bool(inverse)
+    if inv not in _COVERAGE_SCORES:
+        scores = []
+        for (a, b) in TYPINGS:
+            cov = stab_coverage_vector(a, b, inv)
+            scores.append((sum(1 for v in cov if v >= 2.0), sum(1 for v in cov if 0.0 < v < 1.0), sum(1 for v in cov if v <= 0.0)))
+        _COVERAGE_SCORES[inv] = scores
+    return _COVERAGE_SCORES[inv]
+
+def rank_stab_coverage(inverse: bool = False) -> list:
+    """Rank every species by its STAB coverage: scores are computed once per typing, then gathered per species.
+    Rows: (name, typing, SE typings, SE mono types, walled by, share of the dex hit SE %)."""
+    scores = stab_coverage_scores(inverse)
+    species_typing = species_typing_ids()
+    weights = [0] * N_TYPINGS
+    for ti in species_typing.values():
+        weights[ti] += 1
+    total = sum(weights) or 1
+    per_typing = {}
+    rows = []
+    for name, ti in species_typing.items():
+        if ti not in per_typing:
+            cov = stab_coverage_vector(*TYPINGS[ti], inverse=inverse)
+            se, res, imm = scores[ti]
+            per_typing[ti] = (typing_label(ti), se, sum(1 for v in cov[:N_TYPES] if v >= 2.0), res + imm,
+                              round(100.0 * sum(w for w, v in zip(weights, cov) if v >= 2.0) / total, 1))
+        rows.append((name,) + per_typing[ti])
+    rows.sort(key=lambda r: (-r[2], r[4], r[0]))
+    return rows
+
+# Matchups (fusion defending vs opponents' STAB), batched per opponent typing
+# (type slot of STAB 1, type slot of STAB 2) for every typing in TYPINGS; mono typings repeat their slot
+TYPING_TYPE_IDS = tuple((TYPE_INDEX[a], TYPE_INDEX[b or a]) for (a, b) in TYPINGS)
+_FUSED_DEFENSE_CACHE: Dict[tuple, tuple] = {}
+_THREAT_CACHE: Dict[tuple, tuple] = {}
+
+def fused_defense_vector(type1, type2='', active_ability=None, passive_ability=None, inverse: bool = False) -> tuple:
+    """Ability-aware damage-taken vector, cached per (typing, active, passive, inverse)."""
+    key = (typing_index(type1, type2), _normalize_ability(active_ability), _normalize_ability(passive_ability), bool(inverse))
+    vec = _FUSED_DEFENSE_CACHE.get(key)
+    if vec is None:
+        base = DEFENSE_BY_TYPING[key[3]][key[0]] if key[0] is not None else defense_vector(type1, type2, inverse)
+        vec = ability_context(active_ability, passive_ability).apply(base)
+        if key[0] is not None: _FUSED_DEFENSE_CACHE[key] = vec
+    return vec
+
+def stab_threat_vector(type1, type2='', active_ability=None, passive_ability=None, inverse: bool = False) -> tuple:
+    """Damage the defender takes from the stronger STAB of each of the 171 opponent typings (one pass, cached)."""
+    key = (typing_index(type1, type2), _normalize_ability(active_ability), _normalize_ability(passive_ability), bool(inverse))
+    threat = _THREAT_CACHE.get(key)
+    if threat is None:
+        d = fused_defense_vector(type1, type2, active_ability, passive_ability, inverse)
+        threat = tuple(d[a] if d[a] >= d[b] else d[b] for a, b in TYPING_TYPE_IDS)
+        if key[0] is not None: _THREAT_CACHE[key] = threat
+    return threat
+
+# Factorized engine: fused typing depends only on the parents' typings, the defensive profile only on the fused
+# typing and ability context, so full-space work joins these small tables instead of repeating per species pair.
+# compute_fused_typing prefers P2's second type, so the typing table is keyed by the 324 ordered typings
+# (18 mono + 306 ordered duals) rather than the 171 unordered TYPINGS.
+ORDERED_TYPINGS = tuple([(t, '') for t in TYPE_ORDER] + [(a, b) for a in TYPE_ORDER for b in TYPE_ORDER if a != b])
+N_ORDERED_TYPINGS = len(ORDERED_TYPINGS)
+ORDERED_TYPING_INDEX = {t: i for i, t in enumerate(ORDERED_TYPINGS)}
+ORDERED_TYPING_LABELS = tuple(f"{a}/{b}" if b else a for a, b in ORDERED_TYPINGS)
+ORDERED_TO_TYPING = array('B', (TYPING_INDEX[t] for t in ORDERED_TYPINGS))  # ordered -> TYPINGS index
+_FUSED_TYPING_TABLE: list = []
+_DEFENSE_MASKS: Dict[tuple, tuple] = {}
+
+def ordered_typing_index(type1, type2='') -> Optional[int]:
+    """Index into ORDERED_TYPINGS (order-sensitive); None for unknown types."""
+    t1 = (type1 or '').title(); t2 = (type2 or '').title()
+    return ORDERED_TYPING_INDEX.get((t1, '' if t2 == t1 else t2))
+
+def fused_typing_table() -> list:
+    """[P1 ordered typing][P2 ordered typing] -> fused ordered typing: compute_fused_typing for all 324×324 (built once)."""
+    if not _FUSED_TYPING_TABLE:
+        _FUSED_TYPING_TABLE[:] = [array('H', (ORDERED_TYPING_INDEX[compute_fused_typing(a[0], a[1], b[0], b[1])] for b in ORDERED_TYPINGS))
+                                  for a in ORDERED_TYPINGS]
+    return _FUSED_TYPING_TABLE
+
+def fused_typing_of(ta: tuple, tb: tuple) -> Optional[int]:
+    """Fused ORDERED_TYPINGS index for P1/P2 (Type_1, Type_2) tuples via the typing table; types outside the chart
+    go through compute_fused_typing (None when the fused typing is off the chart too)."""
+    ia = ORDERED_TYPING_INDEX.get(ta); ib = ORDERED_TYPING_INDEX.get(tb)
+    if ia is not None and ib is not None:
+        return fused_typing_table()[ia][ib]
+    return ordered_typing_index(*compute_fused_typing(ta[0], ta[1], tb[0], tb[1]))
+
+def fused_typing_index(ta: tuple, tb: tuple) -> Optional[int]:
+    """Like fused_typing_of(), as a TYPINGS index."""
+    oi = fused_typing_of(ta, tb)
+    return None if oi is None else ORDERED_TO_TYPING[oi]
+
+def fused_typing_label(ta: tuple, tb: tuple) -> str:
+    oi = fused_typing_of(ta, tb)
+    if oi is not None:
+        return ORDERED_TYPING_LABELS[oi]
+    ft = compute_fused_typing(ta[0], ta[1], tb[0], tb[1])
+    return ft[0] if not ft[1] else f"{ft[0]}/{ft[1]}"
+
+def defense_masks(ti: int, active: str = '', passive: str = '', inverse: bool = False) -> tuple:
+    """bucket_masks() of TYPINGS[ti] in an ability context (abilities by _effect_key), cached per context."""
+    key = (ti, active, passive, bool(inverse))
+    m = _DEFENSE_MASKS.get(key)
+    if m is None:
+        m = _DEFENSE_MASKS[key] = bucket_masks(fused_defense_vector(*TYPINGS[ti], active_ability=active, passive_ability=passive, inverse=key[3]))
+    return m
+
+def species_typing_ids() -> Dict[str, int]:
+    """name -> TYPINGS index for every species with a known typing (data cache)."""
+    ids = _DATA_CACHE.get('species_typing_ids')
+    if ids is None:
+        ids = {}
+        for n, s in pokemon_stats.items():
+            ti = typing_index(s.get('Type_1', ''), s.get('Type_2', ''))
+            if ti is not None: ids[n] = ti
+        _DATA_CACHE['species_typing_ids'] = ids
+    return ids
+
+def fused_typing_histogram() -> list:
+    """Number of ordered fusions (P1 != P2) producing each TYPINGS index, from per-typing species counts."""
+    hist = _DATA_CACHE.get('fused_typing_histogram')
+    if hist is None:
+        counts: Dict[tuple, int] = {}
+        for s in pokemon_stats.values():
+            k = (s.get('Type_1', ''), s.get('Type_2', '')); counts[k] = counts.get(k, 0) + 1
+        hist = [0] * N_TYPINGS
+        for a, ca in counts.items():
+            for b, cb in counts.items():
+                ti = fused_typing_index(a, b)
+                if ti is not None: hist[ti] += ca * (cb - 1) if a == b else ca * cb
+        _DATA_CACHE['fused_typing_histogram'] = hist
+    return hist
+
+def dex_matchups(type1, type2='', active_ability=None, passive_ability=None, inverse: bool = False) -> list:
+    """Rows (opponent, typing, worst STAB hit, STAB 1 ×, STAB 2 ×) for every species, via the cached threat vector."""
+    d = fused_defense_vector(type1, type2, active_ability, passive_ability, inverse)
+    threat = stab_threat_vector(type1, type2, active_ability, passive_ability, inverse)
+    rows = []
+    for name, ti in species_typing_ids().items():
+        a, b = TYPING_TYPE_IDS[ti]
+        rows.append((name, typing_label(ti), threat[ti], d[a], d[b] if b != a else ''))
+    return rows
+
+def fused_opponent_matchups(type1, type2='', active_ability=None, passive_ability=None, inverse: bool = False) -> list:
+    """Rows (opponent fused typing, worst STAB hit, fusions with that typing) over the whole ordered pair space."""
+    threat = stab_threat_vector(type1, type2, active_ability, passive_ability, inverse)
+    return [(typing_label(ti), threat[ti], n) for ti, n in enumerate(fused_typing_histogram()) if n]
+
+def matchup_bucket(v: float) -> str:
+    if v <= 0.0: return 'm_immune'
+    if v < 1.0: return 'm_resist'
+    if v < 2.0: return 'm_neutral'
+    if v < 4.0: return 'm_weak'
+    return 'm_weak4'
+
+STAT_KEYS = ('HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed')
+
+def fuse_pair(p1: str, p2: str, active_ability: str = '') -> dict:
+    """Fusion of two loaded species, no UI access: stats and BST as integer tenths, fused typing,
+    and the ability context (active defaults to P2's first ability; passive is P1's)."""
+    s1 = pokemon_stats[p1]; s2 = pokemon_stats[p2]
+    fusion_stats = {k: avg_tenths(s1[k], s2[k]) for k in STAT_KEYS}
+    fused_type1, fused_type2 = compute_fused_typing(s1['Type_1'], s1['Type_2'], s2['Type_1'], s2['Type_2'])
+    abilities = list(dict.fromkeys(s2['Abilities']))
+    return {'p1': p1, 'p2': p2, 'fused_type1': fused_type1, 'fused_type2': fused_type2,
+            'fusion_stats': fusion_stats, 'fused_bst': sum(fusion_stats.values()),
+            'active_ability': (active_ability or (abilities[0] if abilities else '')).strip(), 'passive_ability': s1['Passive']}
+
+def species_arrays() -> dict:
+    """Compact per-species columns in pokemon_stats order (data cache):
+    'names' list, 'row' name->row, 'stats' flat array('H') with 6 stats per row, 'typing' ordered (Type_1, Type_2)."""
+    arr = _DATA_CACHE.get('species_arrays')
+    if arr is None:
+        names = list(pokemon_stats)
+        stats = array('H', (int(pokemon_stats[n][k]) for n in names for k in STAT_KEYS))
+        arr = {'names': names, 'row': {n: i for i, n in enumerate(names)}, 'stats': stats,
+               'typing': [(pokemon_stats[n]['Type_1'], pokemon_stats[n]['Type_2']) for n in names]}
+        _DATA_CACHE['species_arrays'] = arr
+    return arr
+
+def species_classes() -> dict:
+    """Species grouped by exactly the fields the batch engine reads in each role (data cache). As P1 a species
+    contributes its six stats, typing and passive; as P2 its six stats, typing and first ability (the default
+    active); abilities count by type-chart effect. Per role ('p1', 'p2'): 'of' row -> class id and 'members' class
+    id -> rows in dex order. 'reduction' is ordered species pairs (P1 != P2) per class pair."""
+    cls = _DATA_CACHE.get('species_classes')
+    if cls is None:
+        sa = species_arrays(); names = sa['names']; st = sa['stats']; n = len(names)
+        cls = {}
+        for role, ability in (('p1', lambda s: s.get('Passive', '')), ('p2', lambda s: (s.get('Abilities') or [''])[0])):
+            ids: Dict[tuple, int] = {}; of = array('H'); members: list = []
+            for r, nm in enumerate(names):
+                c = ids.setdefault((tuple(st[r * 6:r * 6 + 6]), sa['typing'][r], _effect_key(ability(pokemon_stats[nm]))), len(ids))
+                if c == len(members): members.append([])
+                members[c].append(r); of.append(c)
+            cls[role] = {'of': of, 'members': [tuple(m) for m in members]}
+        cls['reduction'] = n * (n - 1) / max(1, len(cls['p1']['members']) * len(cls['p2']['members']))
+        _DATA_CACHE['species_classes'] = cls
+    return cls
+
+def evolution_families() -> dict:
+    """Evolution family graph (data cache): species linked by any shared 'evolution line' form one family.
+    'family' row -> family id; 'stages' family id -> ordered species rows; 'line' family id -> ordered entries
+    (a row, or the raw name when it isn't in the data); 'own' row -> that species' own evolution line as such
+    entries, for display; 'missing' unknown name -> species listing it."""
+    fam = _DATA_CACHE.get('evolution_families')
+    if fam is None:
+        sa = species_arrays(); names = sa['names']; row = sa['row']; n = len(names)
+        parent = list(range(n))
+        def find(r):
+            while parent[r] != r:
+                parent[r] = parent[parent[r]]; r = parent[r]
+            return r
+        lines = []; missing: Dict[str, list] = {}
+        for r, nm in enumerate(names):
+            parts = [p.strip() for p in (pokemon_stats[nm].get('evolution line') or '').split(',') if p.strip()]
+            lines.append([row.get(p, p) for p in parts])
+            for p in parts:
+                if p in row: parent[find(row[p])] = find(r)
+                else: missing.setdefault(p, []).append(nm)
+        fid_of_root: Dict[int, int] = {}; family = array('H', bytes(2 * n)); merged = []
+        for r in range(n):
+            fid = fid_of_root.setdefault(find(r), len(fid_of_root))
+            family[r] = fid
+            if fid == len(merged): merged.append({})
+            merged[fid].update(dict.fromkeys(lines[r]))
+        line = [tuple(m) for m in merged]
+        stages = [[e for e in ln if isinstance(e, int)] for ln in line]
+        for r in range(n):
+            if r not in stages[family[r]]: stages[family[r]].append(r)  # species no line mentions
+        fam = {'family': family, 'stages': [tuple(st) for st in stages], 'line': line, 'own': [tuple(ln) for ln in lines], 'missing': missing}
+        _DATA_CACHE['evolution_families'] = fam
+    return fam
+
+def family_of(name: str) -> list:
+    """Names of every stage in name's evolution family, in line order ([] for unknown species)."""
+    sa = species_arrays(); fam = evolution_families(); r = sa['row'].get(name)
+    return [] if r is None else [sa['names'][s] for s in fam['stages'][fam['family'][r]]]
+
+def family_grid(p1: str, p2: str) -> tuple:
+    """Every stage of P1's evolution family fused with every stage of P2's, in one pass: (P1 rows, P2 rows, cells)
+    with cells[i][j] = (fused typing label, fused BST tenths), or None where both stages are the same species."""
+    sa = species_arrays(); fam = evolution_families(); st = sa['stats']; typing = sa['typing']
+    left = fam['stages'][fam['family'][sa['row'][p1]]]; right = fam['stages'][fam['family'][sa['row'][p2]]]
+    sums = {r: sum(st[r * 6:r * 6 + 6]) for r in set(left) | set(right)}
+    cells = []
+    for a in left:
+        ta = typing[a]; sa_ = sums[a]; row = []
+        for b in right:
+            if a == b:
+                row.append(None); continue
+            row.append((fused_typing_label(ta, typing[b]), (sa_ + sums[b]) * 5))
+        cells.append(row)
+    return left, right, cells
+
+FUSION_RESULT_CACHE_SIZE = 2048   # fuse_pair() results kept for AsyncFusionEngine callers (least recently used go first)
+
+class FusionResultCache:
+    """Bounded LRU of fuse_pair() results keyed (p1, p2, active ability); thread-safe, counts hits and misses.
+    maxsize may be changed at any time; the next put() trims to it."""
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize; self.hits = self.misses = 0
+        self._items: 'OrderedDict[tuple, dict]' = OrderedDict(); self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key) -> Optional[dict]:
+        with self._lock:
+            f = self._items.get(key)
+            if f is None: self.misses += 1
+            else: self.hits += 1; self._items.move_to_end(key)
+            return f
+
+    def put(self, key, f: dict) -> dict:
+        with self._lock:
+            self._items[key] = f; self._items.move_to_end(key)
+            while len(self._items) > max(0, self.maxsize): self._items.popitem(last=False)
+        return f
+
+    def clear(self):
+        with self._lock: self._items.clear()
+
+    def stats(self) -> dict:
+        calls = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._items), 'maxsize': self.maxsize,
+                'hit_rate': round(self.hits / calls, 3) if calls else 0.0}
+
+_FUSION_RESULTS = FusionResultCache(FUSION_RESULT_CACHE_SIZE)  # cleared on every (re)load, like _DATA_CACHE
+
+def fusion_result(p1: str, p2: str, active_ability: str = '') -> dict:
+    """fuse_pair() through the bounded result cache (shared, read-only by convention)."""
+    key = (p1, p2, active_ability); f = _FUSION_RESULTS.get(key)
+    return f if f is not None else _FUSION_RESULTS.put(key, fuse_pair(p1, p2, active_ability))
+
+def pinned_fusion(p1: str, p2: str, active_ability: str = '') -> dict:
+    """Result for a Compare column. Pins live in their own store (data cache), so LRU eviction never drops one;
+    prune_pinned_fusions() prunes it."""
+    pins = _DATA_CACHE.setdefault('pinned_fusions', {}); key = (p1, p2, active_ability)
+    f = pins.get(key)
+    if f is None:
+        f = pins[key] = fusion_result(p1, p2, active_ability)
+    return f
+
+def prune_pinned_fusions(keep) -> None:
+    """Drop stored pin results whose key is not in keep."""
+    pins = _DATA_CACHE.get('pinned_fusions', {})
+    for key in [k for k in pins if k not in keep]: del pins[key]
+
+def compare_stat_rows(fusions, flip: bool = False) -> list:
+    """(row id, label, value per fusion) for typing, the six stats (Flip Stat applied) and BST with its delta vs column 1."""
+    rows = [('typing', STR['type'], [f['fused_type1'] if not f['fused_type2'] else f"{f['fused_type1']}/{f['fused_type2']}" for f in fusions])]
+    shown = [flip_stats_dict(f['fusion_stats']) if flip else f['fusion_stats'] for f in fusions]
+    rows += [(f"stat:{k}", k, [format_tenths(st[k]) for st in shown]) for k in STAT_KEYS]
+    rows.append(('bst', STR['total_bst'], [format_tenths(f['fused_bst']) for f in fusions]))
+    base = fusions[0]['fused_bst'] if fusions else 0
+    rows.append(('bst_delta', 'Δ ' + STR['total_bst'], [('+' if f['fused_bst'] > base else '') + format_tenths(f['fused_bst'] - base) for f in fusions]))
+    return rows
+
+def compare_defense_rows(fusions, passive_on: bool = True, inverse: bool = False) -> list:
+    """(row id, label, value per fusion) for defensive buckets and Quick Compare-style deltas vs column 1."""
+    masks = [bucket_masks(fused_defense_vector(f['fused_type1'], f['fused_type2'], f['active_ability'],
+                                              f['passive_ability'] if passive_on else None, inverse)) for f in fusions]
+    fmt = lambda m: ', '.join(mask_types(m)) or '—'
+    rows = [('imm', 'Immune', [fmt(m[0]) for m in masks]), ('res', 'Resists (≤½×)', [fmt(m[1]) for m in masks]),
+            ('weak', 'Weak (≥2×)', [fmt(m[2]) for m in masks]), ('weak4', 'Weak 4×', [fmt(m[3]) for m in masks])]
+    b = masks[0] if masks else (0, 0, 0, 0)
+    for rid, label, key, gained in (('new_imm', STR['new_imm'], 0, True), ('lost_imm', STR['lost_imm'], 0, False),
+                                     ('new_wk', STR['new_wk'], 2, True), ('lost_wk', STR['lost_wk'], 2, False),
+                                     ('new_res', STR['new_res'], 1, True), ('lost_res', STR['lost_res'], 1, False)):
+        rows.append((rid, label.strip().rstrip(':'), [fmt(m[key] & ~b[key] if gained else b[key] & ~m[key]) for m in masks]))
+    return rows
+
+def skyline(items, key) -> list:
+    """Sort-filter-skyline over 6-stat vectors: items whose key vector is not dominated by another item's.
+    Presorting by descending sum guarantees no later item can dominate an earlier one."""
+    window = []; wvecs = []
+    for it in sorted(items, key=lambda it: -sum(key(it))):
+        v0, v1, v2, v3, v4, v5 = v = key(it)
+        for w in wvecs:
+            if w[0] >= v0 and w[1] >= v1 and w[2] >= v2 and w[3] >= v3 and w[4] >= v4 and w[5] >= v5 and w != v:
+                break
+        else:
+            window.append(it); wvecs.append(v)
+    return window
+
+def _skyline_candidates(rows, vec) -> list:
+    """First two skyline layers of species rows. A partner in layer 3+ is dominated by two distinct
+    species (one per earlier layer), at least one of which can replace it in any pair, so only
+    layers 1-2 can appear in a non-dominated fusion."""
+    layer1 = skyline(rows, vec)
+    taken = set(layer1)
+    return layer1 + skyline([r for r in rows if r not in taken], vec)
+
+def pareto_fusions(p1: Optional[str] = None, fused_typing: Optional[int] = None) -> list:
+    """Non-dominated fusions over the six fused stats (P1 != P2), optionally for one P1 and/or one
+    fused typing (TYPINGS index, either order). Rows: (P1, P2, fused typing, HP..Speed, BST)."""
+    sa = species_arrays(); names = sa['names']; st = sa['stats']; typing = sa['typing']
+    vec = lambda r: tuple(st[r * 6:r * 6 + 6])
+    groups: Dict[tuple, list] = {}
+    for r, t in enumerate(typing): groups.setdefault(t, []).append(r)
+    if fused_typing is None:
+        # fused stats don't depend on typing: one group on each side
+        left = [sa['row'][p1]] if p1 in sa['row'] else _skyline_candidates(range(len(names)), vec)
+        blocks = [(left, _skyline_candidates(range(len(names)), vec))]
+    else:
+        cand = {t: _skyline_candidates(rs, vec) for t, rs in groups.items()}
+        p1_types = [typing[sa['row'][p1]]] if p1 in sa['row'] else list(groups)
+        blocks = []
+        for ta in p1_types:
+            for tb in groups:
+                if fused_typing_index(ta, tb) == fused_typing:
+                    blocks.append(([sa['row'][p1]] if p1 in sa['row'] else cand[ta], cand[tb]))
+    pairs = {(a, b) for left, right in blocks for a in left for b in right if a != b}
+    symmetric = fused_typing is None and p1 not in sa['row']
+    if symmetric:
+        # stats are symmetric in (P1, P2): solve over unordered pairs, then emit both orders
+        pairs = {(a, b) for (a, b) in pairs if a < b}
+    sums = {pr: tuple(x + y for x, y in zip(vec(pr[0]), vec(pr[1]))) for pr in pairs}
+    front = skyline(pairs, sums.__getitem__)
+    if symmetric:
+        front += [(b, a) for (a, b) in front]
+    rows = [fused_stat_row(a, b) for a, b in front]
+    rows.sort(key=lambda r: (-r[-1], r[0], r[1]))
+    return rows
+
+def fused_stat_row(a: int, b: int) -> tuple:
+    """(P1, P2, fused type, HP..Speed, BST) for species rows a, b; stats in integer tenths."""
+    sa = species_arrays(); st = sa['stats']; ta = sa['typing'][a]; tb = sa['typing'][b]
+    tenths = [(st[a * 6 + k] + st[b * 6 + k]) * 5 for k in range(6)]
+    return (sa['names'][a], sa['names'][b], fused_typing_label(ta, tb), *tenths, sum(tenths))
+
+# Fused stat constraints: fused = (a + b) / 2 exactly, so 'fused.X op v' given P1 bounds the partner: b op 2v - a
+FUSED_STAT_COLS = {'hp': 0, 'attack': 1, 'defense': 2, 'sp.atk': 3, 'spatk': 3, 'sp.def': 4, 'spdef': 4, 'speed': 5, 'bst': 6}
+FUSED_TOKEN_RE = re.compile(r'fused\.(hp|attack|defense|sp\.?atk|sp\.?def|speed|bst)\s*(<=|>=|==|=|<|>)\s*(\d+(?:\.\d+)?)$')
+
+def parse_fused_constraints(tokens) -> tuple:
+    """Split fused.* tokens into (constraints [(col, op, value)], unparsed tokens); col 6 is BST."""
+    constraints = []; bad = []
+    for t in tokens:
+        m = FUSED_TOKEN_RE.match(t)
+        if m: constraints.append((FUSED_STAT_COLS[m.group(1)], '=' if m.group(2) == '==' else m.group(2), float(m.group(3))))
+        else: bad.append(t)
+    return constraints, bad
+
+def stat_sorted_index() -> list:
+    """Per column (6 stats + stat total): (sorted values, species rows in that order) (data cache)."""
+    idx = _DATA_CACHE.get('stat_sorted_index')
+    if idx is None:
+        sa = species_arrays(); st = sa['stats']; n = len(sa['names'])
+        cols = [[st[r * 6 + k] for r in range(n)] for k in range(6)]
+        cols.append([sum(st[r * 6:r * 6 + 6]) for r in range(n)])
+        idx = []
+        for col in cols:
+            order = sorted(range(n), key=col.__getitem__)
+            idx.append(([col[r] for r in order], order, col))
+        _DATA_CACHE['stat_sorted_index'] = idx
+    return idx
+
+def fused_percentiles(p1: str, p2: str) -> dict:
+    """Mid-rank percentile (0–100) of each fused stat and the BST among every fusion sharing P1 ('p1') and every
+    fusion sharing P2 ('p2'). With one parent fixed, fused = (fixed + partner) / 2 orders exactly like the partner's
+    base stat, so each value is two bisects in stat_sorted_index(); the fixed species is not its own partner."""
+    sa = species_arrays(); idx = stat_sorted_index(); a = sa['row'][p1]; b = sa['row'][p2]
+    out: Dict[str, dict] = {'p1': {}, 'p2': {}}
+    for key, fixed, partner in (('p1', a, b), ('p2', b, a)):
+        for k, label in enumerate(STAT_KEYS + ('BST',)):
+            vals, _order, col = idx[k]; x = col[partner]; own = col[fixed]
+            below = bisect_left(vals, x); ties = bisect_right(vals, x) - below
+            if own < x: below -= 1
+            elif own == x: ties -= 1
+            out[key][label] = 100.0 * (below + 0.5 * ties) / max(1, len(vals) - 1)
+    return out
+
+def fused_stat_histogram(fixed: str, col: int, bins: int = 24) -> tuple:
+    """(bin edges, counts) of fused column col (6 = BST, values in tenths) over every partner of `fixed`.
+    A fused edge e maps back to the partner value ceil(e / 5) - own, so each bin costs one bisect."""
+    vals, _order, colv = stat_sorted_index()[col]; own = colv[species_arrays()['row'][fixed]]
+    lo = (own + vals[0]) * 5; hi = (own + vals[-1]) * 5
+    step = max(1, -(-(hi - lo + 1) // bins))
+    edges = list(range(lo, hi + step + 1, step))
+    cuts = [bisect_left(vals, -(-e // 5) - own) for e in edges]
+    counts = [cuts[i + 1] - cuts[i] for i in range(len(edges) - 1)]
+    counts[(own * 10 - lo) // step] -= 1
+    return edges, counts
+
+def _bound_range(vals: list, op: str, x: float) -> tuple:
+    if op == '>=': return bisect_left(vals, x), len(vals)
+    if op == '>': return bisect_right(vals, x), len(vals)
+    if op == '<=': return 0, bisect_right(vals, x)
+    if op == '<': return 0, bisect_left(vals, x)
+    return bisect_left(vals, x), bisect_right(vals, x)
+
+def search_fused_constraints(constraints, p1_rows=None, p2_rows=None):
+    """Yield (P1 row, P2 row), P1 != P2, whose fused stats meet every constraint. Partners are found once per P1
+    class (species_classes()) and reused by its other members; only the partners inside the tightest bound's range
+    of the per-stat sorted index are visited."""
+    idx = stat_sorted_index(); n = len(idx[0][1])
+    allowed = None if p2_rows is None else set(p2_rows)
+    ops = {'>=': operator.ge, '>': operator.gt, '<=': operator.le, '<': operator.lt, '=': operator.eq}
+    cls = species_classes()['p1']; class_of = cls['of']; members = cls['members']
+    memo: Dict[int, list] = {}  # P1 class -> matching partners, for classes with more than one member
+    for a in (range(n) if p1_rows is None else p1_rows):
+        c = class_of[a]; matched = memo.get(c)
+        if matched is None:
+            matched = _fused_partners(idx, constraints, a, allowed, ops)
+            if len(members[c]) > 1: memo[c] = matched
+        for b in matched:
+            if b != a: yield a, b
+
+def _fused_partners(idx: list, constraints, a: int, allowed, ops: dict) -> list:
+    """Every partner row (a itself included) of P1 row a meeting the constraints, in index order."""
+    bounds = []
+    for col, op, v in constraints:
+        vals, order, colvals = idx[col]
+        x = 2.0 * v - colvals[a]
+        lo, hi = _bound_range(vals, op, x)
+        bounds.append((hi - lo, lo, hi, order, colvals, ops[op], x))
+    if not bounds:
+        partners = range(len(idx[0][1]))
+    else:
+        bounds.sort(key=lambda bd: bd[0])
+        size, lo, hi, order, _c, _o, _x = bounds[0]
+        if size <= 0: return []
+        partners = order[lo:hi]
+    rest = bounds[1:]
+    return [b for b in partners if (allowed is None or b in allowed)
+            and all(cmp(colvals[b], x) for _s, _l, _h, _o, colvals, cmp, x in rest)]
+
+def filter_rows(query: str) -> Optional[list]:
+    """Species rows matching a search query (fused.* tokens ignored); None when the query is empty."""
+    tokens = [t for t in filter_tokens(query) if not t.startswith('fused.')]
+    if not tokens:
+        return None
+    sa = species_arrays()
+    return [sa['row'][n] for n, st in pokemon_stats.items() if match_filter_tokens(n, st, tokens)]
+
+def ensure_data_loaded() -> int:
+    """Load pokemon_data.csv if nothing is loaded yet (scripts importing the module); returns the species count."""
+    if not pokemon_stats:
+        load_pokemon_data_into(pokemon_stats); log_dataset_summary()
+    return len(pokemon_stats)
+
+def iter_fusions(p1_filter: str = '', p2_filter: str = '', where=None, active_ability: str = '',
+                 passive_on: bool = True, flip: bool = False, inverse: bool = False):
+    """Lazily yield every fusion (P1 != P2) as a dict shaped like _FUSION_CACHE (fuse_pair() plus passive_on/flip_on/
+    inverse_on). p1_filter/p2_filter use the Search Filter syntax; `where` is fused.* tokens, a predicate on the
+    result dict, or a list of either (fused.* tokens in the side filters count as `where` too).
+    Everything that can be pushed down is: each side's tokens narrow its candidate rows once, and fused.* bounds
+    select partners through the sorted stat index before any pair is built; predicates run last, on one result at a
+    time. Memory is bounded by per-P1 partner lists, not by how many results are consumed, and closing the
+    generator stops all work."""
+    ensure_data_loaded()
+    clauses = list(where) if isinstance(where, (list, tuple)) else [where] if where is not None else []
+    tokens = [t for q in (p1_filter, p2_filter) for t in filter_tokens(q) if t.startswith('fused.')]
+    preds = []
+    for c in clauses:
+        if callable(c): preds.append(c)
+        else: tokens += filter_tokens(c)
+    constraints, bad = parse_fused_constraints(tokens)
+    if bad:
+        raise ValueError(STR['fused_filter_bad'].format(' '.join(bad)))
+    names = species_arrays()['names']; extra = {'passive_on': bool(passive_on), 'flip_on': bool(flip), 'inverse_on': bool(inverse)}
+    for a, b in search_fused_constraints(constraints, filter_rows(p1_filter), filter_rows(p2_filter)):
+        f = fuse_pair(names[a], names[b], active_ability); f.update(extra)
+        if all(p(f) for p in preds):
+            yield f
+
+# Async facade for event-loop callers (bots): asyncio is imported on first use, it costs ~50 ms of startup otherwise
+ASYNC_MAX_CONCURRENCY = 4   # engine jobs running at once per AsyncFusionEngine
+
+class AsyncFusionEngine:
+    """asyncio facade over the engine. fuse()/fuse_many() return _FUSION_CACHE-shaped dicts through the shared
+    fusion_result() cache; search() runs iter_fusions() as one job. Every uncached computation runs in `executor`
+    (the loop's default thread pool when None), at most max_concurrency at a time, and identical in-flight requests
+    (same pair and ability context, or same search) are coalesced into one job. A shared job belongs to no caller:
+    it keeps running while anyone still waits on it and is cancelled only when its last waiter is. Share one
+    instance between handlers."""
+    def __init__(self, max_concurrency: int = ASYNC_MAX_CONCURRENCY, executor=None):
+        self.max_concurrency = max(1, int(max_concurrency)); self.executor = executor
+        self._sem = None; self._inflight: Dict[tuple, Any] = {}; self._waiters: Dict[Any, int] = {}
+        self.stats = {'computed': 0, 'cached': 0, 'coalesced': 0, 'jobs': 0}
+
+    async def _run(self, fn, *args):
+        import asyncio
+        if self._sem is None: self._sem = asyncio.Semaphore(self.max_concurrency)
+        async with self._sem:
+            self.stats['jobs'] += 1
+            return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    def _start(self, keys, fn, *args):
+        """Shared task running fn(*args) through _run(), registered in flight under every key until it finishes."""
+        import asyncio
+        task = asyncio.ensure_future(self._run(fn, *args))
+        for key in keys: self._inflight[key] = task
+        def done(t, keys=tuple(keys)):
+            for key in keys:
+                if self._inflight.get(key) is t: del self._inflight[key]
+            if not t.cancelled(): t.exception()  # waiters re-raise it; don't log as unretrieved
+        task.add_done_callback(done)
+        return task
+
+    def _join(self, task):
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+
+    def _leave(self, task):
+        """Drop one waiter; the job is cancelled only when its last waiter leaves before it finishes."""
+        n = self._waiters.pop(task) - 1
+        if n: self._waiters[task] = n
+        elif not task.done():
+            for key in [k for k, t in self._inflight.items() if t is task]: del self._inflight[key]  # newcomers start afresh
+            task.cancel()
+
+    async def _share(self, task):
+        """Await a shared job; a cancelled waiter only detaches from it."""
+        import asyncio
+        self._join(task)
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._leave(task)
+
+    async def _coalesced(self, key, fn, *args):
+        task = self._inflight.get(key)
+        if task is None: task = self._start([key], fn, *args)
+        else: self.stats['coalesced'] += 1
+        return await self._share(task)
+
+    async def ensure_data(self) -> int:
+        if pokemon_stats: return len(pokemon_stats)
+        return await self._coalesced(('data',), ensure_data_loaded)
+
+    async def fuse(self, p1: str, p2: str, active_ability: str = '', passive_on: bool = True, flip: bool = False, inverse: bool = False) -> dict:
+        return (await self.fuse_many([(p1, p2)], active_ability, passive_on, flip, inverse))[0]
+
+    async def fuse_many(self, pairs, active_ability: str = '', passive_on: bool = True, flip: bool = False, inverse: bool = False) -> list:
+        """Fusions for (P1, P2) name pairs, in order. Unknown species raise KeyError before anything is computed."""
+        import asyncio
+        pairs = list(pairs); await self.ensure_data()
+        bad = [p for pr in pairs for p in pr if p not in pokemon_stats]
+        if bad: raise KeyError(bad[0])
+        got: Dict[tuple, dict] = {}; jobs: Dict[Any, list] = {}; mine = []; seen = set()
+        for p1, p2 in pairs:
+            key = (p1, p2, active_ability)
+            if key in seen: continue
+            seen.add(key)
+            f = _FUSION_RESULTS.get(key)
+            if f is not None:
+                got[key] = f; self.stats['cached'] += 1; continue
+            task = self._inflight.get(key)
+            if task is None: mine.append(key); continue
+            self.stats['coalesced'] += 1; jobs.setdefault(task, []).append(key)
+        if mine:
+            self.stats['computed'] += len(mine)
+            jobs[self._start(mine, lambda: {k: _FUSION_RESULTS.put(k, fuse_pair(*k)) for k in mine})] = mine
+        for task in jobs: self._join(task)
         try:
-            count = challenges_menu.index('end') or -1
+            for task, keys in jobs.items():
+                res = await asyncio.shield(task)
+                for key in keys: got[key] = res[key]
+        finally:
+            for task in jobs: self._leave(task)
+        extra = {'passive_on': bool(passive_on), 'flip_on': bool(flip), 'inverse_on': bool(inverse)}
+        return [dict(got[(p1, p2, active_ability)], **extra) for p1, p2 in pairs]
+
+    async def search(self, p1_filter: str = '', p2_filter: str = '', where=None, limit: Optional[int] = None, active_ability: str = '',
+                     passive_on: bool = True, flip: bool = False, inverse: bool = False) -> list:
+        """iter_fusions() results (up to limit) computed as one executor job. Coalesced callers share the result list;
+        searches with predicates in `where` are never coalesced."""
+        await self.ensure_data()
+        job = lambda: list(itertools.islice(iter_fusions(p1_filter, p2_filter, where, active_ability, passive_on, flip, inverse), limit))
+        clauses = where if isinstance(where, (list, tuple)) else [where]
+        if any(callable(c) for c in clauses):
+            return await self._run(job)
+        return await self._coalesced(('search', p1_filter, p2_filter, tuple(clauses), limit, active_ability, bool(passive_on), bool(flip), bool(inverse)), job)
+
+# Nearest fused spreads: fused = (a + b) / 2, so |fused - t| = |b - (2t - a)| / 2 and the closest fusions for a
+# fixed P1 are the nearest base spreads to q = 2t - a. One KD-tree over the 1452 base spreads serves every P1.
+KNN_LEAF = 8
+
+def _kd_build(points: list, rows: list) -> tuple:
+    """Static KD-tree: (axis, split, low, high) nodes, split on the widest axis at the median; leaves are (-1, 0, rows, None)."""
+    if len(rows) <= KNN_LEAF: return (-1, 0, rows, None)
+    spans = [max(points[r][k] for r in rows) - min(points[r][k] for r in rows) for k in range(6)]
+    ax = spans.index(max(spans)); rows = sorted(rows, key=lambda r: points[r][ax]); m = len(rows) // 2
+    return (ax, points[rows[m]][ax], _kd_build(points, rows[:m]), _kd_build(points, rows[m:]))
+
+def stat_kdtree(normalize: bool = False) -> dict:
+    """Base spreads as 6-D points (scaled by 1/σ per stat when normalize), their bounding box and KD-tree (data cache)."""
+    key = 'stat_kdtree_norm' if normalize else 'stat_kdtree'
+    kd = _DATA_CACHE.get(key)
+    if kd is None:
+        sa = species_arrays(); st = sa['stats']; n = len(sa['names'])
+        scale = [1.0] * 6
+        if normalize:
+            for k in range(6):
+                col = st[k::6]; mean = sum(col) / n
+                scale[k] = 1.0 / max(1e-9, (sum((v - mean) ** 2 for v in col) / n) ** 0.5)
+        points = [tuple(st[r * 6 + k] * scale[k] for k in range(6)) for r in range(n)]
+        box = [(min(p[k] for p in points), max(p[k] for p in points)) for k in range(6)]
+        kd = _DATA_CACHE[key] = {'scale': scale, 'points': points, 'box': box, 'tree': _kd_build(points, list(range(n)))}
+    return kd
+
+def _kd_search(tree: tuple, points: list, q: tuple, a: int, heap: list, k: int, ok=None):
+    """Push partners b of P1 row a nearer to q than the current k-th best into heap ((-d², a, b) max-heap)."""
+    stack = [(0.0, tree)]
+    while stack:
+        bound, node = stack.pop()
+        if len(heap) >= k and bound >= -heap[0][0]: continue
+        ax, split, lo, hi = node
+        if ax < 0:
+            for b in lo:
+                if b == a or (ok is not None and not ok(b)): continue
+                p = points[b]; d = 0.0
+                for x, y in zip(p, q): d += (x - y) * (x - y)
+                if len(heap) < k: heapq.heappush(heap, (-d, a, b))
+                elif d < -heap[0][0]: heapq.heapreplace(heap, (-d, a, b))
+            continue
+        diff = q[ax] - split
+        near, far = (lo, hi) if diff < 0 else (hi, lo)
+        stack.append((max(bound, diff * diff), far)); stack.append((bound, near))
+
+def nearest_fusions(target, k: int = 25, normalize: bool = False, fused_typing: Optional[int] = None, exclude=()) -> list:
+    """The k fusions (P1 != P2) whose fused spread is closest to target (HP..Speed in base units), as
+    (distance, P1 row, P2 row) nearest first. Distance is Euclidean in fused units (σ units when normalize).
+    P1s are visited by their bounding-box lower bound and the search stops once none can beat the k-th best;
+    fused_typing (TYPINGS index) restricts partners per P1 typing."""
+    kd = stat_kdtree(normalize); points = kd['points']; box = kd['box']; scale = kd['scale']
+    typing = species_arrays()['typing']; exclude = set(exclude)
+    t2 = [2.0 * float(v) * s for v, s in zip(target, scale)]
+    order = []
+    for a, pa in enumerate(points):
+        q = tuple(x - y for x, y in zip(t2, pa))
+        lb = sum((lo - x) ** 2 if x < lo else (x - hi) ** 2 if x > hi else 0.0 for x, (lo, hi) in zip(q, box))
+        order.append((lb, a, q))
+    order.sort(key=lambda o: o[0])
+    allowed: Dict[tuple, frozenset] = {}
+    heap: list = []
+    for lb, a, q in order:
+        if len(heap) >= k and lb >= -heap[0][0]: break
+        ok = None
+        if fused_typing is not None:
+            ta = typing[a]
+            if ta not in allowed:
+                allowed[ta] = frozenset(tb for tb in set(typing) if fused_typing_index(ta, tb) == fused_typing)
+            if not allowed[ta]: continue
+            ok = lambda b, s=allowed[ta]: typing[b] in s
+        if exclude:
+            ok = (lambda b, a=a, f=ok: (a, b) not in exclude and (f is None or f(b)))
+        _kd_search(kd['tree'], points, q, a, heap, k, ok)
+    return sorted(((-d) ** 0.5 / 2.0, a, b) for d, a, b in heap)
+
+MATCHUP_COLORS = {'m_immune': '#b7e1cd', 'm_resist': '#d9f0e3', 'm_neutral': '#ffffff', 'm_weak': '#fde2c8', 'm_weak4': '#f8b4b4'}
+
+def bucket_masks(vec) -> tuple:
+    """(immune, resist ≤½×, weak ≥2×, weak 4×) bitmasks over TYPE_ORDER, same thresholds as Quick Compare."""
+    imm = res = weak = weak4 = 0
+    for i, v in enumerate(vec):
+        if v <= 0.0: imm |= 1 << i
+        elif v <= 0.5: res |= 1 << i
+        elif v >= 2.0:
+            weak |= 1 << i
+            if v >= 4.0: weak4 |= 1 << i
+    return imm, res, weak, weak4
+
+def mask_types(mask: int) -> list:
+    return [t for i, t in enumerate(TYPE_ORDER) if (mask >> i) & 1]
+
+def partner_impact(p1: str, baseline: str = 'p2', inverse: bool = False, passive_on: bool = True) -> dict:
+    """Quick Compare for P1 against every partner in one pass. Each partner uses its first ability as active (P1's
+    passive when passive_on); fused and baseline (unfused P1 or P2, no abilities) typings are bucketed once per
+    distinct (typing, ability) context and broadcast. In the fusion table's context (Passive on, normal chart) the
+    fused masks are read from P1's row of an open table instead. Columns: 'rows', 'fused_type', and 'fused'/'base' (imm, res, weak, weak4) masks."""
+    sa = species_arrays(); names = sa['names']; typing = sa['typing']; a = sa['row'][p1]; ta = typing[a]
+    passive = _effect_key(pokemon_stats[p1].get('Passive', '')) if passive_on else ''
+    fused_of: Dict[tuple, tuple] = {}; base_of: Dict[tuple, tuple] = {}
+    out = {'rows': [], 'fused': [], 'base': [], 'fused_type': []}
+    p1_base = bucket_masks(fused_defense_vector(ta[0], ta[1], None, None, inverse))
+    tbl = open_fusion_table() if passive_on and not inverse else None  # the table holds exactly this context
+    cells = list(zip(*(tbl.partners(k, a) for k in ('typing', 'imm', 'res', 'weak', 'weak4')))) if tbl is not None else None
+    labels: Dict[tuple, str] = {}
+    for b, tb in enumerate(typing):
+        if b == a: continue
+        if cells is not None and cells[b][0] != NO_TYPING:
+            label = labels.get(tb)
+            if label is None: label = labels[tb] = fused_typing_label(ta, tb)
+            m = (label, cells[b][1:])
+        else:
+            active = _effect_key((pokemon_stats[names[b]].get('Abilities') or [''])[0])
+            m = fused_of.get((tb, active))
+            if m is None:
+                ti = fused_typing_index(ta, tb)
+                if ti is not None:
+                    m = (fused_typing_label(ta, tb), defense_masks(ti, active, passive, inverse))
+                else:
+                    ft = compute_fused_typing(ta[0], ta[1], tb[0], tb[1])
+                    m = (fused_typing_label(ta, tb), bucket_masks(fused_defense_vector(ft[0], ft[1], active, passive, inverse)))
+                fused_of[(tb, active)] = m
+        if baseline == 'p1':
+            base = p1_base
+        else:
+            base = base_of.get(tb)
+            if base is None: base = base_of[tb] = bucket_masks(fused_defense_vector(tb[0], tb[1], None, None, inverse))
+        out['rows'].append(b); out['fused_type'].append(m[0]); out['fused'].append(m[1]); out['base'].append(base)
+    return out
+
+def partner_impact_rows(impact: dict, gain_imm: Optional[str] = None, drop_weak: Optional[str] = None, no_new_weak4: bool = False) -> list:
+    """Filter partner_impact() with bit tests against the baseline masks (no_new_weak4 keeps partners whose fusion
+    has no 4× weakness the baseline lacks). Rows: (P2, fused type, gained immunities, lost weaknesses,
+    gained weaknesses, 4× weaknesses, 'gained − lost weaknesses' net)."""
+    names = species_arrays()['names']
+    gi = 1 << TYPE_INDEX[gain_imm] if gain_imm else 0; dw = 1 << TYPE_INDEX[drop_weak] if drop_weak else 0
+    rows = []
+    for b, ft, (imm, _res, weak, weak4), (bimm, _bres, bweak, bweak4) in zip(impact['rows'], impact['fused_type'], impact['fused'], impact['base']):
+        new_imm = imm & ~bimm; lost_wk = bweak & ~weak; new_wk = weak & ~bweak
+        if (gi and not new_imm & gi) or (dw and not lost_wk & dw) or (no_new_weak4 and weak4 & ~bweak4):
+            continue
+        rows.append((names[b], ft, ', '.join(mask_types(new_imm)), ', '.join(mask_types(lost_wk)), ', '.join(mask_types(new_wk)),
+                     ', '.join(mask_types(weak4)), bin(new_wk).count('1') - bin(lost_wk).count('1')))
+    return rows
+
+# Roster planner: fusions restricted to the species you own in a run
+ROSTER_CUTOFF = 0.75  # difflib ratio needed to auto-correct a roster name
+ROSTER_NAME_COLUMNS = ('name', 'pokemon', 'species')
+
+def read_roster_file(path: str) -> list:
+    """Species names from a roster file. CSV files use a name/pokemon/species column (else the first column);
+    anything else is one name per line or comma-separated. Blank entries and '#' comments are skipped."""
+    with open(path, 'r', encoding='utf-8-sig') as f: text = f.read()
+    if path.lower().endswith('.csv'):
+        rows = [r for r in csv.reader(text.splitlines()) if r and not r[0].lstrip().startswith('#')]
+        head = [c.strip().lower() for c in rows[0]] if rows else []
+        col = next((head.index(c) for c in ROSTER_NAME_COLUMNS if c in head), None)
+        if col is not None: rows = rows[1:]
+        names = [r[col or 0] for r in rows if len(r) > (col or 0)]
+    else:
+        names = [n for ln in text.splitlines() if not ln.lstrip().startswith('#') for n in ln.split(',')]
+    return [n.strip() for n in names if n.strip()]
+
+def resolve_roster(names) -> tuple:
+    """(resolved names in order without duplicates, {given: corrected}, [unknown]). Exact match first, then
+    case-insensitive, then the closest dataset name by difflib ratio (>= ROSTER_CUTOFF)."""
+    lower = _DATA_CACHE.get('names_lower')
+    if lower is None: lower = _DATA_CACHE['names_lower'] = {n.lower(): n for n in pokemon_stats}
+    resolved: list = []; corrections: Dict[str, str] = {}; unknown: list = []
+    for given in names:
+        name = given if given in pokemon_stats else lower.get(given.lower())
+        if name is None:
+            close = difflib.get_close_matches(given.lower(), list(lower), n=1, cutoff=ROSTER_CUTOFF)
+            if not close: unknown.append(given); continue
+            name = corrections[given] = lower[close[0]]
+        elif name != given: corrections[given] = name
+        if name not in resolved: resolved.append(name)
+    return resolved, corrections, unknown
+
+class RosterPlan:
+    """Every ordered fusion within a roster as a ROSTER_COLUMNS row (fused_stat_row + Weak/4× weak/Immune/Resists
+    counts in the default ability context). add()/remove() only touch the 2·n pairs of the changed species;
+    defensive counts come from an open fusion table when Passive is on and the chart is normal (its context), else
+    they are memoized per (fused typing, active, passive)."""
+    def __init__(self, names=(), inverse: bool = False, passive_on: bool = True):
+        self.inverse = bool(inverse); self.passive_on = bool(passive_on)
+        self.members: list = []  # species rows, insertion order
+        self.pairs: Dict[tuple, tuple] = {}  # (p1 row, p2 row) -> row
+        self._ctx: Dict[int, tuple] = {}; self._def: Dict[tuple, tuple] = {}
+        self.add(names)
+
+    def names(self) -> list:
+        names = species_arrays()['names']
+        return [names[a] for a in self.members]
+
+    def _row(self, a: int, b: int) -> tuple:
+        row = fused_stat_row(a, b)
+        tbl = open_fusion_table() if self.passive_on and not self.inverse else None  # the table's ability context
+        if tbl is not None:
+            cell = tbl.lookup(a, b, ('typing', 'weak', 'weak4', 'imm', 'res'))
+            if cell['typing'] != NO_TYPING:
+                return row + tuple(bin(cell[k]).count('1') for k in ('weak', 'weak4', 'imm', 'res'))
+        key = (row[2], self._ctx[b][0], self._ctx[a][1])
+        counts = self._def.get(key)
+        if counts is None:
+            t1, _, t2 = row[2].partition('/')
+            imm, res, weak, weak4 = bucket_masks(fused_defense_vector(t1, t2, key[1], key[2], self.inverse))
+            counts = self._def[key] = (bin(weak).count('1'), bin(weak4).count('1'), bin(imm).count('1'), bin(res).count('1'))
+        return row + counts
+
+    def add(self, names) -> int:
+        """Add species by exact name; returns how many were new."""
+        sa = species_arrays(); added = 0
+        for name in names:
+            a = sa['row'].get(name)
+            if a is None or a in self._ctx: continue
+            s = pokemon_stats[name]
+            self._ctx[a] = (_effect_key((s.get('Abilities') or [''])[0]), _effect_key(s.get('Passive', '')) if self.passive_on else '')
+            for b in self.members:
+                self.pairs[(a, b)] = self._row(a, b); self.pairs[(b, a)] = self._row(b, a)
+            self.members.append(a); added += 1
+        return added
+
+    def remove(self, names) -> int:
+        row = species_arrays()['row']; gone = {row[n] for n in names if row.get(n) in self._ctx}
+        for a in gone:
+            del self._ctx[a]; self.members.remove(a)
+            for b in self.members: del self.pairs[(a, b)], self.pairs[(b, a)]
+        return len(gone)
+
+    def rows(self) -> list:
+        """Ranked by fused BST, then fewest weaknesses."""
+        return sorted(self.pairs.values(), key=lambda r: (-r[9], r[10], r[0], r[1]))
+
+# Precomputed fusion table: every ordered pair (row = P1 * n + P2) stored column by column so each column
+# can be mmap'd and viewed zero-copy. Stats are fixed-point tenths; masks use the default ability context
+# (P2's first ability active, P1's passive on, normal chart). Rebuilt whenever the CSV or data version changes.
+FUSION_TABLE_FORMAT = 1
+FUSION_TABLE_MAGIC = b'FCTB'
+FUSION_TABLE_COLUMNS = (('hp', 'H'), ('attack', 'H'), ('defense', 'H'), ('sp_atk', 'H'), ('sp_def', 'H'), ('speed', 'H'),
+                        ('bst', 'H'), ('typing', 'B'), ('imm', 'I'), ('res', 'I'), ('weak', 'I'), ('weak4', 'I'))
+NO_TYPING = 255
+
+def data_fingerprint() -> dict:
+    """Identity of the loaded dataset: table format, data_version.txt and the CSV's SHA-256 (data cache)."""
+    fp = _DATA_CACHE.get('data_fingerprint')
+    if fp is None:
+        try:
+            with open(DATA_VERSION_PATH, 'r', encoding='utf-8') as f: version = f.read().strip()
+        except OSError:
+            version = ''
+        with open(DATA_CSV_PATH, 'rb') as f: sha = hashlib.sha256(f.read()).hexdigest()
+        fp = {'format': FUSION_TABLE_FORMAT, 'data_version': version, 'csv_sha256': sha}
+        _DATA_CACHE['data_fingerprint'] = fp
+    return fp
+
+def _effect_key(ability: str) -> str:
+    # abilities without type-chart effects all share one context
+    a = _normalize_ability(ability)
+    return a if a in COMPILED_ABILITIES else ''
+
+def fusion_table_inputs() -> dict:
+    """Everything build_fusion_table() reads from the shared caches, gathered up front: the fingerprint, species
+    columns and classes, the typing table, and the compiled ability context of every (P2 first ability, P1 passive)
+    effect pair. The startup warm-up calls this on the Tk thread, so its worker never reads or fills a shared cache."""
+    sa = species_arrays(); names = sa['names']
+    act = [_effect_key((pokemon_stats[nm].get('Abilities') or [''])[0]) for nm in names]
+    pas = [_effect_key(pokemon_stats[nm].get('Passive', '')) for nm in names]
+    return {'fingerprint': data_fingerprint(), 'arrays': sa, 'classes': species_classes(), 'typing_table': fused_typing_table(),
+            'act': act, 'pas': pas, 'contexts': {(x, y): ability_context(x, y) for x in set(act) for y in set(pas)}}
+
+def build_fusion_table(path: str = FUSION_TABLE_PATH, inputs: Optional[dict] = None) -> dict:
+    """Compute every ordered pair column by column and write the table atomically. Returns its header.
+    Work runs over species_classes() pairs: a P1 row is computed once per P1 class (members reuse it) and its
+    typing/defense cells once per P2 class, then expanded to species. Typing cells are joins of the typing table;
+    defense cells are defense_masks() values memoized locally from the prepared ability contexts, so a build with
+    `inputs` from fusion_table_inputs() touches no shared cache and can run off the Tk thread."""
+    t0 = time.perf_counter()
+    inputs = inputs or fusion_table_inputs()
+    sa = inputs['arrays']; names = sa['names']; st = sa['stats']; n = len(names)
+    typings = sa['typing']; table = inputs['typing_table']; oti = [ORDERED_TYPING_INDEX.get(t) for t in typings]
+    def off_chart(ta, tb):
+        oi = ordered_typing_index(*compute_fused_typing(ta[0], ta[1], tb[0], tb[1]))
+        return NO_TYPING if oi is None else ORDERED_TO_TYPING[oi]
+    act = inputs['act']; pas = inputs['pas']; contexts = inputs['contexts']; masks: Dict[tuple, tuple] = {}
+    def cell_masks(ti, a_key, p_key):
+        key = (ti, a_key, p_key); m = masks.get(key)
+        if m is None:
+            m = masks[key] = bucket_masks(contexts[(a_key, p_key)].apply(DEFENSE_BY_TYPING[False][ti]))
+        return m
+    cls = inputs['classes']; p1_of = cls['p1']['of']; p1_members = cls['p1']['members']
+    p2_of = cls['p2']['of']; p2_reps = [m[0] for m in cls['p2']['members']]
+    cols = {name: array(code) for name, code in FUSION_TABLE_COLUMNS}
+    stat_cols = [[st[r * 6 + k] for r in range(n)] for k in range(6)]
+    sums = [sum(st[r * 6:r * 6 + 6]) for r in range(n)]
+    done: Dict[int, dict] = {}  # P1 class -> finished row, held until its last member is written
+    for a in range(n):
+        c = p1_of[a]; row = done.get(c)
+        if row is None:
+            row = {}
+            for k, key in enumerate(('hp', 'attack', 'defense', 'sp_atk', 'sp_def', 'speed')):
+                va = stat_cols[k][a]
+                row[key] = array('H', [(va + vb) * 5 for vb in stat_cols[k]])
+            sa_ = sums[a]; row['bst'] = array('H', [(sa_ + sb) * 5 for sb in sums])
+            ta = typings[a]; pa = pas[a]; trow = table[oti[a]] if oti[a] is not None else None
+            class_ti = [ORDERED_TO_TYPING[trow[oti[b]]] if trow is not None and oti[b] is not None else off_chart(ta, typings[b]) for b in p2_reps]
+            class_masks = [cell_masks(ti, act[b], pa) if ti != NO_TYPING else (0, 0, 0, 0) for ti, b in zip(class_ti, p2_reps)]
+            row['typing'] = array('B', [class_ti[j] for j in p2_of])
+            for i, key in enumerate(('imm', 'res', 'weak', 'weak4')):
+                vals = [m[i] for m in class_masks]; row[key] = array('I', [vals[j] for j in p2_of])
+            if len(p1_members[c]) > 1: done[c] = row
+        for key, _code in FUSION_TABLE_COLUMNS:
+            cols[key].extend(row[key])
+        if a == p1_members[c][-1]: done.pop(c, None)
+    header = dict(inputs['fingerprint'], n=n, names=names, byteorder='little', columns={})
+    blobs = []; offset = 0
+    for name, code in FUSION_TABLE_COLUMNS:
+        col = cols[name]
+        if sys.byteorder != 'little': col.byteswap()
+        nbytes = len(col) * col.itemsize
+        header['columns'][name] = [offset, code, nbytes]
+        blobs.append(col); offset += nbytes + (-nbytes % 8)
+    hjson = json.dumps(header).encode('utf-8')
+    hjson += b' ' * (-(len(hjson) + 8) % 8)  # column data starts 8-byte aligned
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(FUSION_TABLE_MAGIC); f.write(struct.pack('<I', len(hjson))); f.write(hjson)
+        for col in blobs:
+            col.tofile(f); f.write(b'\0' * (-(len(col) * col.itemsize) % 8))
+    os.replace(tmp, path)
+    logging.info(f"[FusionTable] built {n}x{n} pairs -> {path} ({os.path.getsize(path) / 1e6:.1f} MB) in {(time.perf_counter() - t0) * 1000:.0f}ms")
+    return header
+
+class FusionTable:
+    """Read-only mmap view of a fusion table file; columns are zero-copy memoryviews indexed by P1 * n + P2."""
+    def __init__(self, path: str = FUSION_TABLE_PATH):
+        self.path = path; self._f = open(path, 'rb')
+        try:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._mm[:4] != FUSION_TABLE_MAGIC:
+                raise ValueError('not a fusion table file')
+            hlen = struct.unpack_from('<I', self._mm, 4)[0]
+            self.header = json.loads(bytes(self._mm[8:8 + hlen]).decode('utf-8'))
+            self.n = int(self.header['n']); self.names = self.header['names']; self.row = {nm: i for i, nm in enumerate(self.names)}
+            base = 8 + hlen; self._views = {}
+            for name, (off, code, nbytes) in self.header['columns'].items():
+                view = memoryview(self._mm)[base + off:base + off + nbytes]
+                if sys.byteorder == 'little':
+                    self._views[name] = view.cast(code)
+                else:  # big-endian hosts pay one copy per column
+                    col = array(code); col.frombytes(view.tobytes()); col.byteswap(); self._views[name] = col
         except Exception:
-            count = -1
-        if count >= 0:
-            for i in range(count + 1):
-                try:
-                    lbl = challenges_menu.entrycget(i, 'label')
-                    if lbl:
-                        present.append(lbl)
-                except Exception:
-                    pass
-        if 'Flip Stat Challenge' not in present:
-            challenges_menu.add_checkbutton(label='Flip Stat Challenge', variable=flip_stat_var, onvalue=True, offvalue=False, command=refresh_after_challenge_toggle)
-        if 'Inverse Battle Challenge' not in present:
-            challenges_menu.add_checkbutton(label='Inverse Battle Challenge', variable=inverse_battle_var, onvalue=True, offvalue=False, command=refresh_after_challenge_toggle)
+            self.close(); raise
+
+    def matches(self, fingerprint: dict, names: Optional[list] = None) -> bool:
+        h = self.header
+        return all(h.get(k) == v for k, v in fingerprint.items()) and self.names == (names if names is not None else species_arrays()['names'])
+
+    def release(self):
+        if _DATA_CACHE.get('fusion_table') is self: _DATA_CACHE.pop('fusion_table', None)
+        self.close()
+
+    def partners(self, name: str, p1_row: int):
+        """Column slice for every P2 of one P1 (zero-copy)."""
+        return self._views[name][p1_row * self.n:(p1_row + 1) * self.n]
+
+    def lookup(self, p1_row: int, p2_row: int, columns=None) -> dict:
+        """One pair's cells: every column, or just `columns`."""
+        i = p1_row * self.n + p2_row
+        return {name: self._views[name][i] for name in (columns or [c for c, _code in FUSION_TABLE_COLUMNS])}
+
+    def close(self):
+        for v in getattr(self, '_views', {}).values():
+            try: v.release()
+            except AttributeError: pass
+        self._views = {}
+        for h in ('_mm', '_f'):
+            try: getattr(self, h).close()
+            except Exception: pass
+
+_FUSION_TABLE_LOCK = threading.Lock()  # the startup warm-up may be opening/rebuilding the table on a worker thread
+
+def fusion_table(rebuild_if_stale: bool = True) -> Optional[FusionTable]:
+    """The mmap'd fusion table for the loaded data, rebuilt first when missing or stale (data cache)."""
+    tbl = _DATA_CACHE.get('fusion_table')
+    if tbl is not None:
+        return tbl
+    with _FUSION_TABLE_LOCK:
+        return _open_fusion_table(rebuild_if_stale)
+
+def open_fusion_table() -> Optional[FusionTable]:
+    """The fusion table if it is already open (startup warm-up or the status dialog), else None. Batch paths read
+    it when present and compute otherwise, so a UI action never waits on a table build."""
+    return _DATA_CACHE.get('fusion_table')
+
+def _open_fusion_table(rebuild_if_stale: bool) -> Optional[FusionTable]:
+    tbl = _DATA_CACHE.get('fusion_table')
+    if tbl is None:
+        tbl = load_fusion_table(fusion_table_inputs(), rebuild_if_stale)
+        if tbl is not None: _DATA_CACHE['fusion_table'] = tbl
+    return tbl
+
+def load_fusion_table(inputs: dict, rebuild_if_stale: bool = True) -> Optional[FusionTable]:
+    """Open FUSION_TABLE_PATH for the data described by `inputs` (fusion_table_inputs()), rebuilding it first when
+    missing or stale. Reads nothing but `inputs`, so the warm-up worker can call it; callers hold _FUSION_TABLE_LOCK."""
+    fp = inputs['fingerprint']
+    try:
+        tbl = FusionTable(FUSION_TABLE_PATH)
+        if not tbl.matches(fp, inputs['arrays']['names']):
+            logging.info(f"[FusionTable] stale (data {tbl.header.get('data_version')!r} / {str(tbl.header.get('csv_sha256'))[:12]}); rebuilding")
+            tbl.close(); tbl = None
+    except FileNotFoundError:
+        tbl = None
     except Exception as e:
-        logging.debug(f'[ToolbarGuard] Challenges menu audit failed: {e}')
-
-
-# View menu
-view_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='View', menu=view_menu)
-logs_master_var = tk.BooleanVar(value=True)
-ui_layout_logs_var = tk.BooleanVar(value=False)
-widget_font_tag_logs_var = tk.BooleanVar(value=False)
-calc_logs_var = tk.BooleanVar(value=True)   # gated by verbose_logs_var
-verbose_logs_var = tk.BooleanVar(value=False)
-view_menu.add_checkbutton(label='Logging (Master)', variable=logs_master_var, onvalue=True, offvalue=False, command=on_toggle_master_logs)
-view_menu.add_checkbutton(label='Verbose Logs', variable=verbose_logs_var, onvalue=True, offvalue=False, command=lambda: on_toggle_verbose_logs())
-# Calculation logs: when ON, logs via log_calc(); level depends on Verbose
-view_menu.add_checkbutton(label='Show Calculation Logs', variable=calc_logs_var, onvalue=True, offvalue=False)
-# One-shot diagnostic dumps (fire on ON; auto-reset OFF)
-view_menu.add_checkbutton(label='Show UI Layout Logs', variable=ui_layout_logs_var, onvalue=True, offvalue=False, command=dump_ui_layout_metrics)
-view_menu.add_checkbutton(label='Show Widget Font/Tag Logs', variable=widget_font_tag_logs_var, onvalue=True, offvalue=False, command=dump_widget_font_tag_logs)
-view_menu.add_separator()
-
-# Runtime vars
-show_status_bar_var = tk.BooleanVar(value=True)
-quick_compare_target_var = tk.StringVar(value='p2')
-passive_active_var = tk.BooleanVar(value=True)
-flip_stat_var = tk.BooleanVar(value=False)
-
-inverse_battle_var = tk.BooleanVar(value=False)
-# Display vars
-display_vars = init_display_vars()
-
-# Help menu content
-
-def show_help_overview():
-    help_text = (
-        "\nPokéRogue Fusion Calculator — Toolbar Overview\n"
-        "\nFile\n  • " + STR['copy_fusion_summary'] + ": Copy the Fusion pane text.\n"
-        "  • " + STR['export_fusion_summary'] + ": Save Fusion pane as .md/.txt.\n"
-        "\nView\n  • Display Options: Toggle visibility of sections per panel (auto-applies).\n"
-        "  • Quick Compare: Show/hide comparison summary vs P1/P2.\n"
-        "  • Compare vs: Choose the baseline used in Quick Compare.\n"
-        "  • Passive Active: Toggle whether Pokémon 1's Passive affects fusion typing.\n"
-        "  • Logging (Master): Master switch; disables/enables all logging toggles.\n"
-        "  • Verbose Logs: Raise log level to DEBUG (more detail).\n"
-        "  • Show Calculation Logs: Emit calculation traces (respects Master/Verbose).\n"
-        "  • Show UI Layout Logs: Dump a one-shot layout/geometry report.\n"
-        "  • Show Widget Font/Tag Logs: Dump fonts/tags used by text widgets.\n"
-        "  • Show Status Bar: Show/hide the bottom status strip.\n"
-        "\nChallenges\n  • Flip Stat Challenge: Swap stat roles (HP↔Speed, Atk↔Sp.Def, Def↔Sp.Atk).\n"
-        "  • Inverse Battle Challenge: Invert type chart (weaknesses/resistances swapped).\n"
-        "\nResources\n  • Pokémon Database, Type Calculator, PokeRogue Pokedex (opens in browser).\n"
-        "\nTips\n  • Use Search Filters (Help → Search Filters) to narrow lists quickly.\n"
-    )
-
-    try: messagebox.showinfo('Help — Toolbar Overview', help_text)
-    except Exception: pass
+        logging.info(f"[FusionTable] unreadable ({e}); rebuilding"); tbl = None
+    if tbl is None:
+        if not rebuild_if_stale:
+            return None
+        build_fusion_table(FUSION_TABLE_PATH, inputs); tbl = FusionTable(FUSION_TABLE_PATH)
+    return tbl
+
+# Staged startup: the window paints first with empty listboxes, the next tick loads pokemon_data.csv and hands it
+# to the UI, then derived indexes are built one per event-loop tick and an existing fusion table is opened (or
+# rebuilt if stale) on a worker thread. Every step is a lazily built cache, so features used before warm-up simply
+# build what they need on first use. The worker gets fusion_table_inputs() gathered on the Tk thread and returns
+# the opened table to it, so the shared caches are only ever touched from the Tk thread.
+def _start_table_warmup():
+    """Warm-up step: gather fusion_table_inputs() here on the Tk thread (a few ms once the classes and typing table
+    steps have run) and load the table on a worker. Only tables the user has built before; never a first-time 60 MB write."""
+    if not os.path.exists(FUSION_TABLE_PATH): return
+    inputs = fusion_table_inputs(); _WARMUP['table'] = 'building'
+    threading.Thread(target=_warm_fusion_table, args=(inputs,), name='fusion-table-warmup', daemon=True).start()
+
+WARMUP_STEPS = (('families & classes', log_dataset_summary), ('species arrays', species_arrays), ('stat index', stat_sorted_index),
+                ('typing ids', species_typing_ids), ('typing table', fused_typing_table), ('fusion table inputs', _start_table_warmup),
+                ('fused typing histogram', fused_typing_histogram), ('KD-tree', stat_kdtree))
+_WARMUP: Dict[str, Any] = {'steps': [], 'table': 'skipped', 'table_handle': None, 'paint_ms': None, 'interactive_ms': None, 'warm_ms': None}
+
+def _warm_fusion_table(inputs: dict):
+    try:
+        with _FUSION_TABLE_LOCK: _WARMUP['table_handle'] = load_fusion_table(inputs)
+        _WARMUP['table'] = 'ready'
+    except Exception as e:
+        _WARMUP['table'] = 'failed'; logging.error(f"[Startup] fusion table warm-up failed: {e}")
+
+def _adopt_warm_table():
+    """Tk thread: publish the worker's table unless a caller already opened one meanwhile."""
+    tbl = _WARMUP['table_handle']; _WARMUP['table_handle'] = None
+    if tbl is None: return
+    if _DATA_CACHE.get('fusion_table') is None: _DATA_CACHE['fusion_table'] = tbl
+    else: tbl.close()
+
+def start_warmup(root, on_data_loaded=None):
+    """Run once the main window (root) is up: load the CSV on the next tick and pass it to the UI (on_data_loaded), log
+    time-to-interactive, then warm WARMUP_STEPS one per tick (one of them hands the fusion table to a worker thread)."""
+    _WARMUP['paint_ms'] = (time.perf_counter() - _T_START) * 1000.0
+    logging.info(f"[Startup] window up in {_WARMUP['paint_ms']:.0f}ms")
+
+    def load():
+        load_pokemon_data_into(pokemon_stats)
+        if on_data_loaded: on_data_loaded()
+        _WARMUP['interactive_ms'] = (time.perf_counter() - _T_START) * 1000.0
+        logging.info(f"[Startup] interactive in {_WARMUP['interactive_ms']:.0f}ms")
+        root.after(1, tick)
+    pending = list(WARMUP_STEPS)
+
+    def tick():
+        if pending:
+            name, fn = pending.pop(0); t0 = time.perf_counter()
+            try: fn()
+            except Exception as e: logging.debug(f"[Startup] warm-up step {name} failed: {e}")
+            _WARMUP['steps'].append((name, (time.perf_counter() - t0) * 1000.0))
+            root.after(1, tick); return
+        if _WARMUP['table'] == 'building':
+            root.after(100, tick); return
+        _adopt_warm_table()
+        _WARMUP['warm_ms'] = (time.perf_counter() - _T_START) * 1000.0
+        logging.info(f"[Startup] warm in {_WARMUP['warm_ms']:.0f}ms (fusion table: {_WARMUP['table']}; "
+                     + ', '.join(f"{n} {ms:.0f}ms" for n, ms in _WARMUP['steps']) + ')')
+
+    root.after(1, load)
+# App setup & menus: only when run as a program, so `import fusioncalc` gives scripts the engine without a window
+if __name__ == '__main__':
+    startup_phase('module setup (type/ability tables)')
+    root = tk.Tk(); root.title(f"PokéRogue Fusion Calculator — build {BUILD_TAG}")
+    startup_phase('Tk root')
+    root.geometry('1550x540')
+
+    menubar = tk.Menu(root); root.config(menu=menubar)
+    file_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='File', menu=file_menu)
+    file_menu.add_command(label=STR['copy_fusion_summary'], command=lambda: copy_fusion_summary(root))
+    file_menu.add_command(label=STR['export_fusion_summary'], command=export_fusion_summary)
+    file_menu.add_command(label=STR['load_roster'], command=lambda: load_roster_file())
+    file_menu.add_separator(); file_menu.add_command(label='Exit', command=lambda: quit_app())
+
+    challenges_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='Challenges', menu=challenges_menu)
+    resources_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='Resources', menu=resources_menu)
+    resources_menu.add_command(label='Pokémon Database', command=open_pokemondb)
+    resources_menu.add_command(label='Type Calculator', command=open_type_calculator)
+    resources_menu.add_command(label='PokeRogue Pokedex', command=open_pokedex)
+    help_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='Help', menu=help_menu)
+
+    # Toolbar Integrity Guard — ensure required challenge labels exist (idempotent)
+    def _verify_challenges_menu_integrity():
+        try:
+            required = ['Flip Stat Challenge', 'Inverse Battle Challenge']
+            present = []
+            try:
+                count = challenges_menu.index('end') or -1
+            except Exception:
+                count = -1
+            if count >= 0:
+                for i in range(count + 1):
+                    try:
+                        lbl = challenges_menu.entrycget(i, 'label')
+                        if lbl:
+                            present.append(lbl)
+                    except Exception:
+                        pass
+            if 'Flip Stat Challenge' not in present:
+                challenges_menu.add_checkbutton(label='Flip Stat Challenge', variable=flip_stat_var, onvalue=True, offvalue=False, command=lambda: refresh_after_challenge_toggle(TOOL_WINDOW_REFRESH))
+            if 'Inverse Battle Challenge' not in present:
+                challenges_menu.add_checkbutton(label='Inverse Battle Challenge', variable=inverse_battle_var, onvalue=True, offvalue=False, command=lambda: refresh_after_challenge_toggle(TOOL_WINDOW_REFRESH))
+        except Exception as e:
+            logging.debug(f'[ToolbarGuard] Challenges menu audit failed: {e}')
+
+
+    # View menu
+    view_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='View', menu=view_menu)
+    logs_master_var = tk.BooleanVar(value=True)
+    ui_layout_logs_var = tk.BooleanVar(value=False)
+    widget_font_tag_logs_var = tk.BooleanVar(value=False)
+    cache_stats_logs_var = tk.BooleanVar(value=False)
+    calc_logs_var = tk.BooleanVar(value=True)   # gated by verbose_logs_var
+    verbose_logs_var = tk.BooleanVar(value=False)
+    view_menu.add_checkbutton(label='Logging (Master)', variable=logs_master_var, onvalue=True, offvalue=False, command=on_toggle_master_logs)
+    view_menu.add_checkbutton(label='Verbose Logs', variable=verbose_logs_var, onvalue=True, offvalue=False, command=lambda: on_toggle_verbose_logs())
+    # Calculation logs: when ON, trace events are logged; level depends on Verbose
+    view_menu.add_checkbutton(label='Show Calculation Logs', variable=calc_logs_var, onvalue=True, offvalue=False, command=sync_tracer)
+    # One-shot diagnostic dumps (fire on ON; auto-reset OFF)
+    view_menu.add_checkbutton(label='Show UI Layout Logs', variable=ui_layout_logs_var, onvalue=True, offvalue=False, command=lambda: dump_ui_layout_metrics(root))
+    view_menu.add_checkbutton(label='Show Widget Font/Tag Logs', variable=widget_font_tag_logs_var, onvalue=True, offvalue=False, command=dump_widget_font_tag_logs)
+    view_menu.add_checkbutton(label='Show Cache Stats', variable=cache_stats_logs_var, onvalue=True, offvalue=False, command=dump_cache_stats)
+    # Trace buffer (recorded while Logging (Master) is ON)
+    trace_sample_var = tk.DoubleVar(value=1.0)
+    trace_menu = tk.Menu(view_menu, tearoff=0)
+    for _rate in (1.0, 0.1, 0.01):
+        trace_menu.add_radiobutton(label=f"Sample {_rate:.0%}", variable=trace_sample_var, value=_rate, command=lambda: setattr(TRACE, 'sample_rate', float(trace_sample_var.get())))
+    trace_menu.add_separator()
+    trace_menu.add_command(label=STR['export_trace'], command=lambda: export_trace_jsonl())
+    trace_menu.add_command(label='Clear Trace', command=TRACE.clear)
+    view_menu.add_cascade(label='Trace', menu=trace_menu)
+    view_menu.add_separator()
+
+    def export_trace_jsonl():
+        if not TRACE.buffer:
+            try: messagebox.showinfo(STR['export_trace'], STR['trace_empty'])
+            except Exception: pass
+            return
+        path = filedialog.asksaveasfilename(title=STR['export_trace'], defaultextension='.jsonl', filetypes=[('JSON Lines', '*.jsonl'), ('All files', '*.*')])
+        if not path:
+            return
+        try:
+            n = TRACE.export_jsonl(path)
+            try: status_text.set(f"Exported {n} trace events: {path}")
+            except Exception: pass
+        except Exception as e:
+            logging.error(f"[Trace] export failed: {e}", exc_info=True)
 
-help_menu.add_command(label='Toolbar Overview', command=show_help_overview)
+    # Analysis menu (batch tools over the whole dex / fusion space)
+    analysis_menu = tk.Menu(menubar, tearoff=0); menubar.add_cascade(label='Analysis', menu=analysis_menu)
 
-def show_filter_help():
-    try:
-        message = """Search filters:
+    def show_stab_coverage_ranking():
+        try:
+            try: inv_on = bool(inverse_battle_var.get())
+            except Exception: inv_on = False
+            t0 = time.perf_counter(); rows = rank_stab_coverage(inv_on); dt_ms = (time.perf_counter() - t0) * 1000.0
+            ResultsWindow(root, STR['stab_ranking'] + (' (Inverse)' if inv_on else ''),
+                          ['Pokémon', 'Typing', f'SE typings (/{N_TYPINGS})', f'SE types (/{N_TYPES})', 'Walled by', 'Dex hit SE %'],
+                          rows, on_activate=lambda r: select_pokemon(r[0], 1),
+                          note='STAB coverage of each species\' own typing. Double-click loads it as Pokémon 1.')
+            if TRACE.enabled:
+                TRACE.emit('analysis.done', tool='Coverage', scope=f"inverse={_on_off(inv_on)}", rows=len(rows), ms=dt_ms)
+        except Exception as e:
+            logging.error(f"[Coverage] ranking failed: {e}", exc_info=True)
+
+    def show_matchup_heatmap(fused_opponents: bool = False):
+        try:
+            c = globals().get('_FUSION_CACHE', {})
+            if not (globals().get('HAS_FUSION', False) and c):
+                try: messagebox.showinfo(STR['matchups'], STR['fuse_first'])
+                except Exception: pass
+                return
+            try: inv_on = bool(inverse_battle_var.get())
+            except Exception: inv_on = False
+            t1, t2 = c['fused_type1'], c['fused_type2']
+            passive = c['passive_ability'] if c.get('passive_on') else None
+            t0 = time.perf_counter()
+            if fused_opponents:
+                rows = fused_opponent_matchups(t1, t2, c['active_ability'], passive, inv_on)
+                cols = ['Opponent fused typing', 'Worst STAB hit ×', 'Fusions with typing']; worst = 1
+            else:
+                rows = dex_matchups(t1, t2, c['active_ability'], passive, inv_on)
+                cols = ['Opponent', 'Typing', 'Worst STAB hit ×', 'STAB 1 ×', 'STAB 2 ×']; worst = 2
+            dt_ms = (time.perf_counter() - t0) * 1000.0
+            rows.sort(key=lambda r: (-r[worst], r[0]))  # worst matchups first
+            fused_type = t1 if not t2 else f"{t1}/{t2}"
+            ResultsWindow(root, f"{STR['matchups']}: {c['p1']} + {c['p2']} ({fused_type})" + (' (Inverse)' if inv_on else ''),
+                          cols, rows, row_tag=lambda r: matchup_bucket(r[worst]), tag_colors=MATCHUP_COLORS,
+                          on_activate=None if fused_opponents else (lambda r: select_pokemon(r[0], 2)),
+                          note=STR['matchups_note'])
+            if TRACE.enabled:
+                TRACE.emit('analysis.done', tool='Matchups', scope='fused opponents' if fused_opponents else 'dex', rows=len(rows), ms=dt_ms)
+        except Exception as e:
+            logging.error(f"[Matchups] failed: {e}", exc_info=True)
+
+    FUSED_STAT_COLUMNS = ['Pokémon 1', 'Pokémon 2', 'Fused Type', 'HP', 'Attack', 'Defense', 'Sp. Atk', 'Sp. Def', 'Speed', 'BST']
+    FUSED_TENTHS_COLS = range(3, 10)  # fused_stat_row() stat columns are integer tenths
+
+    def show_pareto_dialog():
+        dlg = tk.Toplevel(root); dlg.title(STR['pareto']); dlg.transient(root)
+        only_p1_var = tk.BooleanVar(value=bool(pokemon1_var.get().strip() in pokemon_stats))
+        typing_var = tk.StringVar(value='')
+        ttk.Checkbutton(dlg, text=STR['only_current_p1'], variable=only_p1_var).grid(row=0, column=0, columnspan=2, sticky='w', padx=8, pady=(8, 2))
+        ttk.Label(dlg, text=STR['fused_type_label']).grid(row=1, column=0, sticky='e', padx=8, pady=2)
+        ttk.Combobox(dlg, textvariable=typing_var, state='readonly', width=22,
+                     values=[''] + [typing_label(i) for i in range(N_TYPINGS)]).grid(row=1, column=1, sticky='w', padx=8, pady=2)
+
+        def run():
+            p1 = pokemon1_var.get().strip() if only_p1_var.get() else None
+            if p1 is not None and p1 not in pokemon_stats:
+                try: messagebox.showinfo(STR['pareto'], STR['select_p1_first'], parent=dlg)
+                except Exception: pass
+                return
+            ft = typing_index(*(typing_var.get().split('/') + [''])[:2]) if typing_var.get() else None
+            t0 = time.perf_counter(); rows = pareto_fusions(p1=p1, fused_typing=ft); dt_ms = (time.perf_counter() - t0) * 1000.0
+            scope = ', '.join(x for x in (f"P1 = {p1}" if p1 else '', typing_var.get()) if x) or 'all fusions'
+            ResultsWindow(root, f"{STR['pareto']} — {scope}", FUSED_STAT_COLUMNS, rows, on_activate=lambda r: select_pair(r[0], r[1]), tenths_cols=FUSED_TENTHS_COLS,
+                          note=STR['pareto_note'].format(len(rows), dt_ms))
+            if TRACE.enabled:
+                TRACE.emit('analysis.done', tool='Pareto', scope=scope, rows=len(rows), ms=dt_ms)
+            dlg.destroy()
+
+        ttk.Button(dlg, text=STR['compute'], command=run).grid(row=2, column=0, columnspan=2, pady=8)
+
+    def show_similar_spreads_dialog():
+        c = globals().get('_FUSION_CACHE', {}); has = bool(globals().get('HAS_FUSION', False) and c)
+        dlg = tk.Toplevel(root); dlg.title(STR['similar_spreads']); dlg.transient(root)
+        spread_var = tk.StringVar(value=' '.join(format_tenths(c['fusion_stats'][k]) for k in STAT_KEYS) if has else '')
+        k_var = tk.IntVar(value=25); norm_var = tk.BooleanVar(value=False); typing_var = tk.StringVar(value='')
+        ttk.Label(dlg, text=STR['target_spread']).grid(row=0, column=0, sticky='e', padx=8, pady=(8, 2))
+        ttk.Entry(dlg, textvariable=spread_var, width=30).grid(row=0, column=1, sticky='w', padx=8, pady=(8, 2))
+        ttk.Label(dlg, text=STR['fused_type_label']).grid(row=1, column=0, sticky='e', padx=8, pady=2)
+        ttk.Combobox(dlg, textvariable=typing_var, state='readonly', width=22,
+                     values=[''] + [typing_label(i) for i in range(N_TYPINGS)]).grid(row=1, column=1, sticky='w', padx=8, pady=2)
+        ttk.Label(dlg, text=STR['results_count']).grid(row=2, column=0, sticky='e', padx=8, pady=2)
+        ttk.Spinbox(dlg, from_=1, to=500, textvariable=k_var, width=6).grid(row=2, column=1, sticky='w', padx=8, pady=2)
+        ttk.Checkbutton(dlg, text=STR['normalize_stats'], variable=norm_var).grid(row=3, column=0, columnspan=2, sticky='w', padx=8, pady=2)
+
+        def run():
+            try:
+                target = [float(v) for v in re.split(r'[\s,/]+', spread_var.get().strip()) if v]
+                k = max(1, int(k_var.get()))
+                if len(target) != 6: raise ValueError
+            except (ValueError, tk.TclError):
+                try: messagebox.showwarning(STR['similar_spreads'], STR['bad_spread'], parent=dlg)
+                except Exception: pass
+                return
+            ft = typing_index(*(typing_var.get().split('/') + [''])[:2]) if typing_var.get() else None
+            row = species_arrays()['row']
+            exclude = {(row[c['p1']], row[c['p2']])} if has else ()
+            t0 = time.perf_counter(); hits = nearest_fusions(target, k, bool(norm_var.get()), ft, exclude); dt_ms = (time.perf_counter() - t0) * 1000.0
+            rows = [fused_stat_row(a, b) + (round(d, 2),) for d, a, b in hits]
+            label = '/'.join(f"{v:g}" for v in target)
+            ResultsWindow(root, f"{STR['similar_spreads']} — {label}" + (f" ({typing_var.get()})" if ft is not None else ''), FUSED_STAT_COLUMNS + ['Distance'], rows,
+                          on_activate=lambda r: select_pair(r[0], r[1]), tenths_cols=FUSED_TENTHS_COLS,
+                          note=STR['similar_note'].format(len(rows), label, ', σ units' if norm_var.get() else '', dt_ms))
+            if TRACE.enabled:
+                TRACE.emit('analysis.done', tool='Similar', scope=f"{label} k={k} typing={typing_var.get() or 'any'} norm={bool(norm_var.get())}", rows=len(rows), ms=dt_ms)
+            dlg.destroy()
+
+        ttk.Button(dlg, text=STR['search'], command=run).grid(row=4, column=0, columnspan=2, pady=8)
+
+    def stream_rows_into(win: 'ResultsWindow', rows_iter, chunk: int = 2000, limit: int = 100000, done=None):
+        """Feed rows from a generator into a ResultsWindow in chunks between Tk events.
+        Stops (leaving the generator unconsumed) when the window closes or `limit` rows arrived."""
+        state = {'n': 0}
+        def step():
+            try:
+                if not win.win.winfo_exists(): return
+            except Exception:
+                return
+            batch = list(itertools.islice(rows_iter, chunk))
+            if batch:
+                win.append_rows(batch); state['n'] += len(batch)
+            if len(batch) == chunk and state['n'] < limit:
+                root.after(1, step)
+            elif done:
+                done(state['n'], len(batch) == chunk)
+        root.after(1, step)
+
+    def show_fused_search_dialog():
+        dlg = tk.Toplevel(root); dlg.title(STR['fused_search']); dlg.transient(root)
+        p1_q = tk.StringVar(value=pokemon1_filter_var.get()); p2_q = tk.StringVar(value=pokemon2_filter_var.get())
+        fused_q = tk.StringVar(value='fused.bst>=600')
+        ttk.Label(dlg, text=STR['fused_search_note'], wraplength=420, justify='left').grid(row=0, column=0, columnspan=2, sticky='w', padx=8, pady=(8, 4))
+        for r, (label, var) in enumerate(((STR['p1_filter'], p1_q), (STR['p2_filter'], p2_q), (STR['fused_constraints'], fused_q)), start=1):
+            ttk.Label(dlg, text=label).grid(row=r, column=0, sticky='e', padx=8, pady=2)
+            ttk.Entry(dlg, textvariable=var, width=44).grid(row=r, column=1, sticky='w', padx=8, pady=2)
+
+        def run():
+            constraints, bad = parse_fused_constraints(t for t in filter_tokens(fused_q.get()))
+            if bad:
+                try: messagebox.showwarning(STR['fused_search'], STR['fused_filter_bad'].format(' '.join(bad)), parent=dlg)
+                except Exception: pass
+                return
+            p1_rows = filter_rows(p1_q.get()); p2_rows = filter_rows(p2_q.get())
+            t0 = time.perf_counter()
+            rows = (fused_stat_row(a, b) for a, b in search_fused_constraints(constraints, p1_rows, p2_rows))
+            win = ResultsWindow(root, f"{STR['fused_search']} — {fused_q.get().strip() or 'all fusions'}", FUSED_STAT_COLUMNS,
+                                on_activate=lambda r: select_pair(r[0], r[1]), note=STR['fused_search_note'], tenths_cols=FUSED_TENTHS_COLS)
+            def done(n, truncated):
+                dt_ms = (time.perf_counter() - t0) * 1000.0
+                try: status_text.set(f"Fused search: {n} matches in {dt_ms:.0f} ms" + (' (stopped at limit — refine the query)' if truncated else ''))
+                except Exception: pass
+                if TRACE.enabled:
+                    TRACE.emit('analysis.done', tool='FusedSearch', scope=fused_q.get().strip(), rows=n, ms=dt_ms)
+            stream_rows_into(win, rows, done=done)
+            dlg.destroy()
+
+        ttk.Button(dlg, text=STR['search'], command=run).grid(row=4, column=0, columnspan=2, pady=8)
+
+    class FamilyGridWindow:
+        """P1's evolution family × P2's as a virtual Canvas grid. The block comes from one family_grid() call;
+        a cell's canvas items are only created the first time it scrolls into view."""
+        CELL_W, CELL_H, HDR_W, HDR_H = 150, 44, 170, 30
+        LOW, HIGH = (0xf1, 0xf5, 0xfb), (0x7f, 0xb3, 0xf0)  # BST shade endpoints
+
+        def __init__(self, p1: str, p2: str):
+            t0 = time.perf_counter()
+            self.left, self.right, self.cells = family_grid(p1, p2); dt_ms = (time.perf_counter() - t0) * 1000.0
+            self.names = species_arrays()['names']; self.drawn: Dict[tuple, int] = {}; self.current = (p1, p2)
+            bsts = [c[1] for row in self.cells for c in row if c]
+            self.lo, self.hi = (min(bsts), max(bsts)) if bsts else (0, 0)
+            self.win = tk.Toplevel(root); self.win.title(f"{STR['family_grid']}: {p1} × {p2}"); self.win.geometry('900x520')
+            ttk.Label(self.win, text=STR['family_grid_note'].format(len(self.left), len(self.right), dt_ms), anchor='w').pack(side=tk.TOP, fill=tk.X, padx=8, pady=(6, 2))
+            body = ttk.Frame(self.win); body.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
+            body.grid_rowconfigure(1, weight=1); body.grid_columnconfigure(1, weight=1)
+            W = len(self.right) * self.CELL_W; H = len(self.left) * self.CELL_H
+            self.top = tk.Canvas(body, height=self.HDR_H, highlightthickness=0, scrollregion=(0, 0, W, self.HDR_H))
+            self.side = tk.Canvas(body, width=self.HDR_W, highlightthickness=0, scrollregion=(0, 0, self.HDR_W, H))
+            self.canvas = tk.Canvas(body, background='white', highlightthickness=0, scrollregion=(0, 0, W, H))
+            xsb = ttk.Scrollbar(body, orient=tk.HORIZONTAL, command=self._xview); ysb = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self._yview)
+            self.canvas.configure(xscrollcommand=lambda *a: (xsb.set(*a), self._draw_visible()),
+                                  yscrollcommand=lambda *a: (ysb.set(*a), self._draw_visible()))
+            ttk.Label(body, text='P1 \\ P2').grid(row=0, column=0)
+            self.top.grid(row=0, column=1, sticky='ew'); self.side.grid(row=1, column=0, sticky='ns'); self.canvas.grid(row=1, column=1, sticky='nsew')
+            ysb.grid(row=1, column=2, sticky='ns'); xsb.grid(row=2, column=1, sticky='ew')
+            for j, r in enumerate(self.right):
+                self.top.create_text(j * self.CELL_W + self.CELL_W / 2, self.HDR_H / 2, text=self.names[r], width=self.CELL_W - 6, font=('Arial', 9, 'bold'))
+            for i, r in enumerate(self.left):
+                self.side.create_text(self.HDR_W - 6, i * self.CELL_H + self.CELL_H / 2, text=self.names[r], anchor='e', width=self.HDR_W - 10, font=('Arial', 9, 'bold'))
+            self.canvas.bind('<Configure>', lambda e: self._draw_visible())
+            self.canvas.bind('<Button-1>', self._click)
+            self.canvas.bind('<MouseWheel>', lambda e: self._yview('scroll', -1 if e.delta > 0 else 1, 'units'))
+            self._draw_visible()
+
+        def _xview(self, *args):
+            self.canvas.xview(*args); self.top.xview(*args)
+
+        def _yview(self, *args):
+            self.canvas.yview(*args); self.side.yview(*args)
+
+        def _shade(self, bst: int) -> str:
+            f = (bst - self.lo) / (self.hi - self.lo) if self.hi > self.lo else 0.0
+            return '#%02x%02x%02x' % tuple(round(a + (b - a) * f) for a, b in zip(self.LOW, self.HIGH))
+
+        def _draw_visible(self):
+            c = self.canvas
+            try:
+                x0 = c.canvasx(0); y0 = c.canvasy(0); x1 = x0 + c.winfo_width(); y1 = y0 + c.winfo_height()
+            except Exception:
+                return
+            for i in range(max(0, int(y0 // self.CELL_H)), min(len(self.left), int(y1 // self.CELL_H) + 1)):
+                for j in range(max(0, int(x0 // self.CELL_W)), min(len(self.right), int(x1 // self.CELL_W) + 1)):
+                    if (i, j) not in self.drawn:
+                        self.drawn[(i, j)] = self._draw_cell(i, j)
+
+        def _outline(self, is_current: bool) -> dict:
+            return {'outline': '#1a73e8', 'width': 2} if is_current else {'outline': '#d0d7de', 'width': 1}
+
+        def _draw_cell(self, i: int, j: int) -> int:
+            x = j * self.CELL_W; y = i * self.CELL_H; cell = self.cells[i][j]
+            is_current = (self.names[self.left[i]], self.names[self.right[j]]) == self.current
+            rect = self.canvas.create_rectangle(x, y, x + self.CELL_W, y + self.CELL_H, fill=self._shade(cell[1]) if cell else '#eeeeee', **self._outline(is_current))
+            text = f"{STR['total_bst']} {format_tenths(cell[1])}\n{cell[0]}" if cell else '—'
+            self.canvas.create_text(x + self.CELL_W / 2, y + self.CELL_H / 2, text=text, width=self.CELL_W - 6, font=('Arial', 9))
+            return rect
+
+        def _click(self, e):
+            i = int(self.canvas.canvasy(e.y) // self.CELL_H); j = int(self.canvas.canvasx(e.x) // self.CELL_W)
+            if 0 <= i < len(self.left) and 0 <= j < len(self.right) and self.cells[i][j]:
+                prev = self._cell_of(self.current)
+                self.current = (self.names[self.left[i]], self.names[self.right[j]])
+                for cell, is_current in ((prev, False), ((i, j), True)):
+                    if cell in self.drawn: self.canvas.itemconfigure(self.drawn[cell], **self._outline(is_current))
+                select_pair(*self.current)
+
+        def _cell_of(self, pair) -> Optional[tuple]:
+            row = species_arrays()['row']
+            try: return self.left.index(row[pair[0]]), self.right.index(row[pair[1]])
+            except (KeyError, ValueError): return None
+
+    PARTNER_IMPACT_COLUMNS = ['Pokémon 2', 'Fused Type', 'New immunities', 'Lost weaknesses', 'Gained weaknesses', '4× weak', 'Net weaknesses']
+
+    def show_partner_impact_dialog():
+        p1 = pokemon1_var.get().strip()
+        if p1 not in pokemon_stats:
+            try: messagebox.showinfo(STR['partner_impact'], STR['select_p1_first'])
+            except Exception: pass
+            return
+        try: inv_on = bool(inverse_battle_var.get())
+        except Exception: inv_on = False
+        passive_on = bool(passive_active_var.get())
+        impacts: Dict[str, dict] = {}  # baseline -> partner_impact() (computed on first use)
+        dlg = tk.Toplevel(root); dlg.title(f"{STR['partner_impact']}: {p1}"); dlg.transient(root)
+        base_var = tk.StringVar(value=quick_compare_target_var.get() if quick_compare_target_var is not None else 'p2')
+        imm_var = tk.StringVar(value=''); wk_var = tk.StringVar(value=''); w4_var = tk.BooleanVar(value=False)
+        ttk.Label(dlg, text=STR['compare_vs']).grid(row=0, column=0, sticky='e', padx=8, pady=(8, 2))
+        fr = ttk.Frame(dlg); fr.grid(row=0, column=1, sticky='w', padx=8, pady=(8, 2))
+        for val, label in (('p1', STR['p1']), ('p2', STR['p2'])):
+            ttk.Radiobutton(fr, text=label, value=val, variable=base_var, command=lambda: apply()).pack(side=tk.LEFT, padx=(0, 8))
+        for r, (label, var) in enumerate(((STR['gains_immunity'], imm_var), (STR['drops_weakness'], wk_var)), start=1):
+            ttk.Label(dlg, text=label).grid(row=r, column=0, sticky='e', padx=8, pady=2)
+            cb = ttk.Combobox(dlg, textvariable=var, state='readonly', width=14, values=[''] + list(TYPE_ORDER))
+            cb.grid(row=r, column=1, sticky='w', padx=8, pady=2); cb.bind('<<ComboboxSelected>>', lambda e: apply())
+        ttk.Checkbutton(dlg, text=STR['no_new_weak4'], variable=w4_var, command=lambda: apply()).grid(row=3, column=0, columnspan=2, sticky='w', padx=8, pady=2)
+        win: Dict[str, ResultsWindow] = {}
+
+        def apply():
+            t0 = time.perf_counter()
+            imp = impacts.get(base_var.get())
+            if imp is None: imp = impacts[base_var.get()] = partner_impact(p1, base_var.get(), inv_on, passive_on)
+            rows = partner_impact_rows(imp, imm_var.get() or None, wk_var.get() or None, bool(w4_var.get()))
+            dt_ms = (time.perf_counter() - t0) * 1000.0
+            w = win.get('w')
+            try: alive = w is not None and w.win.winfo_exists()
+            except Exception: alive = False
+            if alive: w.set_rows(rows)
+            else:
+                win['w'] = ResultsWindow(root, f"{STR['partner_impact']}: {p1}" + (' (Inverse)' if inv_on else ''), PARTNER_IMPACT_COLUMNS, rows,
+                                         on_activate=lambda r: select_pair(p1, r[0]), note=STR['partner_impact_note'].format(p1))
+            if TRACE.enabled:
+                TRACE.emit('analysis.done', tool='PartnerImpact', scope=f"{p1} vs {base_var.get()} ({len(imp['rows'])} partners)", rows=len(rows), ms=dt_ms)
+
+        ttk.Button(dlg, text=STR['compute'], command=apply).grid(row=4, column=0, columnspan=2, pady=8)
+
+    ROSTER_COLUMNS = FUSED_STAT_COLUMNS + ['Weak', '4× weak', 'Immune', 'Resists']
+    _ROSTER: list = []  # species you own (File → Load Roster…, Roster Planner)
+    _ROSTER_WIN: Optional['RosterPlannerWindow'] = None
+
+    def roster_notice(corrections: dict, unknown: list) -> str:
+        parts = []
+        if corrections: parts.append(STR['roster_corrected'].format(', '.join(f"{k} → {v}" for k, v in corrections.items())))
+        if unknown: parts.append(STR['roster_unknown'].format(', '.join(unknown)))
+        return '\n'.join(parts)
+
+    class RosterPlannerWindow:
+        """Roster list on the left, every fusion within it on the right (embedded ResultsWindow). Adding or removing
+        species updates the RosterPlan incrementally; a Passive/Inverse toggle rebuilds it for the new context."""
+        def __init__(self):
+            self.win = tk.Toplevel(root); self.win.title(STR['roster_planner']); self.win.geometry('1180x560')
+            self.win.protocol('WM_DELETE_WINDOW', self.close)
+            left = ttk.Frame(self.win); left.pack(side=tk.LEFT, fill=tk.Y, padx=(8, 0), pady=8)
+            self.entry_var = tk.StringVar(value=''); self.status_var = tk.StringVar(value=''); self.notice_var = tk.StringVar(value='')
+            ent = ttk.Entry(left, textvariable=self.entry_var, width=26); ent.pack(side=tk.TOP, fill=tk.X)
+            ent.bind('<Return>', lambda e: self.add_from_entry())
+            bar = ttk.Frame(left); bar.pack(side=tk.TOP, fill=tk.X, pady=4)
+            ttk.Button(bar, text=STR['add'], command=self.add_from_entry).pack(side=tk.LEFT)
+            ttk.Button(bar, text=STR['remove'], command=self.remove_selected).pack(side=tk.LEFT, padx=4)
+            ttk.Button(left, text=STR['load_roster'], command=load_roster_file).pack(side=tk.BOTTOM, fill=tk.X, pady=(4, 0))
+            ttk.Label(left, textvariable=self.notice_var, wraplength=190, justify='left').pack(side=tk.BOTTOM, fill=tk.X)
+            ttk.Label(left, textvariable=self.status_var).pack(side=tk.BOTTOM, fill=tk.X)
+            self.listbox = tk.Listbox(left, width=26, selectmode=tk.EXTENDED, exportselection=False)
+            self.listbox.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            right = ttk.Frame(self.win); right.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+            self.table = ResultsWindow(self.win, STR['roster_planner'], ROSTER_COLUMNS, on_activate=lambda r: select_pair(r[0], r[1]),
+                                       note=STR['roster_note'], tenths_cols=FUSED_TENTHS_COLS, container=right)
+            self.plan: Optional[RosterPlan] = None
+            self.refresh()
+
+        def refresh(self):
+            """Sync the plan with _ROSTER and the Passive/Inverse toggles, then redraw the list and table."""
+            t0 = time.perf_counter()
+            inv, passive_on = bool(inverse_battle_var.get()), bool(passive_active_var.get())
+            if self.plan is None or (self.plan.inverse, self.plan.passive_on) != (inv, passive_on):
+                self.plan = RosterPlan(_ROSTER, inv, passive_on)
+            else:
+                keep = set(_ROSTER); self.plan.remove([n for n in self.plan.names() if n not in keep]); self.plan.add(_ROSTER)
+            rows = self.plan.rows(); dt_ms = (time.perf_counter() - t0) * 1000.0
+            self.listbox.delete(0, tk.END); self.listbox.insert(tk.END, *_ROSTER)
+            self.table.set_rows(rows)
+            self.status_var.set(STR['roster_status'].format(len(_ROSTER), len(rows), dt_ms))
+            if TRACE.enabled:
+                TRACE.emit('analysis.done', tool='Roster', scope=f"{len(_ROSTER)} species" + (' (Inverse)' if inv else ''), rows=len(rows), ms=dt_ms)
+
+        def add_from_entry(self):
+            names, corrections, unknown = resolve_roster([n.strip() for n in self.entry_var.get().split(',') if n.strip()])
+            _ROSTER.extend(n for n in names if n not in _ROSTER)
+            self.entry_var.set(''); self.notice_var.set(roster_notice(corrections, unknown))
+            self.refresh()
+
+        def remove_selected(self):
+            gone = {self.listbox.get(i) for i in self.listbox.curselection()}
+            if gone:
+                _ROSTER[:] = [n for n in _ROSTER if n not in gone]; self.refresh()
+
+        def close(self):
+            global _ROSTER_WIN
+            _ROSTER_WIN = None
+            try: self.win.destroy()
+            except Exception: pass
+
+    def refresh_roster_window():
+        if _ROSTER_WIN is not None:
+            try: _ROSTER_WIN.refresh()
+            except Exception as e: logging.debug(f"[Roster] refresh failed: {e}")
+
+    def show_roster_planner():
+        global _ROSTER_WIN
+        if _ROSTER_WIN is None: _ROSTER_WIN = RosterPlannerWindow()
+        else:
+            try: _ROSTER_WIN.win.lift()
+            except Exception: pass
+
+    def load_roster_file():
+        """File → Load Roster…: replace the roster with a .txt/.csv list (names fuzzy-corrected against the dataset)."""
+        path = filedialog.askopenfilename(title=STR['load_roster'], filetypes=[('Roster', '*.txt *.csv'), ('All files', '*.*')])
+        if not path:
+            return
+        try:
+            names, corrections, unknown = resolve_roster(read_roster_file(path))
+        except Exception as e:
+            logging.error(f"[Roster] load failed: {e}", exc_info=True)
+            return
+        _ROSTER[:] = names
+        if TRACE.enabled:
+            TRACE.emit('roster.loaded', species=len(names), path=path, corrected=len(corrections), unknown=len(unknown))
+        notice = roster_notice(corrections, unknown)
+        try: messagebox.showinfo(STR['load_roster'], STR['roster_loaded'].format(len(names), os.path.basename(path)) + ('\n\n' + notice if notice else ''))
+        except Exception: pass
+        if _ROSTER_WIN is None: show_roster_planner()
+        else: _ROSTER_WIN.notice_var.set(notice); _ROSTER_WIN.refresh(); _ROSTER_WIN.win.lift()
+
+    _PINNED: list = []  # (p1, p2, active ability) per comparison column
+    _COMPARE_WIN: Optional['CompareWindow'] = None
+
+    class CompareWindow:
+        """Pinned fusions as columns. Values come from pinned_fusion() and the fused-defense cache; a challenge or
+        passive toggle only rewrites the row group whose inputs changed (stats: Flip; defense: Passive/Inverse)."""
+        def __init__(self):
+            self.win = tk.Toplevel(root); self.win.title(STR['compare_pinned']); self.win.geometry('900x520')
+            self.win.protocol('WM_DELETE_WINDOW', self.close)
+            ttk.Label(self.win, text=STR['compare_note'], anchor='w').pack(side=tk.TOP, fill=tk.X, padx=8, pady=(6, 2))
+            bar = ttk.Frame(self.win); bar.pack(side=tk.BOTTOM, fill=tk.X, padx=8, pady=6)
+            ttk.Button(bar, text=STR['pin_current'], command=pin_current_fusion).pack(side=tk.LEFT, padx=4)
+            ttk.Button(bar, text=STR['unpin_last'], command=lambda: unpin_fusion(-1)).pack(side=tk.LEFT, padx=4)
+            ttk.Button(bar, text=STR['clear_pins'], command=lambda: unpin_fusion(None)).pack(side=tk.LEFT, padx=4)
+            body = ttk.Frame(self.win); body.pack(fill=tk.BOTH, expand=True, padx=8)
+            self.tree = ttk.Treeview(body, show='headings', selectmode='none')
+            xsb = ttk.Scrollbar(body, orient=tk.HORIZONTAL, command=self.tree.xview); self.tree.configure(xscrollcommand=xsb.set)
+            xsb.pack(side=tk.BOTTOM, fill=tk.X); self.tree.pack(fill=tk.BOTH, expand=True)
+            self.state: dict = {}
+            self.rebuild()
+
+        def _state(self) -> dict:
+            return {'stats': bool(flip_stat_var.get()), 'defense': (bool(passive_active_var.get()), bool(inverse_battle_var.get()))}
+
+        def _rows(self, part: str, fusions: list) -> list:
+            if part == 'stats': return compare_stat_rows(fusions, self.state['stats'])
+            return compare_defense_rows(fusions, *self.state['defense'])
+
+        def rebuild(self):
+            """Full rebuild (columns changed)."""
+            self.state = self._state(); fusions = [pinned_fusion(*k) for k in _PINNED]
+            ids = ['label'] + [f"f{i}" for i in range(len(fusions))]
+            self.tree.delete(*self.tree.get_children()); self.tree.configure(columns=ids)
+            self.tree.heading('label', text=''); self.tree.column('label', width=170, anchor='w', stretch=False)
+            for i, f in enumerate(fusions):
+                self.tree.heading(f"f{i}", text=f"{f['p1']} + {f['p2']}", command=lambda f=f: select_pair(f['p1'], f['p2']))
+                self.tree.column(f"f{i}", width=190, anchor='center', stretch=False)
+            for part in ('stats', 'defense'):
+                for rid, label, values in self._rows(part, fusions):
+                    self.tree.insert('', tk.END, iid=rid, values=[label, *values])
+
+        def update(self):
+            """Rewrite only the row groups whose inputs changed since the last render."""
+            new = self._state(); changed = [p for p in ('stats', 'defense') if new[p] != self.state.get(p)]
+            if not changed: return
+            self.state = new; fusions = [pinned_fusion(*k) for k in _PINNED]
+            for part in changed:
+                for rid, label, values in self._rows(part, fusions):
+                    self.tree.item(rid, values=[label, *values])
+
+        def close(self):
+            global _COMPARE_WIN
+            _COMPARE_WIN = None
+            try: self.win.destroy()
+            except Exception: pass
+
+    def refresh_compare_window():
+        if _COMPARE_WIN is not None:
+            try: _COMPARE_WIN.update()
+            except Exception as e: logging.debug(f"[Compare] update failed: {e}")
+
+    TOOL_WINDOW_REFRESH = (refresh_compare_window, refresh_roster_window)  # re-drawn after a Passive/Flip/Inverse toggle
+
+    def show_compare_window():
+        global _COMPARE_WIN
+        if _COMPARE_WIN is None: _COMPARE_WIN = CompareWindow()
+        else:
+            try: _COMPARE_WIN.win.lift()
+            except Exception: pass
+
+    def pin_current_fusion():
+        c = globals().get('_FUSION_CACHE', {})
+        if not (globals().get('HAS_FUSION', False) and c):
+            try: messagebox.showinfo(STR['compare_pinned'], STR['fuse_first'])
+            except Exception: pass
+            return
+        key = (c['p1'], c['p2'], c['active_ability'])
+        if key not in _PINNED: _PINNED.append(key)
+        if TRACE.enabled:
+            TRACE.emit('compare.pinned', p1=key[0], p2=key[1], pinned=len(_PINNED))
+        show_compare_window(); _COMPARE_WIN.rebuild()
+
+    def unpin_fusion(index: Optional[int]):
+        """Remove one pinned column (None clears all)."""
+        if index is None: _PINNED.clear()
+        elif _PINNED: _PINNED.pop(index)
+        prune_pinned_fusions(_PINNED)
+        if _COMPARE_WIN is not None: _COMPARE_WIN.rebuild()
+
+    def show_family_grid():
+        p1 = pokemon1_var.get().strip(); p2 = pokemon2_var.get().strip()
+        if p1 not in pokemon_stats or p2 not in pokemon_stats:
+            try: messagebox.showinfo(STR['family_grid'], STR['select_both_first'])
+            except Exception: pass
+            return
+        try:
+            t0 = time.perf_counter(); win = FamilyGridWindow(p1, p2)
+            if TRACE.enabled:
+                TRACE.emit('analysis.done', tool='FamilyGrid', scope=f"{p1} x {p2}: {len(win.left)}x{len(win.right)} cells, {len(win.drawn)} drawn",
+                           rows=len(win.left), ms=(time.perf_counter() - t0) * 1000.0)
+        except Exception as e:
+            logging.error(f"[FamilyGrid] failed: {e}", exc_info=True)
+
+    def show_percentile_histogram():
+        """Histogram of one fused stat over every partner of P1 (or P2), with the current fusion's bar marked."""
+        c = globals().get('_FUSION_CACHE', {})
+        if not (globals().get('HAS_FUSION', False) and c):
+            try: messagebox.showinfo(STR['percentiles'], STR['fuse_first'])
+            except Exception: pass
+            return
+        p1, p2 = c['p1'], c['p2']; labels = list(STAT_KEYS) + ['BST']
+        win = tk.Toplevel(root); win.title(f"{STR['percentiles']}: {p1} + {p2}"); win.geometry('720x420')
+        stat_var = tk.StringVar(value='BST'); fixed_var = tk.StringVar(value='p1'); note_var = tk.StringVar(value='')
+        bar = ttk.Frame(win); bar.pack(side=tk.TOP, fill=tk.X, padx=8, pady=(6, 2))
+        cb = ttk.Combobox(bar, textvariable=stat_var, state='readonly', width=10, values=labels); cb.pack(side=tk.LEFT)
+        cb.bind('<<ComboboxSelected>>', lambda e: draw())
+        for val, name in (('p1', p1), ('p2', p2)):
+            ttk.Radiobutton(bar, text=name, value=val, variable=fixed_var, command=lambda: draw()).pack(side=tk.LEFT, padx=(8, 0))
+        ttk.Label(win, textvariable=note_var, anchor='w').pack(side=tk.TOP, fill=tk.X, padx=8)
+        canvas = tk.Canvas(win, background='white', highlightthickness=0); canvas.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
+
+        def draw():
+            t0 = time.perf_counter(); label = stat_var.get(); fixed = p1 if fixed_var.get() == 'p1' else p2
+            if label != 'BST' and flip_stat_var.get():  # the pane shows flipped stat names
+                label = next((k for k in STAT_KEYS if FLIP_MAP.get(k, k) == label), label)
+            col = labels.index(label); edges, counts = fused_stat_histogram(fixed, col)
+            value = c['fused_bst'] if col == 6 else c['fusion_stats'][label]
+            pct = fused_percentiles(p1, p2)[fixed_var.get()][label]
+            note_var.set(STR['percentiles_note'].format(stat_var.get(), fixed) + f"  {format_tenths(value)}: {ordinal(round(pct))} percentile")
+            canvas.delete('all')
+            w = max(canvas.winfo_width(), 400); h = max(canvas.winfo_height(), 240); top = max(counts) or 1
+            bw = (w - 40) / len(counts); mark = min(len(counts) - 1, (value - edges[0]) // (edges[1] - edges[0]))
+            for i, n in enumerate(counts):
+                x0 = 20 + i * bw; y0 = h - 24 - (h - 48) * n / top
+                canvas.create_rectangle(x0, y0, x0 + bw - 2, h - 24, fill='#f8b4b4' if i == mark else '#9ec5e8', outline='')
+                if i % 4 == 0: canvas.create_text(x0, h - 12, text=format_tenths(edges[i]), anchor='w', font=('Arial', 8))
+            if TRACE.enabled:
+                TRACE.emit('analysis.done', tool='Percentiles', scope=f"{label} over partners of {fixed}, {ordinal(round(pct))} percentile",
+                           rows=len(counts), ms=(time.perf_counter() - t0) * 1000.0)
+
+        canvas.bind('<Configure>', lambda e: draw())
+        draw()
+
+    def show_fusion_table_status(rebuild: bool = False):
+        if _WARMUP['table'] == 'building':
+            try: messagebox.showinfo(STR['fusion_table'], STR['fusion_table_warming'])
+            except Exception: pass
+            return
+        try:
+            t0 = time.perf_counter()
+            if rebuild:
+                old = _DATA_CACHE.get('fusion_table')
+                if old is not None: old.release()
+                build_fusion_table(FUSION_TABLE_PATH)
+            tbl = fusion_table()
+            dt_ms = (time.perf_counter() - t0) * 1000.0
+            h = tbl.header; cls = species_classes()
+            msg = (f"File: {os.path.abspath(tbl.path)}\nSize: {os.path.getsize(tbl.path) / 1e6:.1f} MB\n"
+                   f"Pairs: {tbl.n} × {tbl.n}\nClasses: {len(cls['p1']['members'])} P1 × {len(cls['p2']['members'])} P2 (pair space ÷{cls['reduction']:.2f})\nData version: {h.get('data_version') or '—'}\nCSV SHA-256: {h.get('csv_sha256', '')[:12]}…\n"
+                   f"Ready in {dt_ms:.0f} ms")
+            messagebox.showinfo(STR['fusion_table'], msg)
+        except Exception as e:
+            logging.error(f"[FusionTable] failed: {e}", exc_info=True)
+            try: messagebox.showerror(STR['fusion_table'], str(e))
+            except Exception: pass
+
+    analysis_menu.add_command(label=STR['stab_ranking'] + '…', command=show_stab_coverage_ranking)
+    analysis_menu.add_command(label=STR['matchups'] + ' vs Dex…', command=lambda: show_matchup_heatmap(False))
+    analysis_menu.add_command(label=STR['matchups'] + ' vs Fused Opponents…', command=lambda: show_matchup_heatmap(True))
+    analysis_menu.add_command(label=STR['pareto'] + '…', command=show_pareto_dialog)
+    analysis_menu.add_command(label=STR['fused_search'] + '…', command=show_fused_search_dialog)
+    analysis_menu.add_command(label=STR['similar_spreads'] + '…', command=show_similar_spreads_dialog)
+    analysis_menu.add_command(label=STR['partner_impact'] + '…', command=show_partner_impact_dialog)
+    analysis_menu.add_command(label=STR['roster_planner'] + '…', command=show_roster_planner)
+    analysis_menu.add_command(label=STR['family_grid'] + '…', command=show_family_grid)
+    analysis_menu.add_command(label=STR['percentiles'] + '…', command=show_percentile_histogram)
+    analysis_menu.add_command(label=STR['pin_current'], command=pin_current_fusion)
+    analysis_menu.add_command(label=STR['compare_pinned'] + '…', command=show_compare_window)
+    analysis_menu.add_separator()
+    analysis_menu.add_command(label=STR['fusion_table'] + ' Status…', command=show_fusion_table_status)
+    analysis_menu.add_command(label='Rebuild ' + STR['fusion_table'], command=lambda: show_fusion_table_status(rebuild=True))
+
+    # Runtime vars
+    show_status_bar_var = tk.BooleanVar(value=True)
+    quick_compare_target_var = tk.StringVar(value='p2')
+    passive_active_var = tk.BooleanVar(value=True)
+    flip_stat_var = tk.BooleanVar(value=False)
+
+    inverse_battle_var = tk.BooleanVar(value=False)
+    # Display vars
+    display_vars = init_display_vars()
+
+    # Help menu content
+
+    def show_help_overview():
+        help_text = (
+            "\nPokéRogue Fusion Calculator — Toolbar Overview\n"
+            "\nFile\n  • " + STR['copy_fusion_summary'] + ": Copy the Fusion pane text.\n"
+            "  • " + STR['export_fusion_summary'] + ": Save Fusion pane as .md/.txt.\n"
+            "  • Load Roster…: Load owned species from a .txt/.csv list (names are fuzzy-corrected) into the Roster Planner.\n"
+            "\nView\n  • Display Options: Toggle visibility of sections per panel (auto-applies).\n"
+            "  • Quick Compare: Show/hide comparison summary vs P1/P2.\n"
+            "  • Compare vs: Choose the baseline used in Quick Compare.\n"
+            "  • Passive Active: Toggle whether Pokémon 1's Passive affects fusion typing.\n"
+            "  • Logging (Master): Master switch; disables/enables all logging toggles.\n"
+            "  • Verbose Logs: Raise log level to DEBUG (more detail).\n"
+            "  • Show Calculation Logs: Emit calculation traces (respects Master/Verbose).\n"
+            "  • Show UI Layout Logs: Dump a one-shot layout/geometry report.\n"
+            "  • Show Widget Font/Tag Logs: Dump fonts/tags used by text widgets.\n"
+            "  • Trace: Sampling rate, JSONL export and clear for the in-memory event buffer (fusions, cache hits, filters, renders).\n"
+            "  • Show Cache Stats: Dump type-effectiveness memo hits/misses/size and engine cache sizes.\n"
+            "  • Show Status Bar: Show/hide the bottom status strip.\n"
+            "\nAnalysis\n  • STAB Coverage Ranking: Rank the dex by what its STAB types hit super-effectively.\n"
+            "  • Fusion Matchups: Heatmap of the current fusion vs every species (or fused typing) STAB.\n"
+            "  • Pareto Frontier: Fusions not beaten on all six stats (optionally per P1 / fused typing).\n"
+            "  • Fused Stat Search: Every fusion meeting fused.* constraints, e.g. fused.speed>=100.\n"
+            "  • Similar Stat Spreads: The k fusions closest to the current (or a typed) spread, optionally one fused typing.\n"
+            "  • Partner Impact: Quick Compare for P1 against every partner; filter by gained immunity, dropped weakness, no 4×.\n"
+            "  • Roster Planner: Every fusion within your roster, ranked (stats, typing, weaknesses); add/remove species live.\n"
+            "  • Family Grid: Every stage of P1's evolution family fused with every stage of P2's; click a cell to fuse.\n"
+            "  • Stat Percentiles: Histogram of a fused stat over every partner of P1 or P2 (current fusion marked).\n"
+            "  • Pin Current Fusion / Compare Pinned Fusions: Pinned fusions side by side (stats, buckets, deltas vs the first).\n"
+            "  • Fusion Table Status / Rebuild: Precomputed on-disk table of every pair (auto-rebuilt when the data changes).\n"
+            "\nChallenges\n  • Flip Stat Challenge: Swap stat roles (HP↔Speed, Atk↔Sp.Def, Def↔Sp.Atk).\n"
+            "  • Inverse Battle Challenge: Invert type chart (weaknesses/resistances swapped).\n"
+            "\nResources\n  • Pokémon Database, Type Calculator, PokeRogue Pokedex (opens in browser).\n"
+            "\nTips\n  • Use Search Filters (Help → Search Filters) to narrow lists quickly.\n"
+        )
+
+        try: messagebox.showinfo('Help — Toolbar Overview', help_text)
+        except Exception: pass
+
+    help_menu.add_command(label='Toolbar Overview', command=show_help_overview)
+
+    def show_filter_help():
+        try:
+            message = """Search filters:
  name:TERM — match name substring
  type:TYPE — match type1 or type2 (e.g., type:fire)
  ability:NAME — match any listed ability
@@ -1395,183 +3491,302 @@ def show_filter_help():
  id:NNN or #NNN — match Pokédex ID prefix or exact with #
  Numeric: hp/attack/defense/sp. atk/sp. def/speed/bst with >, <, >=, <=, =
  examples: hp>=100 speed<120 bst>500
+ fused.STAT — numeric filter on the fusion with the species in the other slot
+   (stats: hp/attack/defense/spatk/spdef/speed/bst), e.g. fused.speed>=100 fused.bst>550
 """
-        messagebox.showinfo('Search Filter Help', message)
-    except Exception:
-        pass
+            messagebox.showinfo('Search Filter Help', message)
+        except Exception:
+            pass
 
-help_menu.add_command(label='Search Filters', command=show_filter_help)
-
-# Populate View menu
-view_menu.add_command(label='Display Options', command=show_display_options, accelerator='Ctrl+Shift+D')
-view_menu.add_separator()
-view_menu.add_checkbutton(label='Quick Compare', variable=display_vars['fusion']['quick_compare'], onvalue=True, offvalue=False, command=refresh_after_passive_toggle)
-cmp = tk.Menu(view_menu, tearoff=0)
-cmp.add_radiobutton(label='Compare vs Pokémon 1', variable=quick_compare_target_var, value='p1', command=refresh_after_passive_toggle)
-cmp.add_radiobutton(label='Compare vs Pokémon 2', variable=quick_compare_target_var, value='p2', command=refresh_after_passive_toggle)
-view_menu.add_cascade(label='Compare vs', menu=cmp)
-view_menu.add_separator()
-view_menu.add_checkbutton(label='Passive Active', variable=passive_active_var, onvalue=True, offvalue=False, command=refresh_after_passive_toggle)
-view_menu.add_separator()
-# Status bar toggle wiring (normalized)
-view_menu.add_checkbutton(label='Show Status Bar', variable=show_status_bar_var, onvalue=True, offvalue=False, command=lambda: (status_bar.pack(side=tk.BOTTOM, fill=tk.X) if show_status_bar_var.get() else status_bar.pack_forget()))
-# Initialize Master gating once at startup
-on_toggle_master_logs()
-
-# Challenges — Flip Stat
-challenges_menu.add_checkbutton(label='Flip Stat Challenge', variable=flip_stat_var, onvalue=True, offvalue=False, command=refresh_after_challenge_toggle)
-
-# Challenges — Inverse Battle
-challenges_menu.add_checkbutton(label='Inverse Battle Challenge', variable=inverse_battle_var, onvalue=True, offvalue=False, command=refresh_after_challenge_toggle)
-# One-shot toolbar integrity verification (idempotent)
-try:
-    _verify_challenges_menu_integrity()
-except Exception:
-    pass
-
-
-# Main layout
-main_frame = ttk.Frame(root); main_frame.pack(fill=tk.BOTH, expand=True, padx=10)
-for i in range(20): main_frame.grid_rowconfigure(i, weight=1)
-for i in range(5):  main_frame.grid_columnconfigure(i, weight=1)
-
-# Left search
-pokemon1_label = ttk.Label(main_frame, text='Search Pokémon 1:', font=('Arial', 10))
-pokemon1_label.grid(row=2, column=0, padx=6, sticky='e')
-pokemon1_var = tk.StringVar(); pokemon1_filter_var = tk.StringVar()
-pokemon1_entry = ttk.Entry(main_frame, textvariable=pokemon1_filter_var, width=20)
-pokemon1_entry.grid(row=2, column=1, padx=6, sticky='w')
-
-# Buttons
-button_frame = ttk.Frame(main_frame); button_frame.grid(row=1, column=2)
-fusion_button = ttk.Button(button_frame, text='Fuse', command=lambda: calculate_fusion_stats(pokemon1_var.get(), pokemon2_var.get()))
-fusion_button.pack(side=tk.LEFT, padx=5)
-swap_button = ttk.Button(button_frame, text='Swap', command=swap_pokemon)
-swap_button.pack(side=tk.LEFT, padx=5)
-
-def clear_selections():
-    global HAS_FUSION
-    HAS_FUSION = False
+    help_menu.add_command(label='Search Filters', command=show_filter_help)
+
+    # Populate View menu
+    view_menu.add_command(label='Display Options', command=lambda: show_display_options(root), accelerator='Ctrl+Shift+D')
+    view_menu.add_separator()
+    view_menu.add_checkbutton(label='Quick Compare', variable=display_vars['fusion']['quick_compare'], onvalue=True, offvalue=False, command=lambda: refresh_after_passive_toggle(TOOL_WINDOW_REFRESH))
+    cmp = tk.Menu(view_menu, tearoff=0)
+    cmp.add_radiobutton(label='Compare vs Pokémon 1', variable=quick_compare_target_var, value='p1', command=lambda: refresh_after_passive_toggle(TOOL_WINDOW_REFRESH))
+    cmp.add_radiobutton(label='Compare vs Pokémon 2', variable=quick_compare_target_var, value='p2', command=lambda: refresh_after_passive_toggle(TOOL_WINDOW_REFRESH))
+    view_menu.add_cascade(label='Compare vs', menu=cmp)
+    view_menu.add_separator()
+    view_menu.add_checkbutton(label='Passive Active', variable=passive_active_var, onvalue=True, offvalue=False, command=lambda: refresh_after_passive_toggle(TOOL_WINDOW_REFRESH))
+    view_menu.add_separator()
+    # Status bar toggle wiring (normalized)
+    view_menu.add_checkbutton(label='Show Status Bar', variable=show_status_bar_var, onvalue=True, offvalue=False, command=lambda: (status_bar.pack(side=tk.BOTTOM, fill=tk.X) if show_status_bar_var.get() else status_bar.pack_forget()))
+    # Initialize Master gating once at startup
+    on_toggle_master_logs()
+
+    # Challenges — Flip Stat
+    challenges_menu.add_checkbutton(label='Flip Stat Challenge', variable=flip_stat_var, onvalue=True, offvalue=False, command=lambda: refresh_after_challenge_toggle(TOOL_WINDOW_REFRESH))
+
+    # Challenges — Inverse Battle
+    challenges_menu.add_checkbutton(label='Inverse Battle Challenge', variable=inverse_battle_var, onvalue=True, offvalue=False, command=lambda: refresh_after_challenge_toggle(TOOL_WINDOW_REFRESH))
+    # One-shot toolbar integrity verification (idempotent)
     try:
-        update_fusion_option_states()
+        startup_phase('menus')
+        _verify_challenges_menu_integrity()
     except Exception:
         pass
-    pokemon1_var.set(''); pokemon2_var.set(''); pokemon1_filter_var.set(''); pokemon2_filter_var.set('')
-    pokemon1_filtered_listbox.selection_clear(0, tk.END); pokemon2_filtered_listbox.selection_clear(0, tk.END)
-    pokemon1_name.config(text=''); pokemon2_name.config(text='')
-    pokemon1_info.delete('1.0', tk.END); pokemon2_info.delete('1.0', tk.END); fusion_info.delete('1.0', tk.END)
-    pokemon1_id.config(text=''); pokemon2_id.config(text='')
-    pokemon1_filtered_listbox.delete(0, tk.END); pokemon2_filtered_listbox.delete(0, tk.END)
-    for name in pokemon_stats:
-        pokemon1_filtered_listbox.insert(tk.END, name); pokemon2_filtered_listbox.insert(tk.END, name)
-    try: active_ability_combo['values'] = ['']; active_ability_var.set('')
-    except Exception: pass
-    try: status_text.set(STR['ready'])
-    except Exception: pass
+    startup_phase('menu integrity audit')
+
+
+    # Main layout
+    main_frame = ttk.Frame(root); main_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+    for i in range(20): main_frame.grid_rowconfigure(i, weight=1)
+    for i in range(5):  main_frame.grid_columnconfigure(i, weight=1)
+
+    # Left search
+    pokemon1_label = ttk.Label(main_frame, text='Search Pokémon 1:', font=('Arial', 10))
+    pokemon1_label.grid(row=2, column=0, padx=6, sticky='e')
+    pokemon1_var = tk.StringVar(); pokemon1_filter_var = tk.StringVar()
+    pokemon1_entry = ttk.Entry(main_frame, textvariable=pokemon1_filter_var, width=20)
+    pokemon1_entry.grid(row=2, column=1, padx=6, sticky='w')
+
+    # Buttons
+    button_frame = ttk.Frame(main_frame); button_frame.grid(row=1, column=2)
+    fusion_button = ttk.Button(button_frame, text='Fuse', command=lambda: calculate_fusion_stats(pokemon1_var.get(), pokemon2_var.get()))
+    fusion_button.pack(side=tk.LEFT, padx=5)
+    swap_button = ttk.Button(button_frame, text='Swap', command=swap_pokemon)
+    swap_button.pack(side=tk.LEFT, padx=5)
+
+    def clear_selections():
+        global HAS_FUSION
+        HAS_FUSION = False
+        try:
+            update_fusion_option_states()
+        except Exception:
+            pass
+        pokemon1_var.set(''); pokemon2_var.set(''); pokemon1_filter_var.set(''); pokemon2_filter_var.set('')
+        pokemon1_filtered_listbox.selection_clear(0, tk.END); pokemon2_filtered_listbox.selection_clear(0, tk.END)
+        pokemon1_name.config(text=''); pokemon2_name.config(text='')
+        pokemon1_info.delete('1.0', tk.END); pokemon2_info.delete('1.0', tk.END); fusion_info.delete('1.0', tk.END); _SECTION_STATE.clear()
+        pokemon1_id.config(text=''); pokemon2_id.config(text='')
+        pokemon1_filtered_listbox.delete(0, tk.END); pokemon2_filtered_listbox.delete(0, tk.END)
+        for name in pokemon_stats:
+            pokemon1_filtered_listbox.insert(tk.END, name); pokemon2_filtered_listbox.insert(tk.END, name)
+        try: active_ability_combo['values'] = ['']; active_ability_var.set('')
+        except Exception: pass
+        try: status_text.set(STR['ready'])
+        except Exception: pass
 
-clear_button = ttk.Button(button_frame, text='Clear', command=clear_selections)
-clear_button.pack(side=tk.LEFT, padx=5)
-
-# Options row
-options_frame = ttk.Frame(main_frame); options_frame.grid(row=2, column=2, sticky='n', pady=2)
-options_frame.grid_columnconfigure(0, weight=1); options_frame.grid_columnconfigure(1, weight=1)
-active_ability_var = tk.StringVar(value='')
-active_ability_label = ttk.Label(options_frame, text='Active Ability:')
-active_ability_label.grid(row=0, column=0, sticky='e', padx=5, pady=(0, 2))
-active_ability_combo = ttk.Combobox(options_frame, textvariable=active_ability_var, width=22, state='readonly')
-active_ability_combo.grid(row=0, column=1, sticky='w', padx=5, pady=(0, 2))
-active_ability_combo.bind('<<ComboboxSelected>>', lambda e: (status_text.set('Active ability changed — press Fuse to recalc') if 'status_text' in globals() else None))
-
-# Right search
-pokemon2_label = ttk.Label(main_frame, text='Search Pokémon 2:', font=('Arial', 10))
-pokemon2_label.grid(row=2, column=3, padx=6, sticky='e')
-pokemon2_var = tk.StringVar(); pokemon2_filter_var = tk.StringVar()
-pokemon2_entry = ttk.Entry(main_frame, textvariable=pokemon2_filter_var, width=20)
-pokemon2_entry.grid(row=2, column=4, padx=6, sticky='w')
-
-# Columns/panels
-pokemon1_filtered_label = ttk.Label(main_frame, text='Pokémon 1:', font=('Arial', 10, 'bold'))
-pokemon1_filtered_label.grid(row=3, column=0, sticky=tk.N, padx=10)
-pokemon1_filtered_listbox = tk.Listbox(main_frame, width=26)
-pokemon1_filtered_listbox.grid(row=4, column=0, rowspan=10, sticky=tk.NSEW, padx=10)
-
-pokemon1_name = ttk.Label(main_frame, font=('Arial', 12, 'bold'))
-pokemon1_name.grid(row=3, column=1, sticky=tk.N, padx=10)
-pokemon1_info = tk.Text(main_frame, width=50, height=20, font=BODY_FONT_DEF)
-pokemon1_info.grid(row=4, column=1, rowspan=10, sticky=tk.NSEW, padx=10)
-pokemon1_id = ttk.Label(main_frame, font=('Arial', 10))
-pokemon1_id.grid(row=14, column=1, sticky=tk.N, padx=10)
-
-fusion_caption = ttk.Label(main_frame, text='Fusion Result', font=('Arial', 12, 'bold'))
-fusion_caption.grid(row=3, column=2, sticky=tk.N, padx=10)
-fusion_info = tk.Text(main_frame, width=50, height=20, font=BODY_FONT_DEF)
-fusion_info.grid(row=4, column=2, rowspan=10, sticky=tk.NSEW, padx=10)
-
-pokemon2_name = ttk.Label(main_frame, font=('Arial', 12, 'bold'))
-pokemon2_name.grid(row=3, column=3, sticky=tk.N, padx=10)
-pokemon2_info = tk.Text(main_frame, width=50, height=20, font=BODY_FONT_DEF)
-pokemon2_info.grid(row=4, column=3, rowspan=10, sticky=tk.NSEW, padx=10)
-pokemon2_id = ttk.Label(main_frame, font=('Arial', 10))
-pokemon2_id.grid(row=14, column=3, sticky=tk.N, padx=10)
-
-pokemon2_filtered_label = ttk.Label(main_frame, text='Pokémon 2:', font=('Arial', 10, 'bold'))
-pokemon2_filtered_label.grid(row=3, column=4, sticky=tk.N, padx=10)
-pokemon2_filtered_listbox = tk.Listbox(main_frame, width=26)
-pokemon2_filtered_listbox.grid(row=4, column=4, rowspan=10, sticky=tk.NSEW, padx=10)
-
-# Bind selection
-
-def on_select(event, selected_var, filter_var, pokemon_name, pokemon_info, pokemon_id, sticky_filters_var):
-    sel = event.widget.curselection();
-    if not sel: return
-    selected_pokemon = event.widget.get(sel[0]); selected_var.set(selected_pokemon)
-    if not sticky_filters_var.get(): filter_var.set(selected_pokemon)
-    fill_side_panel(selected_pokemon, pokemon_info, pokemon_id, pokemon_name)
-    if event.widget == pokemon2_filtered_listbox:
-        populate_active_abilities_for(selected_pokemon); maybe_recalc_if_ready()
-    else:
-        maybe_recalc_if_ready()
+    clear_button = ttk.Button(button_frame, text='Clear', command=clear_selections)
+    clear_button.pack(side=tk.LEFT, padx=5)
+
+    # Options row
+    options_frame = ttk.Frame(main_frame); options_frame.grid(row=2, column=2, sticky='n', pady=2)
+    options_frame.grid_columnconfigure(0, weight=1); options_frame.grid_columnconfigure(1, weight=1)
+    active_ability_var = tk.StringVar(value='')
+    active_ability_label = ttk.Label(options_frame, text='Active Ability:')
+    active_ability_label.grid(row=0, column=0, sticky='e', padx=5, pady=(0, 2))
+    active_ability_combo = ttk.Combobox(options_frame, textvariable=active_ability_var, width=22, state='readonly')
+    active_ability_combo.grid(row=0, column=1, sticky='w', padx=5, pady=(0, 2))
+    active_ability_combo.bind('<<ComboboxSelected>>', lambda e: (status_text.set('Active ability changed — press Fuse to recalc') if 'status_text' in globals() else None))
+
+    # Right search
+    pokemon2_label = ttk.Label(main_frame, text='Search Pokémon 2:', font=('Arial', 10))
+    pokemon2_label.grid(row=2, column=3, padx=6, sticky='e')
+    pokemon2_var = tk.StringVar(); pokemon2_filter_var = tk.StringVar()
+    pokemon2_entry = ttk.Entry(main_frame, textvariable=pokemon2_filter_var, width=20)
+    pokemon2_entry.grid(row=2, column=4, padx=6, sticky='w')
+
+    # Columns/panels
+    pokemon1_filtered_label = ttk.Label(main_frame, text='Pokémon 1:', font=('Arial', 10, 'bold'))
+    pokemon1_filtered_label.grid(row=3, column=0, sticky=tk.N, padx=10)
+    pokemon1_filtered_listbox = tk.Listbox(main_frame, width=26)
+    pokemon1_filtered_listbox.grid(row=4, column=0, rowspan=10, sticky=tk.NSEW, padx=10)
+
+    pokemon1_name = ttk.Label(main_frame, font=('Arial', 12, 'bold'))
+    pokemon1_name.grid(row=3, column=1, sticky=tk.N, padx=10)
+    pokemon1_info = tk.Text(main_frame, width=50, height=20, font=BODY_FONT_DEF)
+    pokemon1_info.grid(row=4, column=1, rowspan=10, sticky=tk.NSEW, padx=10)
+    pokemon1_id = ttk.Label(main_frame, font=('Arial', 10))
+    pokemon1_id.grid(row=14, column=1, sticky=tk.N, padx=10)
+
+    fusion_caption = ttk.Label(main_frame, text='Fusion Result', font=('Arial', 12, 'bold'))
+    fusion_caption.grid(row=3, column=2, sticky=tk.N, padx=10)
+    fusion_info = tk.Text(main_frame, width=50, height=20, font=BODY_FONT_DEF)
+    fusion_info.grid(row=4, column=2, rowspan=10, sticky=tk.NSEW, padx=10)
+
+    pokemon2_name = ttk.Label(main_frame, font=('Arial', 12, 'bold'))
+    pokemon2_name.grid(row=3, column=3, sticky=tk.N, padx=10)
+    pokemon2_info = tk.Text(main_frame, width=50, height=20, font=BODY_FONT_DEF)
+    pokemon2_info.grid(row=4, column=3, rowspan=10, sticky=tk.NSEW, padx=10)
+    pokemon2_id = ttk.Label(main_frame, font=('Arial', 10))
+    pokemon2_id.grid(row=14, column=3, sticky=tk.N, padx=10)
+
+    pokemon2_filtered_label = ttk.Label(main_frame, text='Pokémon 2:', font=('Arial', 10, 'bold'))
+    pokemon2_filtered_label.grid(row=3, column=4, sticky=tk.N, padx=10)
+    pokemon2_filtered_listbox = tk.Listbox(main_frame, width=26)
+    pokemon2_filtered_listbox.grid(row=4, column=4, rowspan=10, sticky=tk.NSEW, padx=10)
+
+    # Bind selection
+
+    def on_select(event, selected_var, filter_var, pokemon_name, pokemon_info, pokemon_id, sticky_filters_var):
+        sel = event.widget.curselection();
+        if not sel: return
+        selected_pokemon = event.widget.get(sel[0]); selected_var.set(selected_pokemon)
+        if not sticky_filters_var.get(): filter_var.set(selected_pokemon)
+        fill_side_panel(selected_pokemon, pokemon_info, pokemon_id, pokemon_name)
+        if event.widget == pokemon2_filtered_listbox:
+            populate_active_abilities_for(selected_pokemon); maybe_recalc_if_ready()
+        else:
+            maybe_recalc_if_ready()
 
-pokemon1_filtered_listbox.bind('<<ListboxSelect>>', lambda e: on_select(e, pokemon1_var, pokemon1_filter_var, pokemon1_name, pokemon1_info, pokemon1_id, sticky_filters_var))
-pokemon2_filtered_listbox.bind('<<ListboxSelect>>', lambda e: on_select(e, pokemon2_var, pokemon2_filter_var, pokemon2_name, pokemon2_info, pokemon2_id, sticky_filters_var))
+    pokemon1_filtered_listbox.bind('<<ListboxSelect>>', lambda e: on_select(e, pokemon1_var, pokemon1_filter_var, pokemon1_name, pokemon1_info, pokemon1_id, sticky_filters_var))
+    pokemon2_filtered_listbox.bind('<<ListboxSelect>>', lambda e: on_select(e, pokemon2_var, pokemon2_filter_var, pokemon2_name, pokemon2_info, pokemon2_id, sticky_filters_var))
 
-for name in pokemon_stats:
-    pokemon1_filtered_listbox.insert(tk.END, name); pokemon2_filtered_listbox.insert(tk.END, name)
+    startup_phase('widgets')
 
-# Debounced search & filter state
-sticky_filters_var = tk.BooleanVar(value=True)
-debounce_p1 = Debouncer(root, delay_ms=150); debounce_p2 = Debouncer(root, delay_ms=150)
-pokemon1_entry.bind('<KeyRelease>', lambda e: debounce_p1.call(lambda: filter_pokemon(e, pokemon1_filter_var, pokemon1_entry, pokemon1_filtered_listbox)))
-pokemon2_entry.bind('<KeyRelease>', lambda e: debounce_p2.call(lambda: filter_pokemon(e, pokemon2_filter_var, pokemon2_entry, pokemon2_filtered_listbox)))
+    # Debounced search & filter state
+    sticky_filters_var = tk.BooleanVar(value=True)
+    debounce_p1 = Debouncer(root, delay_ms=150); debounce_p2 = Debouncer(root, delay_ms=150)
+    pokemon1_entry.bind('<KeyRelease>', lambda e: debounce_p1.call(lambda: filter_pokemon(e, pokemon1_filter_var, pokemon1_entry, pokemon1_filtered_listbox)))
+    pokemon2_entry.bind('<KeyRelease>', lambda e: debounce_p2.call(lambda: filter_pokemon(e, pokemon2_filter_var, pokemon2_entry, pokemon2_filtered_listbox)))
 
-# Status bar
-status_text = tk.StringVar(value=STR['ready'])
-status_bar = ttk.Label(root, textvariable=status_text, anchor='w', relief='sunken', padding=(6, 0))
-status_bar.pack(side=tk.BOTTOM, fill=tk.X)
+    # Status bar
+    status_text = tk.StringVar(value=STR['loading_data'])
+    status_bar = ttk.Label(root, textvariable=status_text, anchor='w', relief='sunken', padding=(6, 0))
+    status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
-print(f"[FusionCalc] Running build {BUILD_TAG}")
+    print(f"[FusionCalc] Running build {BUILD_TAG}")
 
-# Key bindings
-root.bind_all('<Control-Shift-D>', lambda e: show_display_options())
+    # Key bindings
+    root.bind_all('<Control-Shift-D>', lambda e: show_display_options(root))
 
-# Recalc policy
+    # Recalc policy
 
-def force_recalc_if_ready():
-    try:
-        if not (globals().get('HAS_FUSION', False)):
+    def force_recalc_if_ready():
+        try:
+            if not (globals().get('HAS_FUSION', False)):
+                return
+            p1 = pokemon1_var.get().strip() if 'pokemon1_var' in globals() else ''
+            p2 = pokemon2_var.get().strip() if 'pokemon2_var' in globals() else ''
+            if p1 in pokemon_stats and p2 in pokemon_stats: calculate_fusion_stats(p1, p2)
+        except Exception:
+            pass
+
+    def maybe_recalc_if_ready():
+        if not AUTO_RECALC_ON_SELECT:
             return
-        p1 = pokemon1_var.get().strip() if 'pokemon1_var' in globals() else ''
-        p2 = pokemon2_var.get().strip() if 'pokemon2_var' in globals() else ''
-        if p1 in pokemon_stats and p2 in pokemon_stats: calculate_fusion_stats(p1, p2)
-    except Exception:
-        pass
+        try:
+            force_recalc_if_ready()
+        except Exception:
+            pass
 
-def maybe_recalc_if_ready():
-    if not AUTO_RECALC_ON_SELECT:
-        return
-    try:
-        force_recalc_if_ready()
-    except Exception:
-        pass
+    def finish_startup_profile():
+        """--profile-startup: close the first-idle phase, run the warm-up inline as its own phase, print the ranked
+        summary (and dump cProfile stats with --profile-dump FILE), then quit."""
+        startup_phase('first idle')
+        load_pokemon_data_into(pokemon_stats)
+        startup_phase('data load (CSV)')
+        on_data_loaded()
+        startup_phase('listboxes & session restore')
+        interactive = list(_STARTUP_PHASES)
+        for _name, fn in WARMUP_STEPS: fn()
+        startup_phase('warm-up (after first paint)')
+        wall = sum(p[1] for p in _STARTUP_PHASES); cpu = sum(p[2] for p in _STARTUP_PHASES)
+        print(f"[Startup profile] build {BUILD_TAG}, {len(pokemon_stats)} species")
+        print(f"  {'phase':<40}{'wall ms':>10}{'CPU ms':>10}{'share':>8}")
+        for name, w, c in sorted(_STARTUP_PHASES, key=lambda p: -p[1]):
+            print(f"  {name:<40}{w:>10.1f}{c:>10.1f}{w / max(wall, 1e-9):>8.1%}")
+        print(f"  {'time to interactive (data + listboxes)':<40}{sum(p[1] for p in interactive):>10.1f}{sum(p[2] for p in interactive):>10.1f}")
+        print(f"  {'total incl. warm-up':<40}{wall:>10.1f}{cpu:>10.1f}")
+        if _PROFILER is not None:
+            _PROFILER.disable()
+            path = sys.argv[sys.argv.index('--profile-dump') + 1] if sys.argv.index('--profile-dump') + 1 < len(sys.argv) else 'startup.prof'
+            _PROFILER.dump_stats(path); print(f"[Startup profile] cProfile stats written to {path} (python -m pstats {path})")
+        root.destroy()
+
+    # Session snapshot: saved on exit, restored on launch. Selections, filters, toggles, Display Options, pinned
+    # fusions and the roster always come back; the computed fusion and pinned results are reused only when the
+    # snapshot's data fingerprint matches the loaded data, so an unchanged dataset resumes without recalculating.
+    SESSION_VARS = ('pokemon1_var', 'pokemon2_var', 'pokemon1_filter_var', 'pokemon2_filter_var', 'active_ability_var',
+                    'passive_active_var', 'flip_stat_var', 'inverse_battle_var', 'quick_compare_target_var', 'show_status_bar_var',
+                    'sticky_filters_var', 'logs_master_var', 'verbose_logs_var', 'calc_logs_var')
+
+    def session_snapshot() -> dict:
+        g = globals(); pf = _DATA_CACHE.get('pinned_fusions', {})
+        snap = {'format': SESSION_FORMAT, 'data': data_fingerprint(),
+                'vars': {n: g[n].get() for n in SESSION_VARS if n in g},
+                'display': {panel: {k: bool(v.get()) for k, v in keys.items()} for panel, keys in display_vars.items()},
+                'roster': list(_ROSTER), 'pinned': [[list(k), pf.get(k)] for k in _PINNED]}
+        if HAS_FUSION and _FUSION_CACHE:
+            snap['fusion'] = _FUSION_CACHE
+        return snap
+
+    def save_session(path: str = SESSION_PATH):
+        t0 = time.perf_counter()
+        try:
+            tmp = path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f: json.dump(session_snapshot(), f, ensure_ascii=False)
+            os.replace(tmp, path)
+            logging.info(f"[Session] saved to {path} in {(time.perf_counter() - t0) * 1000:.1f}ms")
+        except Exception as e:
+            logging.error(f"[Session] save failed: {e}")
 
-root.mainloop()
+    def restore_session(path: str = SESSION_PATH) -> bool:
+        """Apply a saved session. Returns True when the fusion pane was restored from the snapshot (no recalculation)."""
+        global _FUSION_CACHE, HAS_FUSION
+        t0 = time.perf_counter()
+        try:
+            with open(path, 'r', encoding='utf-8') as f: snap = json.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logging.info(f"[Session] ignoring unreadable {path}: {e}"); return False
+        if snap.get('format') != SESSION_FORMAT:
+            return False
+        g = globals(); same_data = snap.get('data') == data_fingerprint()
+        for n, v in (snap.get('vars') or {}).items():
+            if n in SESSION_VARS and n in g:
+                try: g[n].set(v)
+                except Exception: pass
+        for panel, keys in (snap.get('display') or {}).items():
+            for k, v in keys.items():
+                try: display_vars[panel][k].set(bool(v))
+                except Exception: pass
+        sync_tracer()
+        if not show_status_bar_var.get(): status_bar.pack_forget()
+        _ROSTER[:] = [n for n in snap.get('roster', []) if n in pokemon_stats]
+        cache = _DATA_CACHE.setdefault('pinned_fusions', {}); _PINNED.clear()
+        for key, f in snap.get('pinned', []):
+            key = tuple(key)
+            if len(key) == 3 and key[0] in pokemon_stats and key[1] in pokemon_stats:
+                _PINNED.append(key)
+                if same_data and f: cache[key] = f
+        for fvar, entry, lb in ((pokemon1_filter_var, pokemon1_entry, pokemon1_filtered_listbox), (pokemon2_filter_var, pokemon2_entry, pokemon2_filtered_listbox)):
+            if fvar.get(): filter_pokemon(None, fvar, entry, lb)
+        p1 = pokemon1_var.get().strip(); p2 = pokemon2_var.get().strip(); active = active_ability_var.get()
+        if p1 in pokemon_stats: fill_side_panel(p1, pokemon1_info, pokemon1_id, pokemon1_name)
+        else: pokemon1_var.set('')
+        if p2 in pokemon_stats:
+            fill_side_panel(p2, pokemon2_info, pokemon2_id, pokemon2_name); active_ability_var.set(active); populate_active_abilities_for(p2)
+        else: pokemon2_var.set('')
+        c = snap.get('fusion') or {}; from_snapshot = False
+        if p1 in pokemon_stats and p2 in pokemon_stats and (c.get('p1'), c.get('p2')) == (p1, p2):
+            if same_data:
+                _FUSION_CACHE = c; HAS_FUSION = True; update_fusion_option_states(); from_snapshot = True
+                render_fusion_from(c['p1'], c['p2'], c['fused_type1'], c['fused_type2'], c['fusion_stats'], c['fused_bst'],
+                                   c['active_ability'], c['passive_ability'], bool(passive_active_var.get()))
+            else:
+                calculate_fusion_stats(p1, p2)
+        logging.info(f"[Session] restored from {path} in {(time.perf_counter() - t0) * 1000:.1f}ms"
+                     + ('' if same_data else ' (data changed: results recalculated)'))
+        return from_snapshot
+
+    def quit_app():
+        if SESSION_ENABLED and pokemon_stats: save_session()  # closed before the data loaded: keep the last session
+        root.destroy()
+
+    def on_data_loaded():
+        """Staged startup: fill the listboxes once pokemon_data.csv is loaded, then restore the last session."""
+        for name in pokemon_stats:
+            pokemon1_filtered_listbox.insert(tk.END, name); pokemon2_filtered_listbox.insert(tk.END, name)
+        status_text.set(STR['ready'])
+        if SESSION_ENABLED: restore_session()
+
+    root.protocol('WM_DELETE_WINDOW', quit_app)
+
+    startup_phase('remaining setup (bindings, status bar)')
+    root.after_idle(finish_startup_profile if STARTUP_PROFILE else (lambda: start_warmup(root, on_data_loaded)))
+    root.mainloop()
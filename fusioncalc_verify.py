@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-import sys, os, re, json, hashlib, ast, time
+import sys, os, re, json, hashlib, ast, time, codecs, subprocess
 
 HEADER_RE   = re.compile(r'^\s*#\s*BUILD_HASH:\s*([0-9a-fA-F]{12})\s*$')
 BUILDTAG_RE = re.compile(r'^\s*BUILD_TAG\s*=\s*(["\'])\s*([^"\']*)\s*\1\s*$')
+SVH_VERSION = 'SVH v1'
+CHUNK_SIZE = 1 << 16
+CACHE_PATH = '.fusioncalc_verify_cache.json'
 
 def _normalize(s: str) -> str:
     return s.replace('\r\n','\n').replace('\r','\n')
@@ -27,28 +30,73 @@ def canonicalize(text: str):
 def compute_hash(canon: str) -> str:
     return hashlib.sha256(canon.encode('utf-8')).hexdigest()[:12]
 
+def normalized_lines(chunks):
+    """Decode UTF-8 byte chunks and yield lines with CRLF/CR normalized to LF. Each line keeps its '\\n'
+    (the last may have none), so ''.join(lines) == _normalize(text)."""
+    dec = codecs.getincrementaldecoder('utf-8')()
+    buf = ''; carry = ''
+    for chunk in chunks:
+        s = carry + dec.decode(chunk); carry = ''
+        if s.endswith('\r'):  # may be the first half of a CRLF split across chunks
+            s, carry = s[:-1], '\r'
+        parts = (buf + _normalize(s)).split('\n'); buf = parts.pop()
+        for p in parts:
+            yield p + '\n'
+    parts = (buf + _normalize(carry + dec.decode(b'', final=True))).split('\n'); buf = parts.pop()
+    for p in parts:
+        yield p + '\n'
+    if buf:
+        yield buf
+
+def verify_stream(chunks, t0=None):
+    """verify() over an iterable of byte chunks: canonicalization and hashing happen line by line in one pass.
+    Only the AST gate needs the whole source, so the raw chunks are kept for a single parse at the end."""
+    t0 = time.time() if t0 is None else t0
+    raw = []; size = 0
+    def counted():
+        nonlocal size
+        for chunk in chunks:
+            raw.append(chunk); size += len(chunk)
+            yield chunk
+    h = hashlib.sha256(); header_hash = ''; header_idx = -1; buildtag_val = None
+    for i, line in enumerate(normalized_lines(counted())):
+        body = line[:-1] if line.endswith('\n') else line
+        if i == 0:
+            m = HEADER_RE.match(body)
+            if m:
+                header_idx = 0; header_hash = m.group(1).lower()
+                continue
+        if buildtag_val is None:
+            m = BUILDTAG_RE.match(body)
+            if m:
+                buildtag_val = m.group(2); line = 'BUILD_TAG = ""' + line[len(body):]
+        h.update(line.encode('utf-8'))
+    comp = h.hexdigest()[:12]
+    # AST gate
+    try:
+        ast.parse(b''.join(raw).decode('utf-8'))
+        ast_ok = True
+    except SyntaxError:
+        ast_ok = False
+    return _evidence(comp, header_hash, header_idx, buildtag_val, ast_ok, size, t0)
+
+def _read_chunks(f, size=CHUNK_SIZE):
+    while True:
+        chunk = f.read(size)
+        if not chunk:
+            return
+        yield chunk
+
 def verify(path: str):
     t0 = time.time()
-    raw = open(path,'rb').read()
-    text = raw.decode('utf-8')
-    canon, header_hash, header_idx = canonicalize(text)
-    comp = compute_hash(canon)
+    with open(path, 'rb') as f:
+        return verify_stream(_read_chunks(f), t0)
+
+def _evidence(comp, header_hash, header_idx, buildtag_val, ast_ok, size, t0):
     # Header check
     header_ok = (header_idx == 0 and header_hash == comp)
     # BUILD_TAG check (if present)
-    buildtag_val = None
-    for ln in _normalize(text).split('\n'):
-        m = BUILDTAG_RE.match(ln)
-        if m:
-            buildtag_val = m.group(2)
-            break
     buildtag_ok = (buildtag_val == comp) if buildtag_val is not None else True
-    # AST gate
-    try:
-        ast.parse(text)
-        ast_ok = True
-    except SyntaxError:
-        ast_ok = False
     ok = header_ok and ast_ok and buildtag_ok
     return ok, {
         'reported_hash': header_hash or None,
@@ -58,16 +106,125 @@ def verify(path: str):
         'buildtag_value': buildtag_val,
         'buildtag_matches': (buildtag_val == comp) if buildtag_val is not None else None,
         'ast_ok': ast_ok,
-        'size_bytes': len(raw),
+        'size_bytes': size,
         'duration_ms': round((time.time()-t0)*1000,2),
-        'svh_version': 'SVH v1'
+        'svh_version': SVH_VERSION
     }
 
+# Batch mode: many files and/or every revision of a file in git history, cached by git blob hash
+
+def blob_hash(path: str) -> str:
+    """git's object id for a file's contents (sha1 of 'blob <size>\\0' + bytes), streamed."""
+    h = hashlib.sha1(b'blob %d\0' % os.path.getsize(path))
+    with open(path, 'rb') as f:
+        for chunk in _read_chunks(f):
+            h.update(chunk)
+    return h.hexdigest()
+
+def git_revisions(path: str, rev_range: str = 'HEAD'):
+    """(commit, blob) for every commit in rev_range that changed path, newest first (deletions skipped)."""
+    repo = os.path.dirname(os.path.abspath(path)) or '.'
+    out = subprocess.run(['git', 'log', '--format=commit %H', '--raw', '--no-abbrev', '--no-renames', rev_range, '--', os.path.basename(path)],
+                         cwd=repo, check=True, capture_output=True, text=True).stdout
+    revs = []; commit = None
+    for ln in out.splitlines():
+        if ln.startswith('commit '):
+            commit = ln[7:].strip()
+        elif ln.startswith(':') and commit:
+            blob = ln.split()[3]
+            if set(blob) != {'0'}:
+                revs.append((commit, blob))
+    return revs
+
+def _verify_target(target):
+    """Worker: target is ('file', path) or ('blob', sha, repo_dir); returns (ok, evidence)."""
+    t0 = time.time()
+    if target[0] == 'file':
+        return verify(target[1])
+    proc = subprocess.Popen(['git', 'cat-file', 'blob', target[1]], cwd=target[2], stdout=subprocess.PIPE)
+    try:
+        return verify_stream(_read_chunks(proc.stdout), t0)
+    finally:
+        proc.stdout.close(); proc.wait()
+
+def load_cache(path: str) -> dict:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data.get('entries', {}) if data.get('svh_version') == SVH_VERSION else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(path: str, entries: dict):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({'svh_version': SVH_VERSION, 'entries': entries}, f)
+    os.replace(tmp, path)
+
+def verify_batch(paths=(), git_path=None, rev_range='HEAD', jobs=None, cache_path=CACHE_PATH):
+    """Verify files and/or every revision of git_path in rev_range. Results are cached by blob hash (content
+    identity), misses run across a process pool. Returns the JSON report dict."""
+    t0 = time.time()
+    cache = load_cache(cache_path) if cache_path else {}
+    items = []  # (result skeleton, blob, target)
+    for p in paths:
+        items.append(({'target': p}, blob_hash(p), ('file', p)))
+    if git_path:
+        repo = os.path.dirname(os.path.abspath(git_path)) or '.'
+        for commit, blob in git_revisions(git_path, rev_range):
+            items.append(({'target': f"{commit[:12]}:{os.path.basename(git_path)}", 'commit': commit}, blob, ('blob', blob, repo)))
+    todo = {}
+    for _res, blob, target in items:
+        if blob not in cache and blob not in todo:
+            todo[blob] = target
+    fresh = {}
+    if todo:
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1 or len(todo) == 1:
+            fresh = {blob: _verify_target(t) for blob, t in todo.items()}
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as ex:
+                fresh = dict(zip(todo, ex.map(_verify_target, todo.values())))
+        for blob, (ok, ev) in fresh.items():
+            cache[blob] = {'ok': ok, 'evidence': ev}
+        if cache_path:
+            save_cache(cache_path, cache)
+    results = []
+    for res, blob, _target in items:
+        entry = cache[blob]; cached = blob not in fresh
+        ev = dict(entry['evidence'])
+        if cached:
+            ev['duration_ms'] = 0.0  # nothing was re-verified
+        results.append(dict(res, blob=blob, ok=entry['ok'], cached=cached, evidence=ev))
+        fresh.pop(blob, None)  # later duplicates of the same blob count as cached
+    return {'ok': all(r['ok'] for r in results), 'svh_version': SVH_VERSION, 'count': len(results),
+            'failed': sum(not r['ok'] for r in results), 'cache_hits': sum(r['cached'] for r in results),
+            'verified': len(todo), 'duration_ms': round((time.time() - t0) * 1000, 2), 'results': results}
+
 def main(argv):
-    path = argv[1] if len(argv) > 1 else 'fusioncalc_test.py'
-    ok, ev = verify(path)
-    print(json.dumps({'ok': ok, 'evidence': ev}, indent=2))
-    return 0 if ok else 2
+    if len(argv) <= 2 and not any(a.startswith('--') for a in argv[1:]):
+        path = argv[1] if len(argv) > 1 else 'fusioncalc_test.py'
+        ok, ev = verify(path)
+        print(json.dumps({'ok': ok, 'evidence': ev}, indent=2))
+        return 0 if ok else 2
+    import argparse
+    ap = argparse.ArgumentParser(prog='fusioncalc_verify.py', description='Verify BUILD_HASH/BUILD_TAG for many files and/or git revisions.')
+    ap.add_argument('paths', nargs='*', help='files to verify')
+    ap.add_argument('--git', metavar='FILE', help='also verify every revision of FILE in its git history')
+    ap.add_argument('--revs', default='HEAD', help='revision range for --git (default: HEAD, i.e. all history)')
+    ap.add_argument('--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    ap.add_argument('--cache', default=CACHE_PATH, help=f'result cache keyed by blob hash (default: {CACHE_PATH}; "" disables)')
+    ap.add_argument('--out', help='write the JSON report here instead of stdout')
+    args = ap.parse_args(argv[1:])
+    report = verify_batch(args.paths, args.git, args.revs, args.jobs, args.cache or None)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0 if report['ok'] else 2
 
 if __name__ == '__main__':
     raise SystemExit(main(sys.argv))
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope='session')
+def fc():
+    """The engine with pokemon_data.csv loaded (paths in fusioncalc are relative to the working directory)."""
+    cwd = os.getcwd(); os.chdir(ROOT)
+    try:
+        import fusioncalc
+        fusioncalc.ensure_data_loaded(); fusioncalc.data_fingerprint()
+    finally:
+        os.chdir(cwd)
+    return fusioncalc
+
+
+@pytest.fixture
+def small_dex(fc, monkeypatch):
+    """Factory: swap in a seeded subset of the dex as species_arrays() (and drop the lookups built on it) for
+    quadratic oracles that cannot run over every pair. Restored after the test."""
+    from array import array
+    import random
+
+    def make(size, seed):
+        sa = fc.species_arrays(); rows = sorted(random.Random(seed).sample(range(len(sa['names'])), size))
+        names = [sa['names'][r] for r in rows]
+        sub = {'names': names, 'row': {nm: i for i, nm in enumerate(names)},
+               'stats': array('H', (sa['stats'][r * 6 + k] for r in rows for k in range(6))),
+               'typing': [sa['typing'][r] for r in rows]}
+        monkeypatch.setitem(fc._DATA_CACHE, 'species_arrays', sub)
+        for key in ('stat_kdtree', 'stat_kdtree_norm', 'stat_sorted_index', 'species_classes'):
+            monkeypatch.setitem(fc._DATA_CACHE, key, None)  # rebuilt from the subset, dropped again on teardown
+        return sub
+    return make
@@ -0,0 +1,61 @@
+"""Compiled ability contexts against the sequential immunity -> halve -> multiply -> Wonder Guard path they replaced."""
+import pytest
+
+
+def old_effectiveness(fc, type1, type2, active, passive, inverse):
+    """The pre-compilation calculate_type_effectiveness(), step by step on a dict."""
+    def factor(def_type):
+        result = {t: 1.0 for t in fc.type_effectiveness}
+        te = fc.type_effectiveness[def_type]
+        for w in te['weaknesses']: result[w] *= 2.0
+        for r in te['resistances']: result[r] *= 0.5
+        for im in te['immunities']: result[im] = 0.0
+        return result
+    f1 = factor(type1); f2 = factor(type2) if type2 != type1 else None
+    eff = {}
+    for atk in fc.type_effectiveness:
+        v1 = f1[atk]; v2 = f2[atk] if f2 else 1.0
+        if inverse: v1 = fc._invert(v1); v2 = fc._invert(v2)
+        eff[atk] = v1 * v2
+    for which in (active, passive):
+        e = fc.ABILITY_EFFECTS.get(which)
+        if not e: continue
+        for t in e.get('immunities', []): eff[t] = 0.0
+        for t in e.get('halve', []): eff[t] *= 0.5
+        for t, v in e.get('multiply', {}).items(): eff[t] *= float(v)
+    if 'WONDER GUARD' in (active, passive):
+        eff = {t: 0.0 if v < 2 else v for t, v in eff.items()}
+    return tuple(eff[t] for t in fc.TYPE_ORDER)
+
+
+@pytest.mark.parametrize('inverse', [False, True])
+def test_every_typing_and_ability_pair(fc, inverse):
+    keys = [''] + sorted(fc.ABILITY_EFFECTS) + ['PRESSURE']  # '' and an ability without effects are neutral
+    typings = [(a, b) for a in fc.TYPE_ORDER for b in fc.TYPE_ORDER]
+    vecs = [fc.defense_vector(a, b, inverse) for a, b in typings]
+    for active in keys:
+        for passive in keys:
+            ctx = fc.ability_context(active, passive)
+            batch = ctx.apply_batch(vecs)
+            for (a, b), vec, got in zip(typings, vecs, batch):
+                want = old_effectiveness(fc, a, b, active, passive, inverse)
+                assert ctx.apply(vec) == got == want, (a, b, active, passive)
+
+
+@pytest.mark.parametrize('immunity', ['LEVITATE', 'WATER ABSORB', 'DRY SKIN', 'FLASH FIRE', 'SAP SIPPER'])
+def test_wonder_guard_with_immunity(fc, immunity):
+    for active, passive in (('WONDER GUARD', immunity), (immunity, 'WONDER GUARD')):
+        for inverse in (False, True):
+            for a in fc.TYPE_ORDER:
+                for b in fc.TYPE_ORDER:
+                    got = fc.calculate_type_effectiveness(a, b, active, passive, inverse)
+                    want = old_effectiveness(fc, a, b, active, passive, inverse)
+                    assert tuple(got[t] for t in fc.TYPE_ORDER) == want
+                    assert all(v == 0.0 or v >= 2.0 for v in want)
+                    for t in fc.ABILITY_EFFECTS[immunity]['immunities']:
+                        assert got[t] == 0.0
+
+
+def test_ability_names_are_normalized(fc):
+    assert fc.ability_context(' wonder guard', 'Levitate').threshold == 2.0
+    assert fc.ability_context('Wonder Guard', 'levitate').immune_mask == 1 << fc.TYPE_INDEX['Ground']
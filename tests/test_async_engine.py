@@ -0,0 +1,104 @@
+import asyncio
+import itertools
+import threading
+import time
+
+
+def slow_iter_fusions(fc, monkeypatch, delay=0.2):
+    """Wrap iter_fusions so a search job takes `delay` seconds; returns [calls, peak concurrent jobs, running]."""
+    orig = fc.iter_fusions; counts = [0, 0, 0]; lock = threading.Lock()
+    def wrapped(*a, **k):
+        with lock:
+            counts[0] += 1; counts[2] += 1; counts[1] = max(counts[1], counts[2])
+        try:
+            time.sleep(delay); yield from orig(*a, **k)
+        finally:
+            with lock: counts[2] -= 1
+    monkeypatch.setattr(fc, 'iter_fusions', wrapped)
+    return counts
+
+
+def test_cancelled_owner_does_not_cancel_coalesced_waiters(fc, monkeypatch):
+    orig = fc.iter_fusions; counts = slow_iter_fusions(fc, monkeypatch)
+    async def main():
+        eng = fc.AsyncFusionEngine()
+        first = asyncio.create_task(eng.search(where='fused.bst>=300', limit=50))
+        second = asyncio.create_task(eng.search(where='fused.bst>=300', limit=50))
+        await asyncio.sleep(0.05); first.cancel()
+        res = await second
+        assert first.cancelled()
+        assert eng.stats['coalesced'] == 1 and counts[0] == 1
+        assert res == list(itertools.islice(orig(where='fused.bst>=300'), 50))
+        assert eng._inflight == {} and eng._waiters == {}
+    asyncio.run(main())
+
+
+def test_last_waiter_cancelled_cancels_job(fc, monkeypatch):
+    slow_iter_fusions(fc, monkeypatch)
+    async def main():
+        eng = fc.AsyncFusionEngine()
+        tasks = [asyncio.create_task(eng.search(where='fused.bst>=300', limit=5)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        for t in tasks: t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert eng._inflight == {} and eng._waiters == {}
+        # a fresh identical request starts a new job instead of joining the cancelled one
+        assert len(await eng.search(where='fused.bst>=300', limit=5)) == 5
+    asyncio.run(main())
+
+
+def test_concurrent_fuse_calls_are_coalesced_and_offloaded(fc, monkeypatch):
+    loop_thread = threading.get_ident(); seen = set(); orig = fc.fuse_pair
+    def spy(*a):
+        seen.add(threading.get_ident()); return orig(*a)
+    monkeypatch.setattr(fc, 'fuse_pair', spy)
+    async def main():
+        eng = fc.AsyncFusionEngine(max_concurrency=1)
+        res = await asyncio.gather(*[eng.fuse('Bulbasaur', 'Mewtwo', 'Pressure') for _ in range(10)])
+        assert eng.stats['computed'] == 1 and eng.stats['coalesced'] == 9 and eng.stats['jobs'] == 1
+        assert seen and loop_thread not in seen
+        assert all(r == res[0] for r in res)
+        assert res[0]['fused_bst'] == orig('Bulbasaur', 'Mewtwo', 'Pressure')['fused_bst']
+    asyncio.run(main())
+
+
+def test_fuse_many_respects_concurrency_limit(fc, monkeypatch):
+    active = [0, 0]; lock = threading.Lock(); orig = fc.fuse_pair
+    def slow(*a):
+        with lock: active[0] += 1; active[1] = max(active[1], active[0])
+        try:
+            time.sleep(0.01); return orig(*a)
+        finally:
+            with lock: active[0] -= 1
+    monkeypatch.setattr(fc, 'fuse_pair', slow)
+    async def main():
+        eng = fc.AsyncFusionEngine(max_concurrency=2)
+        names = fc.species_arrays()['names']
+        batches = [[(names[i], names[j])] for i, j in zip(range(100, 108), range(200, 208))]
+        res = await asyncio.gather(*[eng.fuse_many(b) for b in batches])
+        assert active[1] <= 2 and eng.stats['jobs'] == 8
+        assert [r[0]['p1'] for r in res] == [b[0][0] for b in batches]
+    asyncio.run(main())
+
+
+def test_result_cache_is_bounded_and_never_evicts_pins(fc, monkeypatch):
+    cache = fc._FUSION_RESULTS; cache.clear(); monkeypatch.setattr(cache, 'maxsize', 8)
+    monkeypatch.setattr(cache, 'hits', 0); monkeypatch.setattr(cache, 'misses', 0)
+    names = fc.species_arrays()['names']; pairs = [(names[i], names[i + 1]) for i in range(300, 320)]
+    pinned = fc.pinned_fusion(*pairs[0])
+    calls = []; orig = fc.fuse_pair
+    monkeypatch.setattr(fc, 'fuse_pair', lambda *a: calls.append(a) or orig(*a))
+    async def main():
+        eng = fc.AsyncFusionEngine()
+        await eng.fuse_many(pairs)
+        assert len(cache) == 8 and eng.stats['computed'] == 19 and eng.stats['cached'] == 1
+        assert cache.stats()['misses'] == 20 and cache.stats()['size'] == 8
+        again = await eng.fuse_many(pairs[-8:])
+        assert eng.stats['cached'] == 9 and cache.stats()['hits'] == 9 and len(calls) == 19
+        return again
+    again = asyncio.run(main())
+    assert [(f['p1'], f['p2']) for f in again] == pairs[-8:]
+    assert fc._FUSION_RESULTS.get(pairs[0] + ('',)) is None  # evicted from the LRU ...
+    assert fc.pinned_fusion(*pairs[0]) is pinned and len(calls) == 19  # ... but the pin still holds its result
+    fc.prune_pinned_fusions([])
+    assert pairs[0] + ('',) not in fc._DATA_CACHE['pinned_fusions']
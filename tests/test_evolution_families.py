@@ -0,0 +1,16 @@
+def species(line):
+    return {'evolution line': line, 'Abilities': [], 'Passive': '', 'Type_1': 'Normal', 'Type_2': '',
+            'HP': 50, 'Attack': 50, 'Defense': 50, 'Sp. Atk': 50, 'Sp. Def': 50, 'Speed': 50}
+
+
+def test_own_line_is_kept_when_lines_merge_into_one_family(fc, monkeypatch):
+    # B and C are each listed by two different lines, so A, B, C and D form one union-find family
+    data = {'A': species('A, B'), 'B': species('A, B'), 'C': species('B, C, Ghost'), 'D': species('C, D')}
+    monkeypatch.setattr(fc, 'pokemon_stats', data)
+    monkeypatch.setattr(fc, '_DATA_CACHE', {})
+    fam = fc.evolution_families(); row = fc.species_arrays()['row']
+    assert len(set(fam['family'])) == 1
+    assert fam['own'][row['A']] == (row['A'], row['B'])
+    assert fam['own'][row['C']] == (row['B'], row['C'], 'Ghost')
+    assert fam['own'][row['D']] == (row['C'], row['D'])
+    assert fc.family_of('A') == ['A', 'B', 'C', 'D']
@@ -0,0 +1,54 @@
+"""Fused stats are stored as integer tenths; they must match the old float average rounded to one decimal."""
+import random
+
+
+def avg_round_tenth(a, b):
+    """The pre-fixed-point fused stat: a float rounded to one decimal."""
+    return round((float(a) + float(b)) / 2.0, 1)
+
+
+def old_fusion(fc, p1, p2):
+    s1 = fc.pokemon_stats[p1]; s2 = fc.pokemon_stats[p2]
+    stats = {k: avg_round_tenth(s1[k], s2[k]) for k in fc.STAT_KEYS}
+    bst = round(sum(stats.values()), 1)
+    return stats, bst, bst - float(s1['BST']), bst - float(s2['BST'])
+
+
+def test_avg_tenths_matches_float_path_for_every_stat_pair(fc):
+    for a in range(256):
+        for b in range(a, 256):
+            old = avg_round_tenth(a, b); new = fc.avg_tenths(a, b)
+            assert new == fc.avg_tenths(b, a) and abs(old * 10 - new) < 1e-9
+            assert fc.format_tenths(new) == fc.format_number_trim(old)
+
+
+def test_format_tenths_matches_format_number_trim(fc):
+    for t in range(-20000, 20001):
+        assert fc.format_tenths(t) == fc.format_number_trim(t / 10), t
+
+
+def fuse_matches(fc, p1, p2):
+    f = fc.fuse_pair(p1, p2)
+    stats, bst, diff1, diff2 = old_fusion(fc, p1, p2)
+    for k in fc.STAT_KEYS:
+        assert fc.format_tenths(f['fusion_stats'][k]) == fc.format_number_trim(stats[k]), (p1, p2, k)
+    assert abs(bst * 10 - f['fused_bst']) < 1e-6, (p1, p2)
+    assert fc.format_tenths(f['fused_bst']) == fc.format_number_trim(bst), (p1, p2)
+    shown = [fc.format_tenths(f['fused_bst'] - 10 * int(fc.pokemon_stats[p]['BST'])) for p in (p1, p2)]
+    assert shown == [fc.format_number_trim(diff1), fc.format_number_trim(diff2)], (p1, p2)
+
+
+def test_fuse_pair_matches_float_path_for_every_p1(fc):
+    names = list(fc.pokemon_stats); rng = random.Random(32)
+    for p1 in names:  # every species as P1 and P2, against a random sample of partners
+        for p2 in rng.sample(names, 24):
+            fuse_matches(fc, p1, p2); fuse_matches(fc, p2, p1)
+
+
+def test_fused_bst_is_exact_sum_of_stats(fc):
+    names = list(fc.pokemon_stats)
+    for p1 in names[::7]:
+        for p2 in names:
+            f = fc.fuse_pair(p1, p2)
+            assert f['fused_bst'] == sum(f['fusion_stats'].values())
+            assert f['fused_bst'] == 5 * (sum(int(fc.pokemon_stats[p1][k]) for k in fc.STAT_KEYS) + sum(int(fc.pokemon_stats[p2][k]) for k in fc.STAT_KEYS))
@@ -0,0 +1,64 @@
+"""search_fused_constraints() (sorted-index bounds, per-class memo) against a brute-force fuse_pair() scan."""
+import operator
+import random
+
+import pytest
+
+OPS = {'=': operator.eq, '==': operator.eq, '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+KEYS = {'hp': 'HP', 'attack': 'Attack', 'defense': 'Defense', 'sp.atk': 'Sp. Atk', 'spatk': 'Sp. Atk',
+        'sp.def': 'Sp. Def', 'spdef': 'Sp. Def', 'speed': 'Speed', 'bst': None}
+
+
+@pytest.fixture(scope='module')
+def p1_rows(fc):
+    """Seeded P1 rows, plus every member of two multi-member classes (exercises the per-class memo)."""
+    cls = fc.species_classes()['p1']; rng = random.Random(30)
+    shared = [m for m in cls['members'] if len(m) > 1][:2]
+    return sorted(set(rng.sample(range(len(fc.species_arrays()['names'])), 12)) | {r for m in shared for r in m})
+
+
+def brute_force(fc, tokens, p1_rows, p2_rows=None):
+    names = fc.species_arrays()['names']; checks = []
+    for t in tokens:
+        stat, op, v = fc.FUSED_TOKEN_RE.match(t).groups()
+        checks.append((KEYS[stat], OPS[op], float(v) * 10))
+    out = []
+    for a in p1_rows:
+        for b in (range(len(names)) if p2_rows is None else p2_rows):
+            if a == b: continue
+            f = fc.fuse_pair(names[a], names[b])
+            if all(cmp(f['fused_bst'] if k is None else f['fusion_stats'][k], v) for k, cmp, v in checks):
+                out.append((a, b))
+    return sorted(out)
+
+
+@pytest.mark.parametrize('tokens', [
+    ['fused.hp=80'], ['fused.hp==80'], ['fused.attack<60'], ['fused.defense<=55'], ['fused.speed>110'], ['fused.sp.def>=95'],
+    ['fused.bst>=520'], ['fused.bst<400', 'fused.speed>=70'], ['fused.sp.atk>100'], ['fused.spatk>100', 'fused.spdef<80'],
+    ['fused.hp=80.5'], ['fused.speed>=90.5', 'fused.bst<=500'], ['fused.attack>=255'],
+])
+def test_matches_brute_force(fc, p1_rows, tokens):
+    constraints, bad = fc.parse_fused_constraints(tokens)
+    assert not bad and len(constraints) == len(tokens)
+    got = sorted(fc.search_fused_constraints(constraints, p1_rows))
+    assert got == brute_force(fc, tokens, p1_rows)
+
+
+def test_spelling_variants_agree(fc):
+    assert fc.parse_fused_constraints(['fused.sp.atk>100'])[0] == fc.parse_fused_constraints(['fused.spatk>100'])[0]
+    assert fc.parse_fused_constraints(['fused.hp==80'])[0] == fc.parse_fused_constraints(['fused.hp=80'])[0]
+
+
+def test_partner_rows_filter(fc, p1_rows):
+    p2_rows = sorted(random.Random(31).sample(range(len(fc.species_arrays()['names'])), 300))
+    tokens = ['fused.bst>=450', 'fused.hp<90']
+    got = sorted(fc.search_fused_constraints(fc.parse_fused_constraints(tokens)[0], p1_rows, p2_rows))
+    assert got and got == brute_force(fc, tokens, p1_rows, p2_rows)
+
+
+@pytest.mark.parametrize('token', ['fused.luck>5', 'fused.hp>=abc', 'fused.speed=>90', 'fused.hp', 'fused.bst>=500x'])
+def test_malformed_tokens(fc, token):
+    constraints, bad = fc.parse_fused_constraints([token, 'fused.hp>50'])
+    assert bad == [token] and len(constraints) == 1
+    with pytest.raises(ValueError):
+        next(fc.iter_fusions(where=token))
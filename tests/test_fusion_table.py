@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+
+@pytest.fixture(scope='module')
+def table(fc, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp('table') / 'fusion_table.bin')
+    fc.build_fusion_table(path)
+    tbl = fc.FusionTable(path)
+    yield tbl
+    tbl.close()
+
+
+def test_table_cells_match_engine(fc, table):
+    sa = fc.species_arrays(); names = sa['names']; rng = random.Random(31)
+    for _ in range(2000):
+        a, b = rng.randrange(len(names)), rng.randrange(len(names))
+        cell = table.lookup(a, b); f = fc.fuse_pair(names[a], names[b])
+        assert [cell[k] for k in ('hp', 'attack', 'defense', 'sp_atk', 'sp_def', 'speed')] == [f['fusion_stats'][k] for k in fc.STAT_KEYS]
+        assert cell['bst'] == f['fused_bst']
+        ti = fc.typing_index(f['fused_type1'], f['fused_type2'])
+        assert cell['typing'] == (fc.NO_TYPING if ti is None else ti)
+        if ti is not None:
+            s1 = fc.pokemon_stats[names[a]]; s2 = fc.pokemon_stats[names[b]]
+            expect = fc.defense_masks(ti, fc._effect_key(s2['Abilities'][0] if s2['Abilities'] else ''), fc._effect_key(s1.get('Passive', '')))
+            assert tuple(cell[k] for k in ('imm', 'res', 'weak', 'weak4')) == expect
+
+
+def test_batch_paths_match_with_and_without_open_table(fc, table, monkeypatch):
+    names = fc.species_arrays()['names']; rng = random.Random(7)
+    p1s = rng.sample(names, 12); roster = rng.sample(names, 15)
+    def results():
+        return ([fc.partner_impact(p, base, inverse, passive) for p in p1s for base in ('p1', 'p2') for inverse in (False, True) for passive in (False, True)],
+                [fc.RosterPlan(roster, inverse, passive).rows() for inverse in (False, True) for passive in (False, True)])
+    monkeypatch.delitem(fc._DATA_CACHE, 'fusion_table', raising=False)
+    computed = results()
+    monkeypatch.setitem(fc._DATA_CACHE, 'fusion_table', table)
+    assert fc.open_fusion_table() is table
+    assert results() == computed
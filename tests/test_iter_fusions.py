@@ -0,0 +1,62 @@
+import operator
+
+import pytest
+
+OPS = {'=': operator.eq, '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+
+
+def brute_force(fc, p1_filter, p2_filter, checks):
+    """Every matching pair through fuse_pair(); checks are (stat key or 'bst', op, value) on the tenths fusion stats."""
+    side = lambda q: [n for n, st in fc.pokemon_stats.items()
+                      if fc.match_filter_tokens(n, st, [t for t in fc.filter_tokens(q) if not t.startswith('fused.')])]
+    out = []
+    for a in side(p1_filter):
+        for b in side(p2_filter):
+            if a == b: continue
+            f = fc.fuse_pair(a, b)
+            if all(OPS[op](f['fused_bst'] if k == 'bst' else f['fusion_stats'][k], v * 10) for k, op, v in checks):
+                out.append((a, b))
+    return sorted(out)
+
+
+@pytest.mark.parametrize('p1_filter, p2_filter, where, checks', [
+    ('type:fire', 'type:water', None, []),
+    ('type:fire', 'type:water', 'fused.speed>=80 fused.bst<470', [('Speed', '>=', 80), ('bst', '<', 470)]),
+    ('type:dragon fused.attack>100', 'hp>=90', None, [('Attack', '>', 100)]),
+    ('type:ghost', '', ['fused.sp.def=72.5'], [('Sp. Def', '=', 72.5)]),
+])
+def test_matches_brute_force(fc, p1_filter, p2_filter, where, checks):
+    got = sorted((f['p1'], f['p2']) for f in fc.iter_fusions(p1_filter, p2_filter, where=where))
+    assert got == brute_force(fc, p1_filter, p2_filter, checks)
+    assert got or not checks  # the bounded cases are not vacuous
+
+
+def test_predicates_and_flags(fc):
+    pred = lambda f: f['fused_type1'] != f['fused_type2']
+    got = list(fc.iter_fusions('type:fire', 'type:water', where=['fused.hp>=70', pred], passive_on=False, inverse=True))
+    assert sorted((f['p1'], f['p2']) for f in got) == [
+        p for p in brute_force(fc, 'type:fire', 'type:water', [('HP', '>=', 70)]) if pred(fc.fuse_pair(*p))]
+    assert all(f['passive_on'] is False and f['flip_on'] is False and f['inverse_on'] is True for f in got)
+
+
+def test_close_stops_work(fc, monkeypatch):
+    calls = []
+    real = fc.fuse_pair
+    monkeypatch.setattr(fc, 'fuse_pair', lambda *a: calls.append(a) or real(*a))
+    gen = fc.iter_fusions()
+    first = [next(gen) for _ in range(5)]
+    assert len(calls) == 5 and [(f['p1'], f['p2']) for f in first] == [c[:2] for c in calls]
+    gen.close()
+    with pytest.raises(StopIteration):
+        next(gen)
+    assert len(calls) == 5
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'where': 'fused.luck>5'},
+    {'where': ['fused.hp>=abc']},
+    {'p1_filter': 'type:fire fused.speed=>90'},
+])
+def test_bad_fused_tokens_raise(fc, kwargs):
+    with pytest.raises(ValueError):
+        next(fc.iter_fusions(**kwargs))
@@ -0,0 +1,55 @@
+"""nearest_fusions() (KD-tree per P1, bounding-box pruning) against a distance over every pair."""
+import random
+import statistics
+
+import pytest
+
+
+def brute_nearest(fc, target, k, normalize=False, fused_typing=None, exclude=()):
+    sa = fc.species_arrays(); st = sa['stats']; typing = sa['typing']; n = len(sa['names'])
+    cols = [[st[r * 6 + c] for r in range(n)] for c in range(6)]
+    scale = [1.0 / statistics.pstdev(col) if normalize else 1.0 for col in cols]
+    out = []
+    for a in range(n):
+        for b in range(n):
+            if a == b or (a, b) in exclude: continue
+            if fused_typing is not None and fc.fused_typing_index(typing[a], typing[b]) != fused_typing: continue
+            d = sum(((cols[c][a] + cols[c][b]) / 2.0 - target[c]) ** 2 * scale[c] ** 2 for c in range(6)) ** 0.5
+            out.append((d, a, b))
+    out.sort()
+    return out[:k]
+
+
+def check(got, want):
+    """Same distances in order; same pairs except where a tie straddles the k-th place."""
+    assert [round(d, 9) for d, _a, _b in got] == [round(d, 9) for d, _a, _b in want]
+    cut = want[-1][0] - 1e-9
+    assert {(a, b) for d, a, b in got if d < cut} == {(a, b) for d, a, b in want if d < cut}
+
+
+@pytest.mark.parametrize('normalize', [False, True])
+def test_matches_brute_force(fc, small_dex, normalize):
+    small_dex(250, 41); rng = random.Random(410)
+    for _ in range(4):
+        target = [rng.randrange(30, 140) for _ in range(6)]
+        check(fc.nearest_fusions(target, 25, normalize), brute_nearest(fc, target, 25, normalize))
+
+
+@pytest.mark.parametrize('normalize', [False, True])
+def test_typing_filter(fc, small_dex, normalize):
+    sub = small_dex(250, 42); rng = random.Random(411)
+    typings = sorted({fc.fused_typing_index(a, b) for a in sub['typing'][:20] for b in sub['typing'][:20]} - {None})
+    for ft in rng.sample(typings, 4):
+        target = [rng.randrange(30, 140) for _ in range(6)]
+        want = brute_nearest(fc, target, 10, normalize, ft)
+        assert want
+        check(fc.nearest_fusions(target, 10, normalize, ft), want)
+
+
+def test_current_pair_excluded(fc, small_dex):
+    sa = small_dex(250, 43); a, b = 17, 151
+    target = [(sa['stats'][a * 6 + c] + sa['stats'][b * 6 + c]) / 2.0 for c in range(6)]
+    assert (0.0, a, b) in fc.nearest_fusions(target, 5)
+    hits = fc.nearest_fusions(target, 5, exclude={(a, b)})
+    assert (a, b) not in {(x, y) for _d, x, y in hits} and (0.0, b, a) in hits
+    check(hits, brute_nearest(fc, target, 5, exclude={(a, b)}))
@@ -0,0 +1,51 @@
+"""pareto_fusions() (skyline over candidate layers) against an O(n^2) dominance check over every pair."""
+import random
+
+import pytest
+
+
+def brute_front(fc, p1=None, fused_typing=None):
+    sa = fc.species_arrays(); st = sa['stats']; typing = sa['typing']; n = len(sa['names'])
+    p1_rows = [sa['row'][p1]] if p1 is not None else range(n)
+    vecs = {(a, b): tuple(st[a * 6 + k] + st[b * 6 + k] for k in range(6))
+            for a in p1_rows for b in range(n) if a != b
+            and (fused_typing is None or fc.fused_typing_index(typing[a], typing[b]) == fused_typing)}
+    items = list(vecs.items())
+    front = {pr for pr, v in items
+             if not any(w != v and all(x >= y for x, y in zip(w, v)) for _q, w in items)}
+    return {(sa['names'][a], sa['names'][b]) for a, b in front}
+
+
+def got_front(fc, p1=None, fused_typing=None):
+    rows = fc.pareto_fusions(p1, fused_typing)
+    assert len(rows) == len({(r[0], r[1]) for r in rows})
+    return {(r[0], r[1]) for r in rows}
+
+
+@pytest.fixture
+def subset(small_dex):
+    """A seeded 70-species dex (the whole-dex front is too large for the quadratic check)."""
+    return small_dex(70, 29)
+
+
+def test_whole_subset(fc, subset):
+    assert got_front(fc) == brute_front(fc)
+
+
+def test_subset_with_typing_filter(fc, subset):
+    counts = {}
+    for a in subset['typing']:
+        for b in subset['typing']:
+            ft = fc.fused_typing_index(a, b); counts[ft] = counts.get(ft, 0) + 1
+    for ft in sorted((t for t in counts if t is not None), key=lambda t: -counts[t])[:6]:
+        front = got_front(fc, fused_typing=ft)
+        assert front and front == brute_front(fc, fused_typing=ft)
+
+
+def test_fixed_p1_whole_dex(fc):
+    names = fc.species_arrays()['names']; rng = random.Random(290)
+    for p1 in rng.sample(names, 3):
+        assert got_front(fc, p1) == brute_front(fc, p1)
+        ta = fc.species_arrays()['typing'][fc.species_arrays()['row'][p1]]
+        ft = fc.fused_typing_index(ta, ta)
+        assert got_front(fc, p1, ft) == brute_front(fc, p1, ft)
@@ -0,0 +1,8 @@
+def test_no_new_weak4_is_relative_to_the_baseline(fc):
+    names = fc.species_arrays()['names']
+    for p1 in ('Tropius', 'Heatran', 'Exeggutor'):
+        for baseline in ('p1', 'p2'):
+            imp = fc.partner_impact(p1, baseline)
+            kept = {r[0] for r in fc.partner_impact_rows(imp, no_new_weak4=True)}
+            expect = {names[b] for b, fused, base in zip(imp['rows'], imp['fused'], imp['base']) if not fused[3] & ~base[3]}
+            assert kept == expect
@@ -0,0 +1,62 @@
+"""fused_percentiles() and fused_stat_histogram() (bisects on the sorted stat index) against a direct count over
+every partner of a fixed species."""
+import random
+
+import pytest
+
+
+def fused_column(fc, fixed, label, side='p1'):
+    """Fused value (tenths) of label for every partner of fixed, keyed by partner name."""
+    out = {}
+    for other in fc.pokemon_stats:
+        if other == fixed: continue
+        f = fc.fuse_pair(fixed, other) if side == 'p1' else fc.fuse_pair(other, fixed)
+        out[other] = f['fused_bst'] if label == 'BST' else f['fusion_stats'][label]
+    return out
+
+
+def mid_rank(values, x):
+    below = sum(v < x for v in values); ties = sum(v == x for v in values)
+    return 100.0 * (below + 0.5 * ties) / len(values)
+
+
+@pytest.fixture(scope='module')
+def cases(fc):
+    """Seeded (P1, P2) pairs; each second pair's P2 shares a base stat with P1 (the fixed species' own tie)."""
+    names = list(fc.pokemon_stats); rng = random.Random(40); out = []
+    for p1 in rng.sample(names, 4):
+        out.append((p1, rng.choice([n for n in names if n != p1])))
+        k = rng.randrange(6); own = fc.pokemon_stats[p1][fc.STAT_KEYS[k]]
+        out.append((p1, rng.choice([n for n in names if n != p1 and fc.pokemon_stats[n][fc.STAT_KEYS[k]] == own])))
+    return out
+
+
+def test_percentiles_match_direct_count(fc, cases):
+    for p1, p2 in cases:
+        got = fc.fused_percentiles(p1, p2)
+        for label in fc.STAT_KEYS + ('BST',):
+            by_p1 = fused_column(fc, p1, label); by_p2 = fused_column(fc, p2, label, side='p2')
+            assert got['p1'][label] == pytest.approx(mid_rank(list(by_p1.values()), by_p1[p2]), abs=1e-9)
+            assert got['p2'][label] == pytest.approx(mid_rank(list(by_p2.values()), by_p2[p1]), abs=1e-9)
+
+
+def test_ties_are_counted_as_half(fc, cases):
+    p1, p2 = cases[1]
+    for label in fc.STAT_KEYS:
+        values = list(fused_column(fc, p1, label).values()); x = fused_column(fc, p1, label)[p2]
+        if values.count(x) > 1:
+            below = sum(v < x for v in values)
+            assert fc.fused_percentiles(p1, p2)['p1'][label] != pytest.approx(100.0 * below / len(values))
+            return
+    pytest.fail('no tied partner value in the sample')
+
+
+@pytest.mark.parametrize('bins', [24, 7, 1])
+def test_histogram_matches_direct_count(fc, cases, bins):
+    for fixed in sorted({p1 for p1, _p2 in cases}):
+        for col, label in enumerate(fc.STAT_KEYS + ('BST',)):
+            values = list(fused_column(fc, fixed, label).values())
+            edges, counts = fc.fused_stat_histogram(fixed, col, bins)
+            assert len(counts) == len(edges) - 1 and edges[0] <= min(values) and max(values) < edges[-1]
+            # half-open bins: a value on an edge belongs to the bin that starts there
+            assert counts == [sum(lo <= v < hi for v in values) for lo, hi in zip(edges, edges[1:])]
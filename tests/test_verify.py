@@ -0,0 +1,86 @@
+"""Streaming verification against the whole-text path it replaced, and the blob-hash result cache."""
+import ast
+
+import pytest
+
+import fusioncalc_verify as fv
+
+
+def old_evidence(raw: bytes) -> dict:
+    """The pre-streaming verify(): decode everything, canonicalize(), compute_hash(), scan for BUILD_TAG."""
+    text = raw.decode('utf-8')
+    canon, header_hash, header_idx = fv.canonicalize(text)
+    comp = fv.compute_hash(canon)
+    buildtag_val = next((m.group(2) for m in map(fv.BUILDTAG_RE.match, fv._normalize(text).split('\n')) if m), None)
+    try:
+        ast.parse(text); ast_ok = True
+    except SyntaxError:
+        ast_ok = False
+    return {'reported_hash': header_hash or None, 'computed_hash': comp, 'header_top': header_idx == 0,
+            'buildtag_present': buildtag_val is not None, 'buildtag_value': buildtag_val,
+            'buildtag_matches': (buildtag_val == comp) if buildtag_val is not None else None,
+            'ast_ok': ast_ok, 'size_bytes': len(raw), 'svh_version': fv.SVH_VERSION}
+
+
+def stamped(body: str) -> str:
+    """body with a matching BUILD_HASH header and BUILD_TAG, like a released build."""
+    comp = fv.compute_hash(fv.canonicalize(body)[0])
+    return f"# BUILD_HASH: {comp}\n" + body.replace('BUILD_TAG = ""', f'BUILD_TAG = "{comp}"')
+
+
+BODY = 'import sys\nBUILD_TAG = ""\nNAME = "Flabébé ♀ 🐟"\n\n\ndef f(x):\n    return x  # tab\there\n'
+SAMPLES = {
+    'lf': stamped(BODY),
+    'crlf': stamped(BODY).replace('\n', '\r\n'),
+    'cr': stamped(BODY).replace('\n', '\r'),
+    'mixed': stamped(BODY).replace('\n', '\r\n', 2),
+    'bom': '\ufeff' + stamped(BODY),
+    'no final newline': stamped(BODY.rstrip('\n')),
+    'crlf, no final newline': stamped(BODY.rstrip('\n')).replace('\n', '\r\n'),
+    'trailing cr': stamped(BODY) + '\r',
+    'stale hash': stamped(BODY).replace('return x', 'return -x'),
+    'syntax error': stamped(BODY + 'def (\n'),
+    'no header': BODY,
+    'empty': '',
+}
+
+
+def chunked(raw: bytes, size: int):
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+@pytest.mark.parametrize('name', SAMPLES)
+@pytest.mark.parametrize('size', [1, 2, 3, 7, fv.CHUNK_SIZE])
+def test_stream_matches_old_path(name, size):
+    raw = SAMPLES[name].encode('utf-8')
+    assert ''.join(fv.normalized_lines(chunked(raw, size))) == fv._normalize(raw.decode('utf-8'))
+    ok, ev = fv.verify_stream(chunked(raw, size))
+    ev.pop('duration_ms'); want = old_evidence(raw)
+    assert ev == want
+    assert ok == (want['header_top'] and want['reported_hash'] == want['computed_hash'] and want['ast_ok']
+                  and want['buildtag_matches'] is not False)
+
+
+def test_stamped_samples_verify():
+    for name in ('lf', 'crlf', 'cr', 'mixed', 'no final newline', 'crlf, no final newline'):
+        assert fv.verify_stream([SAMPLES[name].encode('utf-8')])[0], name
+    assert not fv.verify_stream([SAMPLES['stale hash'].encode('utf-8')])[0]
+
+
+def test_batch_second_run_is_cached(tmp_path):
+    paths = []
+    for name in ('lf', 'crlf', 'stale hash', 'no header'):
+        p = tmp_path / f"{name.replace(' ', '_')}.py"; p.write_bytes(SAMPLES[name].encode('utf-8')); paths.append(str(p))
+    dup = tmp_path / 'copy.py'; dup.write_bytes(SAMPLES['lf'].encode('utf-8')); paths.append(str(dup))
+    cache = str(tmp_path / 'cache.json')
+    first = fv.verify_batch(paths, jobs=1, cache_path=cache)
+    assert first['verified'] == 4 and first['cache_hits'] == 1 and first['failed'] == 2
+    second = fv.verify_batch(paths, jobs=1, cache_path=cache)
+    assert second['verified'] == 0 and second['cache_hits'] == second['count'] == 5
+    assert all(r['cached'] and r['evidence']['duration_ms'] == 0.0 for r in second['results'])
+    strip = lambda rep: [(r['target'], r['blob'], r['ok'], {k: v for k, v in r['evidence'].items() if k != 'duration_ms'})
+                         for r in rep['results']]
+    assert strip(second) == strip(first)
+    for p in paths:
+        ok, ev = fv.verify(p)
+        assert [r for r in second['results'] if r['target'] == p][0]['ok'] == ok